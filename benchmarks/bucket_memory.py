@@ -0,0 +1,102 @@
+"""Measure the memory used by the rate limits of a bot in very many guilds.
+
+Sends a synthetic workload through a ClientRateLimits without a network: one
+request to each of ``--buckets`` buckets, spread over ``--routes`` routes with
+a major parameter each, as a bot in as many guilds would. This is done with
+eviction turned off, with buckets dropped once idle for ``--idle-timeout``
+seconds, and with at most ``--max-buckets`` buckets, reporting the memory held
+(traced with tracemalloc, which slows everything down) and how long a route
+changing its bucket hash takes.
+
+    python benchmarks/bucket_memory.py --buckets 1000000 --routes 1000
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord_limits.rate_limits import ClientRateLimits
+
+
+async def run(
+    args: argparse.Namespace,
+    name: str,
+    idle_timeout: float,
+    max_buckets: Optional[int],
+):
+    gc.collect()
+    tracemalloc.start()
+    rate_limits = ClientRateLimits(
+        max_buckets=max_buckets, bucket_idle_timeout=idle_timeout
+    )
+    headers = {
+        "X-RateLimit-Limit": "5",
+        "X-RateLimit-Remaining": "4",
+        "X-RateLimit-Reset-After": str(args.reset_after),
+    }
+    routes = [f"GET /guilds/{{guild_id}}/route{i}" for i in range(args.routes)]
+
+    started = time.perf_counter()
+    for i in range(args.buckets):
+        route = routes[i % args.routes]
+        major = str(i // args.routes)
+        headers["X-RateLimit-Bucket"] = f"hash{i % args.routes}"
+        bucket_handler = rate_limits.get_bucket(route, major)
+        if bucket_handler is not None:
+            await bucket_handler.acquire(0, None)
+        bucket_handler = rate_limits.update_from_headers(
+            headers, route, major, bucket_handler, 200
+        )
+        bucket_handler.release()  # type: ignore
+    elapsed = time.perf_counter() - started
+
+    remap_started = time.perf_counter()
+    rate_limits.update_bucket_relations("hash0", "new_hash")
+    remapped = time.perf_counter() - remap_started
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:14} {len(rate_limits.buckets):9} {current / 2**20:9.1f} "
+        f"{peak / 2**20:9.1f} {elapsed / args.buckets * 1e6:9.1f} {remapped * 1000:9.2f}"
+    )
+
+
+async def main(args: argparse.Namespace):
+    print(
+        f"{args.buckets} buckets over {args.routes} routes, resetting after {args.reset_after}s"
+    )
+    print(
+        f"{'eviction':14} {'buckets':>9} {'MiB held':>9} {'MiB peak':>9} "
+        f"{'us/req':>9} {'remap ms':>9}"
+    )
+    await run(args, "none", float("inf"), None)
+    await run(args, "idle timeout", args.idle_timeout, None)
+    await run(args, "max buckets", float("inf"), args.max_buckets)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--buckets", type=int, default=1_000_000)
+    parser.add_argument("--routes", type=int, default=1000)
+    parser.add_argument(
+        "--reset-after",
+        type=float,
+        default=0.01,
+        help="seconds until a bucket resets after its request",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=1,
+        help="seconds after which an idle bucket is dropped",
+    )
+    parser.add_argument("--max-buckets", type=int, default=10_000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,75 @@
+"""Send a burst of concurrent requests to one bucket and count the 429s.
+
+Runs a fake Discord API in this process whose buckets allow ``--limit``
+requests per ``--period`` seconds, then sends ``--requests`` concurrent
+requests to the same bucket with a DiscordClient. The client reserves its
+place in the bucket before sending, so it is expected to get no 429s and to
+take about ``requests / limit * period`` seconds.
+
+    python benchmarks/bucket_stress.py --requests 200 --limit 5 --period 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_discord import FakeDiscord
+
+from discord_limits import DiscordClient, RequestCoalescer
+from discord_limits.rate_limits import PriorityLimiter
+
+
+async def main(args: argparse.Namespace):
+    fake = FakeDiscord(limit=args.limit, period=args.period, latency=args.latency)
+    base = await fake.start(args.port)
+
+    # Identical GET requests would be coalesced into one, so send each of them.
+    async with DiscordClient(
+        "token",
+        max_attempts=args.requests,
+        coalescer=RequestCoalescer(enabled=False),
+    ) as client:
+        client._base_url = base
+        # Only the bucket is under test, not the global rate limit.
+        client.rate_limits.global_limiter = PriorityLimiter(1_000_000)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(client.channel.get_channel(1) for _ in range(args.requests)),
+            return_exceptions=True,
+        )
+        elapsed = time.perf_counter() - started
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    expected = max(args.requests / args.limit - 1, 0) * args.period
+    print(
+        f"{args.requests} concurrent requests to a bucket of {args.limit} per {args.period}s"
+    )
+    print(f"took {elapsed:.2f}s (at least {expected:.2f}s at the limit)")
+    print(
+        f"{fake.ok} answered, {fake.rate_limited} 429s, {len(errors)} errors "
+        f"{sorted({type(e).__name__ for e in errors})}"
+    )
+    await fake.stop()
+    if fake.rate_limited:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument(
+        "--limit", type=int, default=5, help="requests per bucket per period"
+    )
+    parser.add_argument(
+        "--period", type=float, default=1, help="bucket period in seconds"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="response latency in seconds"
+    )
+    parser.add_argument("--port", type=int, default=18095)
+    asyncio.run(main(parser.parse_args()))
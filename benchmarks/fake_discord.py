@@ -0,0 +1,136 @@
+"""A local fake of the Discord REST API, for the benchmarks.
+
+Every path is its own bucket of ``limit`` requests per ``period`` seconds, with
+the same rate limit headers as Discord (paths which only differ by their IDs
+share a bucket hash, like a route with different major parameters). There can also be a global limit across
+every path, a token bucket of ``global_limit`` requests per second like the
+client's, which interaction responses are exempt from. Requests over a limit are answered with a 429, and counted so
+benchmarks can check none were sent.
+"""
+
+import asyncio
+import re
+import time
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+_ID = re.compile(r"\d+")
+
+
+class FakeDiscord:
+    """A fake Discord REST API.
+
+    Parameters
+    ----------
+    limit : int, optional
+        The number of requests allowed per bucket per period, by default 5
+    period : float, optional
+        The length (in seconds) of a bucket's window, by default 1
+    latency : float, optional
+        How long (in seconds) every response takes, by default 0.02
+    body_size : int, optional
+        The size (in bytes) of the padding added to every response body, by default 0
+    global_limit : int, optional
+        The number of requests allowed per second across every path, by default None (no limit)
+    """
+
+    def __init__(
+        self,
+        limit: int = 5,
+        period: float = 1,
+        latency: float = 0.02,
+        body_size: int = 0,
+        global_limit: Optional[int] = None,
+    ):
+        self.limit = limit
+        self.period = period
+        self.latency = latency
+        self.padding = "x" * body_size
+        self.global_limit = global_limit
+        self.requests = 0
+        self.ok = 0
+        self.rate_limited = 0  # Including the global 429s
+        self.global_rate_limited = 0
+        self._windows: Dict[str, List[float]] = {}  # {path: [start, count]}
+        self._global_tokens = float(global_limit or 0)
+        self._global_refilled_at = time.monotonic()
+        self._runner = None
+
+    def reset_counters(self):
+        self.requests = self.ok = self.rate_limited = self.global_rate_limited = 0
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        await request.read()
+        await asyncio.sleep(self.latency)
+        self.requests += 1
+
+        now = time.monotonic()
+        if self.global_limit is not None and "/interactions/" not in request.path:
+            self._global_tokens = min(
+                float(self.global_limit),
+                self._global_tokens
+                + (now - self._global_refilled_at) * self.global_limit,
+            )
+            self._global_refilled_at = now
+            if self._global_tokens >= 1:
+                self._global_tokens -= 1
+            else:
+                self.rate_limited += 1
+                self.global_rate_limited += 1
+                retry_after = (1 - self._global_tokens) / self.global_limit
+                return web.json_response(
+                    {
+                        "message": "You are being rate limited.",
+                        "retry_after": retry_after,
+                        "global": True,
+                    },
+                    status=429,
+                    headers={
+                        "X-RateLimit-Global": "true",
+                        "X-RateLimit-Scope": "global",
+                        "Retry-After": f"{retry_after:.3f}",
+                    },
+                )
+
+        window = self._windows.get(request.path)
+        if window is None or now >= window[0] + self.period:
+            window = self._windows[request.path] = [now, 0]
+        window[1] += 1
+        reset_after = window[0] + self.period - now
+        headers = {
+            "X-RateLimit-Bucket": _ID.sub("{id}", request.path),
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(self.limit - window[1], 0)),
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+        }
+        if window[1] > self.limit:
+            self.rate_limited += 1
+            headers["X-RateLimit-Scope"] = "user"
+            return web.json_response(
+                {
+                    "message": "You are being rate limited.",
+                    "retry_after": reset_after,
+                    "global": False,
+                },
+                status=429,
+                headers=headers,
+            )
+        self.ok += 1
+        return web.json_response(
+            {"id": "1", "path": request.path, "padding": self.padding}, headers=headers
+        )
+
+    async def start(self, port: int) -> str:
+        """Start serving on 127.0.0.1, and return the base URL of the API."""
+        app = web.Application(client_max_size=0)
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", port).start()
+        return f"http://127.0.0.1:{port}/api/v10"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
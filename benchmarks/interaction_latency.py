@@ -0,0 +1,135 @@
+"""Measure the latency of interaction handlers while a bulk job saturates the client.
+
+Runs a fake Discord API in this process with a global limit of
+``--global-limit`` requests per second, then starts a bulk job adding a role to
+``--bulk`` members at once. While the bulk job waits for the global limit, an
+interaction is received every ``--interval`` seconds. Its handler defers the
+response, which isn't global rate limited, then sends a message to the channel,
+which waits behind the bulk job. Discord wants interactions handled within 3
+seconds.
+
+This is done twice: once with every request at the default priority, and once
+with the bulk job at LOW_PRIORITY and the interactions at HIGH_PRIORITY, which
+are expected to be handled within 3 seconds.
+
+    python benchmarks/interaction_latency.py --bulk 500 --interactions 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_discord import FakeDiscord
+
+from discord_limits import HIGH_PRIORITY, LOW_PRIORITY, DiscordClient, priority
+
+DEADLINE = 3
+
+
+def percentiles(latencies: List[float]) -> str:
+    latencies = sorted(latencies)
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    return f"{statistics.median(latencies) * 1000:8.0f} {p99 * 1000:8.0f}"
+
+
+async def run(args: argparse.Namespace, fake: FakeDiscord, base: str, lanes: bool):
+    bulk_priority, interaction_priority = (
+        (LOW_PRIORITY, HIGH_PRIORITY) if lanes else (0, 0)
+    )
+    deferred: List[float] = []
+    handled: List[float] = []
+
+    async with DiscordClient(
+        "token", global_rate_limit=args.global_limit, max_attempts=10
+    ) as client:
+        client._base_url = base
+
+        async def add_role(member_id: int):
+            with priority(bulk_priority):
+                await client.guild.add_role(1, member_id, 2)
+
+        async def handle_interaction(interaction_id: int):
+            received = time.perf_counter()
+            with priority(interaction_priority):
+                await client.interactions.create_interaction_response(
+                    interaction_id, "token", 5
+                )
+                deferred.append(time.perf_counter() - received)
+                await client.channel.create_message(3, "Done")
+                handled.append(time.perf_counter() - received)
+
+        started = time.perf_counter()
+        bulk = asyncio.gather(
+            *(add_role(member_id) for member_id in range(args.bulk)),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(args.interval)  # Let the bulk job fill the queue
+        handlers = []
+        for interaction_id in range(args.interactions):
+            handlers.append(asyncio.ensure_future(handle_interaction(interaction_id)))
+            await asyncio.sleep(args.interval)
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await bulk
+        elapsed = time.perf_counter() - started
+
+    late = sum(latency > DEADLINE for latency in handled)
+    name = "priorities" if lanes else "default"
+    print(
+        f"{name:10} {percentiles(deferred)} {percentiles(handled)} {late:6} "
+        f"{elapsed:8.2f} {fake.rate_limited:6}"
+    )
+    fake.reset_counters()
+    return late + args.interactions - len(handled)
+
+
+async def main(args: argparse.Namespace):
+    fake = FakeDiscord(
+        limit=args.bulk + args.interactions,
+        latency=args.latency,
+        global_limit=args.global_limit,
+    )
+    base = await fake.start(args.port)
+
+    print(
+        f"{args.bulk} bulk requests and {args.interactions} interactions every "
+        f"{args.interval}s, global limit {args.global_limit}/s"
+    )
+    print(
+        f"{'priority':10} {'defer':>8} {'ms':8} {'handled':>8} {'ms':8} {'late':>6} "
+        f"{'seconds':>8} {'429s':>6}"
+    )
+    print(f"{'':10} {'p50':>8} {'p99':>8} {'p50':>8} {'p99':>8}")
+    await run(args, fake, base, lanes=False)
+    await asyncio.sleep(1.1)  # Let the global limit refill
+    late = await run(args, fake, base, lanes=True)
+    await fake.stop()
+    if late:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--bulk", type=int, default=300, help="roles added by the bulk job"
+    )
+    parser.add_argument("--interactions", type=int, default=30)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.1,
+        help="seconds between interactions",
+    )
+    parser.add_argument(
+        "--global-limit", type=int, default=50, help="requests per second in total"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="response latency in seconds"
+    )
+    parser.add_argument("--port", type=int, default=18105)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,163 @@
+"""Check that a rate limited client doesn't slow down other clients in the same process.
+
+Runs a fake Discord API in this process, then sends ``--requests`` requests
+with each of ``--clients`` clients, every one with its own token. This is done
+twice: once alone, and once while another client sends requests which are all
+answered with a global 429 for ``--retry-after`` seconds. Every client has its
+own rate limits, so the others are expected to be just as fast.
+
+    python benchmarks/multi_client.py --clients 8 --requests 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_discord import FakeDiscord
+
+from discord_limits import DiscordClient, RequestCoalescer
+
+NOISY_TOKEN = "noisy"
+
+
+class NoisyFakeDiscord(FakeDiscord):
+    """A fake Discord API which rate limits every request of one token."""
+
+    def __init__(self, retry_after: float, **kwargs):
+        super().__init__(**kwargs)
+        self.retry_after = retry_after
+        self.noisy_rate_limited = 0
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        if NOISY_TOKEN not in request.headers.get("Authorization", ""):
+            return await super()._handle(request)
+        self.noisy_rate_limited += 1
+        return web.json_response(
+            {
+                "message": "You are being rate limited.",
+                "retry_after": self.retry_after,
+                "global": True,
+            },
+            status=429,
+            headers={
+                "X-RateLimit-Global": "true",
+                "X-RateLimit-Scope": "global",
+                "Retry-After": str(self.retry_after),
+            },
+        )
+
+
+async def send_requests(
+    client: DiscordClient, requests: int, concurrency: int, latencies: List[float]
+):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await client.channel.get_channel(i % 10)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+
+
+async def keep_rate_limited(client: DiscordClient, concurrency: int):
+    while True:
+        await asyncio.gather(
+            *(client.channel.get_channel(i) for i in range(concurrency)),
+            return_exceptions=True,
+        )
+
+
+async def run(args: argparse.Namespace, fake: NoisyFakeDiscord, base: str, noisy: bool):
+    clients = [
+        # Identical GET requests would be coalesced into one, so send each of them.
+        DiscordClient(f"token{i}", coalescer=RequestCoalescer(enabled=False))
+        for i in range(args.clients)
+    ]
+    noisy_client = DiscordClient(NOISY_TOKEN, max_attempts=2)
+    for client in (*clients, noisy_client):
+        client._base_url = base
+
+    noise = None
+    if noisy:
+        noise = asyncio.ensure_future(keep_rate_limited(noisy_client, args.concurrency))
+        await asyncio.sleep(0.1)  # Until the noisy client is rate limited
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            send_requests(client, args.requests, args.concurrency, latencies)
+            for client in clients
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    if noise is not None:
+        noise.cancel()
+    for client in (*clients, noisy_client):
+        await client.close()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    name = "with 429s" if noisy else "alone"
+    print(
+        f"{name:10} {len(latencies) / elapsed:8.1f} {statistics.median(latencies) * 1000:8.1f} "
+        f"{p99 * 1000:8.1f} {latencies[-1] * 1000:8.1f} {fake.rate_limited:6} "
+        f"{fake.noisy_rate_limited:11}"
+    )
+    fake.reset_counters()
+    fake.noisy_rate_limited = 0
+    return latencies[-1]
+
+
+async def main(args: argparse.Namespace):
+    fake = NoisyFakeDiscord(
+        args.retry_after, limit=args.clients * args.requests, latency=args.latency
+    )
+    base = await fake.start(args.port)
+
+    print(
+        f"{args.clients} clients x {args.requests} requests, another client rate "
+        f"limited for {args.retry_after}s at a time"
+    )
+    print(
+        f"{'run':10} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+        f"{'429s':>6} {'noisy 429s':>11}"
+    )
+    await run(args, fake, base, noisy=False)
+    slowest = await run(args, fake, base, noisy=True)
+    await fake.stop()
+    if slowest >= args.retry_after:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument(
+        "--requests", type=int, default=200, help="requests sent by each client"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="requests in flight per client"
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=1,
+        help="seconds the rate limited client is told to wait",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="response latency in seconds"
+    )
+    parser.add_argument("--port", type=int, default=18115)
+    asyncio.run(main(parser.parse_args()))
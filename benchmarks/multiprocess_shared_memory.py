@@ -0,0 +1,168 @@
+"""Measure the aggregate throughput and 429s of several processes sharing one token.
+
+Runs a fake Discord API in this process, with buckets of ``--limit`` requests
+per second and a global limit of ``--global-limit`` requests per second, then
+starts ``--processes`` worker processes which each send ``--requests``
+requests spread over ``--buckets`` channels. This is done twice: once with a
+separate rate limiter in every process, and once with every process sharing a
+SharedMemoryBackend. Only the shared backend is expected to send no bucket 429s.
+
+The processes start from the same rate limit cache, as the processes of a bot
+would. With ``--cold`` each one learns the route itself, sending one request
+the others don't count. The client and the fake API count the global limit from
+when requests are sent and received, so a global 429 or two can happen either way.
+
+    python benchmarks/multiprocess_shared_memory.py --processes 16 --requests 50
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_discord import FakeDiscord
+
+from discord_limits import DiscordClient, RequestCoalescer, SharedMemoryBackend
+
+
+async def send_requests(
+    base: str,
+    backend_name: Optional[str],
+    cache: Optional[str],
+    requests: int,
+    buckets: int,
+    rate: int,
+):
+    backend = SharedMemoryBackend(backend_name) if backend_name is not None else None
+    # Identical GET requests would be coalesced into one, so send each of them.
+    async with DiscordClient(
+        "token",
+        global_rate_limit=rate,
+        rate_limit_backend=backend,
+        max_attempts=requests,
+        coalescer=RequestCoalescer(enabled=False),
+    ) as client:
+        client._base_url = base
+        if cache is not None:
+            client.rate_limits.load(cache)  # Not saved back by every process
+        await asyncio.gather(
+            *(client.channel.get_channel(i % buckets) for i in range(requests)),
+            return_exceptions=True,
+        )
+    if backend is not None:
+        backend.close()
+
+
+def worker(ready, *args):
+    ready.wait()  # Start once every process has been spawned
+    asyncio.run(send_requests(*args))
+
+
+async def run(
+    args: argparse.Namespace,
+    fake: FakeDiscord,
+    base: str,
+    cache: Optional[str],
+    shared: bool,
+):
+    backend_name = None
+    if shared:
+        backend_name = f"benchmark_{os.getpid()}"
+        SharedMemoryBackend(backend_name).unlink()  # Start from an empty state
+
+    context = multiprocessing.get_context("spawn")
+    ready = context.Barrier(args.processes + 1)
+    processes = [
+        context.Process(
+            target=worker,
+            args=(
+                ready,
+                base,
+                backend_name,
+                cache,
+                args.requests,
+                args.buckets,
+                args.global_limit,
+            ),
+        )
+        for _ in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    # Let every bucket and the global limit reset while the processes start.
+    await asyncio.sleep(1.1)
+    fake._windows.clear()
+    fake.reset_counters()
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, ready.wait)
+    started = time.perf_counter()
+    for process in processes:
+        await loop.run_in_executor(None, process.join)
+    elapsed = time.perf_counter() - started
+
+    if shared:
+        SharedMemoryBackend(backend_name).unlink()  # type: ignore
+    name = "shared memory" if shared else "per process"
+    print(
+        f"{name:14} {elapsed:8.2f} {fake.ok / elapsed:8.1f} {fake.ok:6} "
+        f"{fake.rate_limited - fake.global_rate_limited:10} {fake.global_rate_limited:10}"
+    )
+
+
+async def main(args: argparse.Namespace):
+    fake = FakeDiscord(
+        limit=args.limit, latency=args.latency, global_limit=args.global_limit
+    )
+    base = await fake.start(args.port)
+
+    print(
+        f"{args.processes} processes x {args.requests} requests to {args.buckets} buckets "
+        f"of {args.limit}/s, global limit {args.global_limit}/s"
+    )
+    print(
+        f"{'backend':14} {'seconds':>8} {'req/s':>8} {'ok':>6} {'bucket 429':>10} {'global 429':>10}"
+    )
+    cache = None
+    if not args.cold:
+        cache = os.path.join(tempfile.mkdtemp(), "rate_limits.json")
+        async with DiscordClient("token", rate_limit_cache=cache) as client:
+            client._base_url = base
+            await client.channel.get_channel(0)
+
+    await run(args, fake, base, cache, shared=False)
+    await run(args, fake, base, cache, shared=True)
+    await fake.stop()
+    if fake.rate_limited - fake.global_rate_limited:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument(
+        "--requests", type=int, default=50, help="requests sent by each process"
+    )
+    parser.add_argument("--buckets", type=int, default=10)
+    parser.add_argument(
+        "--limit", type=int, default=10, help="requests per second per bucket"
+    )
+    parser.add_argument(
+        "--global-limit", type=int, default=50, help="requests per second in total"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="response latency in seconds"
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="start every process without the learned routes",
+    )
+    parser.add_argument("--port", type=int, default=18100)
+    asyncio.run(main(parser.parse_args()))
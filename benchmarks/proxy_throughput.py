@@ -0,0 +1,105 @@
+"""Measure the throughput and latency of the rate limiting proxy.
+
+Runs a fake Discord API and the proxy in this process, then sends the same
+requests at increasing concurrency directly to the fake API and through the
+proxy. The fake API allows ``--limit`` requests per second per bucket, so the
+proxy is expected to send no 429s.
+
+    python benchmarks/proxy_throughput.py --requests 4000 --buckets 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from aiohttp import ClientSession, TCPConnector, web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_discord import FakeDiscord
+
+from discord_limits.proxy import RateLimitProxy
+
+
+async def run(
+    session: ClientSession, base: str, requests: int, buckets: int, concurrency: int
+):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    statuses = {}
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            async with session.get(
+                f"{base}/channels/{i % buckets}", headers={"Authorization": "Bot token"}
+            ) as r:
+                await r.read()
+                statuses[r.status] = statuses.get(r.status, 0) + 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return (
+        requests / elapsed,
+        statistics.median(latencies) * 1000,
+        latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        statuses,
+    )
+
+
+async def main(args: argparse.Namespace):
+    fake = FakeDiscord(limit=args.limit, latency=args.latency)
+    direct = await fake.start(args.port)
+
+    proxy = RateLimitProxy(
+        f"http://127.0.0.1:{args.port}", global_rate_limit=args.global_rate_limit
+    )
+    runner = web.AppRunner(proxy.make_app())
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", args.port + 1).start()
+    proxied = f"http://127.0.0.1:{args.port + 1}/api/v10"
+
+    print(
+        f"{args.requests} requests to {args.buckets} buckets of {args.limit}/s, "
+        f"{args.latency * 1000:.0f}ms upstream latency"
+    )
+    print(
+        f"{'target':8} {'concurrency':>11} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} statuses"
+    )
+    async with ClientSession(connector=TCPConnector(limit=0)) as session:
+        for concurrency in args.concurrency:
+            for name, base in (("direct", direct), ("proxy", proxied)):
+                fake._windows.clear()
+                rate, p50, p99, statuses = await run(
+                    session, base, args.requests, args.buckets, concurrency
+                )
+                print(
+                    f"{name:8} {concurrency:11} {rate:8.0f} {p50:8.1f} {p99:8.1f} {statuses}"
+                )
+                # Let every bucket reset before the next run.
+                await asyncio.sleep(1.1)
+
+    await runner.cleanup()
+    await fake.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--buckets", type=int, default=50)
+    parser.add_argument(
+        "--limit", type=int, default=1000, help="requests per second per bucket"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.005, help="upstream latency in seconds"
+    )
+    parser.add_argument("--global-rate-limit", type=int, default=1_000_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--port", type=int, default=18090)
+    asyncio.run(main(parser.parse_args()))
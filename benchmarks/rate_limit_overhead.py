@@ -0,0 +1,91 @@
+"""Microbenchmarks of the per-request overhead of the rate limiter.
+
+Times each step a request takes through ClientRateLimits without any network
+I/O: resolving the route, looking up the bucket, reading the rate limit headers
+of a response (with as many headers as a real Discord response), and the whole
+reserve, global limit and release path.
+
+    python benchmarks/rate_limit_overhead.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import timeit
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord_limits.rate_limits import ClientRateLimits, get_route
+
+HEADERS = CIMultiDictProxy(
+    CIMultiDict(
+        {
+            "Date": "Sat, 17 Oct 2026 12:00:00 GMT",
+            "Content-Type": "application/json",
+            "Content-Length": "100",
+            "Connection": "keep-alive",
+            "Set-Cookie": "__dcfduid=0; Path=/; HttpOnly",
+            "Strict-Transport-Security": "max-age=31536000",
+            "Via": "1.1 google",
+            "Cf-Cache-Status": "DYNAMIC",
+            "Server": "cloudflare",
+            "Cf-Ray": "0000000000000000-AMS",
+            "X-RateLimit-Bucket": "abcd1234",
+            "X-RateLimit-Limit": "5",
+            "X-RateLimit-Remaining": "4",
+            "X-RateLimit-Reset": "1792238405.000",
+            "X-RateLimit-Reset-After": "5.000",
+        }
+    )
+)
+
+
+def bench(name: str, func, number: int):
+    per_call = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:32} {per_call * 1e6:8.2f} us")
+
+
+async def limiter_path(rate_limits: ClientRateLimits, route: str, major: str, n: int):
+    for _ in range(n):
+        bucket_handler = await rate_limits.get_bucket_or_probe(route, major)
+        await bucket_handler.acquire()  # type: ignore
+        await rate_limits.acquire_global(route)
+        bucket_handler.release()  # type: ignore
+        bucket_handler.remaining = 4  # type: ignore # Keep the bucket open
+
+
+def main(args: argparse.Namespace):
+    rate_limits = ClientRateLimits(global_rate_limit=1_000_000_000)
+    path = "/channels/123456789012345678/messages/123456789012345679"
+    route, major = get_route("GET", path)
+    bucket_handler = rate_limits.get_bucket(route, major)
+    rate_limits.update_from_headers(HEADERS, route, major, bucket_handler)
+
+    bench("get_route", lambda: get_route("GET", path), args.number)
+    bench("get_bucket", lambda: rate_limits.get_bucket(route, major), args.number)
+    bench(
+        "update_from_headers",
+        lambda: rate_limits.update_from_headers(HEADERS, route, major, bucket_handler),
+        args.number,
+    )
+
+    async def run():
+        await limiter_path(rate_limits, route, major, 1000)  # Warm up
+        started = time.perf_counter()
+        await limiter_path(rate_limits, route, major, args.number)
+        return (time.perf_counter() - started) / args.number
+
+    per_call = asyncio.run(run())
+    print(f"{'reserve + global + release':32} {per_call * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--number", type=int, default=100_000, help="calls timed per benchmark"
+    )
+    main(parser.parse_args())
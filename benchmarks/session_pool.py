@@ -0,0 +1,84 @@
+"""Compare the pooled HTTP session with opening a new session for every request.
+
+Runs a fake Discord API in this process, without rate limits or latency, then
+sends ``--requests`` requests at increasing concurrency with a DiscordClient,
+once opening a new aiohttp ClientSession (and connection) for every request as
+the client used to, and once with its pooled session. Against discord.com a new
+connection also costs a TLS handshake, so the difference is larger there.
+
+    python benchmarks/session_pool.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from aiohttp import ClientSession
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_discord import FakeDiscord
+
+from discord_limits import DiscordClient, DiscordResponse, RequestCoalescer
+from discord_limits.rate_limits import PriorityLimiter
+
+
+class SessionPerRequestClient(DiscordClient):
+    """A DiscordClient which opens a new session for every request."""
+
+    async def _send(self, method: str, url: str, **kwargs) -> DiscordResponse:
+        async with ClientSession() as session:
+            async with session.request(method, url, **kwargs) as r:
+                return DiscordResponse(r.status, r.headers, await r.read())
+
+
+async def run(client: DiscordClient, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await client.channel.get_channel(i)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    return requests / elapsed, statistics.median(latencies) * 1000
+
+
+async def main(args: argparse.Namespace):
+    fake = FakeDiscord(limit=args.requests, latency=0)
+    base = await fake.start(args.port)
+
+    print(f"{args.requests} requests to a local fake API")
+    print(f"{'session':12} {'concurrency':>11} {'req/s':>8} {'p50 ms':>8}")
+    for name, client_class in (
+        ("per request", SessionPerRequestClient),
+        ("pooled", DiscordClient),
+    ):
+        for concurrency in args.concurrency:
+            # Identical GET requests would be coalesced into one, so send each of them.
+            async with client_class(
+                "token", coalescer=RequestCoalescer(enabled=False)
+            ) as client:
+                client._base_url = base
+                # Only the HTTP session is under test, not the global rate limit.
+                client.rate_limits.global_limiter = PriorityLimiter(1_000_000)
+                rate, p50 = await run(client, args.requests, concurrency)
+            print(f"{name:12} {concurrency:11} {rate:8.0f} {p50:8.2f}")
+    await fake.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 10, 50], metavar="N"
+    )
+    parser.add_argument("--port", type=int, default=18110)
+    asyncio.run(main(parser.parse_args()))
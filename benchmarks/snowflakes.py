@@ -0,0 +1,99 @@
+"""Compare the batch snowflake helpers with converting one ID at a time.
+
+Generates ``--ids`` message IDs from the last ``--days`` days, as a list of
+ints like those parsed from the API, then times the batch helpers (including
+converting the list to an array) against the per-ID path with
+:func:`snowflake_time`: getting the creation times, splitting the IDs older
+than 14 days from the others, and sorting them. ``--no-numpy`` times the
+array.array fallback used when NumPy isn't installed.
+
+    python benchmarks/snowflakes.py --ids 1000000
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord_limits import helpers
+from discord_limits.helpers import (
+    snowflake_time,
+    snowflake_timestamps,
+    sort_snowflakes,
+    split_snowflakes_by_age,
+    time_snowflake,
+)
+
+
+def best_of(repeat: int, function: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(args: argparse.Namespace):
+    if args.no_numpy:
+        helpers.np = None
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    low = time_snowflake(now - datetime.timedelta(days=args.days))
+    high = time_snowflake(now)
+    rng = random.Random(0)
+    ids = [rng.randrange(low, high) for _ in range(args.ids)]
+    cutoff = now - datetime.timedelta(days=14)
+
+    def per_id_split():
+        young, old = [], []
+        for id in ids:
+            (young if snowflake_time(id) > cutoff else old).append(id)
+        return young, old
+
+    cases = [
+        (
+            "timestamps",
+            lambda: [snowflake_time(id) for id in ids],
+            lambda: snowflake_timestamps(ids),
+        ),
+        ("split by age", per_id_split, lambda: split_snowflakes_by_age(ids, now=now)),
+        (
+            "sort",
+            lambda: sorted(ids, key=snowflake_time),
+            lambda: sort_snowflakes(ids),
+        ),
+    ]
+
+    backend = "array.array" if helpers.np is None else "numpy"
+    print(
+        f"{args.ids} IDs from the last {args.days} days, batch helpers using {backend}"
+    )
+    print(f"{'operation':14} {'per ID ms':>10} {'batch ms':>10} {'speedup':>8}")
+    for name, per_id, batch in cases:
+        per_id_time = best_of(args.repeat, per_id)
+        batch_time = best_of(args.repeat, batch)
+        print(
+            f"{name:14} {per_id_time * 1000:10.1f} {batch_time * 1000:10.1f} "
+            f"{per_id_time / batch_time:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ids", type=int, default=1_000_000)
+    parser.add_argument(
+        "--days", type=int, default=30, help="how old the oldest ID can be"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs of each operation, the best is kept"
+    )
+    parser.add_argument(
+        "--no-numpy", action="store_true", help="time the array.array fallback"
+    )
+    main(parser.parse_args())
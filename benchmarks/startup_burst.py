@@ -0,0 +1,101 @@
+"""Send a burst of requests to a route the client hasn't seen yet and count the 429s.
+
+Runs a fake Discord API in this process whose buckets allow ``--limit``
+requests per second, then sends ``--requests`` concurrent requests spread over
+``--channels`` channels of the same route with a new DiscordClient, as a bot
+does when it starts. This is done twice: once sending every request to the
+unknown route at once, as the client used to, and once letting a single request
+learn the route's bucket first, which is expected to send no 429s.
+
+    python benchmarks/startup_burst.py --requests 500 --channels 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_discord import FakeDiscord
+
+from discord_limits import DiscordClient, RequestCoalescer
+from discord_limits.rate_limits import (
+    BucketHandler,
+    ClientRateLimits,
+    PriorityLimiter,
+)
+
+
+class UnprobedRateLimits(ClientRateLimits):
+    """Rate limits which send every request to an unknown route at once."""
+
+    async def get_bucket_or_probe(
+        self, route: str, major: str, deadline: Optional[float] = None
+    ) -> Optional[BucketHandler]:
+        return self.get_bucket(route, major)
+
+
+async def run(args: argparse.Namespace, fake: FakeDiscord, base: str, probe: bool):
+    # Identical GET requests would be coalesced into one, so send each of them.
+    async with DiscordClient(
+        "token",
+        max_attempts=args.requests,
+        coalescer=RequestCoalescer(enabled=False),
+    ) as client:
+        client._base_url = base
+        if not probe:
+            client.rate_limits = UnprobedRateLimits()
+        # Only the buckets are under test, not the global rate limit.
+        client.rate_limits.global_limiter = PriorityLimiter(1_000_000)
+
+        # Channels which haven't been used yet by the fake API either.
+        first_channel = 0 if probe else args.channels
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                client.channel.get_channel(first_channel + i % args.channels)
+                for i in range(args.requests)
+            ),
+            return_exceptions=True,
+        )
+        elapsed = time.perf_counter() - started
+
+    errors = sum(isinstance(result, BaseException) for result in results)
+    name = "probe" if probe else "no probe"
+    print(f"{name:10} {elapsed:8.2f} {fake.ok:6} {fake.rate_limited:6} {errors:6}")
+    rate_limited = fake.rate_limited
+    fake.reset_counters()
+    return rate_limited
+
+
+async def main(args: argparse.Namespace):
+    fake = FakeDiscord(limit=args.limit, latency=args.latency)
+    base = await fake.start(args.port)
+
+    print(
+        f"{args.requests} concurrent requests to {args.channels} channels of a new "
+        f"route, buckets of {args.limit}/s"
+    )
+    print(f"{'client':10} {'seconds':>8} {'ok':>6} {'429s':>6} {'errors':>6}")
+    await run(args, fake, base, probe=False)
+    rate_limited = await run(args, fake, base, probe=True)
+    await fake.stop()
+    if rate_limited:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--channels", type=int, default=5)
+    parser.add_argument(
+        "--limit", type=int, default=5, help="requests per second per bucket"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="response latency in seconds"
+    )
+    parser.add_argument("--port", type=int, default=18120)
+    asyncio.run(main(parser.parse_args()))
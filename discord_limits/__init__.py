@@ -4,4 +4,23 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2022-present ninjafella"
 __version__ = "2.0.3"
 
+from .batch import Batch, BatchResult
+from .cache import ResponseCache
 from .client import DiscordClient
+from .coalesce import RequestCoalescer
+from .members import MemberTable
+from .response import DiscordResponse
+from .retry import RetryBudget, RetryPolicy
+from .rate_limits import (
+    HIGH_PRIORITY,
+    LOW_PRIORITY,
+    ConcurrencyController,
+    InvalidRequestBudget,
+    NamespacedBackend,
+    RateLimitBackend,
+    deadline,
+    priority,
+    request_deadline,
+    request_priority,
+)
+from .shared_memory import SharedMemoryBackend
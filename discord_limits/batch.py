@@ -0,0 +1,261 @@
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class BatchResult:
+    """The outcome of a single call made by a :class:`Batch`.
+
+    Attributes
+    ----------
+    index : int
+        The position of the call in the batch.
+    value : Any
+        What the call returned, or None if it failed.
+    error : Optional[BaseException]
+        The error the call raised, or None if it succeeded.
+    """
+
+    __slots__ = ("index", "value", "error")
+
+    def __init__(
+        self, index: int, value: Any = None, error: Optional[BaseException] = None
+    ):
+        self.index = index
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"<BatchResult index={self.index} error={self.error!r}>"
+        return f"<BatchResult index={self.index} value={self.value!r}>"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+
+class _Slot:
+    # The concurrency slot of a running call. The client parks it while the
+    # call's request waits for its bucket or the global rate limit, so calls to
+    # other buckets can run in the meantime.
+
+    __slots__ = ("batch", "parked")
+
+    def __init__(self, batch: "Batch"):
+        self.batch = batch
+        self.parked = False
+
+    def park(self):
+        if not self.parked:
+            self.parked = True
+            self.batch._active -= 1
+            self.batch._schedule_fill()
+
+    def unpark(self):
+        if self.parked:
+            self.parked = False
+            self.batch._active += 1
+
+
+# The slot of the batch call running in the current context, if any.
+batch_slot: ContextVar[Optional[_Slot]] = ContextVar("batch_slot", default=None)
+
+
+class Batch:
+    """Runs many calls with bounded concurrency, see :meth:`DiscordClient.batch`.
+
+    Calls are taken from the iterable lazily, and at most ``concurrency`` of
+    them are running at a time. A call waiting for its rate limit bucket (or the
+    global rate limit) doesn't count towards ``concurrency``, so calls to other
+    buckets carry on while a busy bucket works through its queue. At most
+    ``max_pending`` calls are started and not yet yielded, which bounds memory.
+
+    Iterating over the batch yields a :class:`BatchResult` for every call. Failed
+    calls don't stop the batch, their error is reported in the result.
+
+    Parameters
+    ----------
+    calls : Iterable
+        Callables returning awaitables (such as ``functools.partial(client.guild.add_role, ...)``), or awaitables.
+    concurrency : int, optional
+        The maximum number of calls running at the same time, by default 50
+    max_pending : int, optional
+        The maximum number of calls started but not yet yielded, by default 4 times ``concurrency``
+    ordered : bool, optional
+        Whether results are yielded in the order of the calls instead of as they complete, by default False
+
+    Attributes
+    ----------
+    started : int
+        The number of calls started.
+    succeeded : int
+        The number of calls which succeeded.
+    failed : int
+        The number of calls which raised an error.
+    cancelled : int
+        The number of calls cancelled by :meth:`cancel`.
+    failures : List[BatchResult]
+        The results of the calls which raised an error.
+    """
+
+    def __init__(
+        self,
+        calls: Iterable,
+        concurrency: int = 50,
+        max_pending: Optional[int] = None,
+        ordered: bool = False,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        self.concurrency = concurrency
+        self.max_pending = max(
+            max_pending if max_pending is not None else 4 * concurrency, concurrency
+        )
+        self.ordered = ordered
+
+        self.started = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.failures: List[BatchResult] = []
+
+        self._calls: Iterator[Tuple[int, Any]] = enumerate(calls)
+        self._exhausted = False
+        self._stopped = False
+        self._active = 0  # Running calls which aren't waiting for a rate limit
+        self._tasks: Set[asyncio.Task] = set()
+        self._completed: Deque[BatchResult] = deque()  # When unordered
+        self._buffered: Dict[int, BatchResult] = {}  # When ordered, by index
+        self._next_index = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._fill_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def _undelivered(self) -> int:
+        return len(self._tasks) + len(self._completed) + len(self._buffered)
+
+    def _schedule_fill(self):
+        # Deferred, so a call which parks and unparks without waiting doesn't let
+        # another call start.
+        if self._fill_handle is None:
+            self._fill_handle = asyncio.get_running_loop().call_soon(self._fill)
+
+    def _fill(self):
+        self._fill_handle = None
+        while (
+            not self._exhausted
+            and not self._stopped
+            and self._active < self.concurrency
+            and self._undelivered < self.max_pending
+        ):
+            try:
+                index, call = next(self._calls)
+            except StopIteration:
+                self._exhausted = True
+                break
+
+            slot = _Slot(self)
+            self._active += 1
+            self.started += 1
+            task = asyncio.ensure_future(self._run(index, call, slot))
+            task.add_done_callback(lambda t, slot=slot: self._done(t, slot))
+            self._tasks.add(task)
+
+        if self._wakeup is not None and self._exhausted and not self._tasks:
+            self._wakeup.set()  # Nothing left to wait for
+
+    async def _run(self, index: int, call: Any, slot: _Slot) -> BatchResult:
+        batch_slot.set(slot)
+        try:
+            value = await (call() if callable(call) else call)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return BatchResult(index, error=e)
+        return BatchResult(index, value)
+
+    def _done(self, task: asyncio.Task, slot: _Slot):
+        self._tasks.discard(task)
+        if not slot.parked:
+            self._active -= 1
+
+        if task.cancelled():
+            self.cancelled += 1
+        else:
+            result = task.result()
+            if result.ok:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+                self.failures.append(result)
+            if self.ordered:
+                self._buffered[result.index] = result
+            else:
+                self._completed.append(result)
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        self._fill()
+
+    def _next_result(self) -> Optional[BatchResult]:
+        if not self.ordered:
+            return self._completed.popleft() if self._completed else None
+        while True:
+            result = self._buffered.pop(self._next_index, None)
+            if result is None and (self._next_index >= self.started or self._tasks):
+                return None
+            self._next_index += 1
+            if result is not None:
+                return result
+            # Nothing is running, so that call was cancelled.
+
+    def __aiter__(self) -> "Batch":
+        return self
+
+    async def __anext__(self) -> BatchResult:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+            self._fill()
+
+        while True:
+            result = self._next_result()
+            if result is not None:
+                self._fill()
+                return result
+            if self._stopped or (self._exhausted and not self._tasks):
+                raise StopAsyncIteration
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    async def gather(self) -> List[BatchResult]:
+        """Run every remaining call and return their results.
+
+        Returns
+        -------
+        List[BatchResult]
+            The results, in the order of the calls.
+        """
+        results = [result async for result in self]
+        return results if self.ordered else sorted(results, key=lambda r: r.index)
+
+    def cancel(self):
+        """Stop starting calls and cancel the running ones.
+
+        Results which have already completed can still be iterated over.
+        """
+        self._stopped = True
+        for task in list(self._tasks):
+            task.cancel()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def __aenter__(self) -> "Batch":
+        return self
+
+    async def __aexit__(self, *args):
+        self.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,231 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+# Read endpoints which change rarely, and are cached by default (for ``ttl`` seconds).
+DEFAULT_CACHED_ROUTES = frozenset(
+    (
+        "GET /guilds/{guild_id}",
+        "GET /guilds/{guild_id}/roles",
+        "GET /guilds/{guild_id}/channels",
+        "GET /guilds/{guild_id}/emojis",
+        "GET /guilds/{guild_id}/stickers",
+        "GET /channels/{channel_id}",
+    )
+)
+
+
+def _group(path: str) -> str:
+    # The resource a path belongs to, e.g. /guilds/123 for /guilds/123/roles/456.
+    return "/".join(path.split("/", 3)[:3])
+
+
+class ResponseCache:
+    """A size bounded (LRU) cache of responses to read endpoints, which expire after a TTL.
+
+    A successful request which isn't a GET request (such as ``create_role`` or
+    ``delete_guild_emoji``) invalidates the cached responses of its own path, of
+    the paths above it and of the paths under it. For example, ``PATCH
+    /guilds/1/roles/2`` invalidates ``/guilds/1/roles`` and ``/guilds/1``, and
+    ``DELETE /guilds/1`` invalidates everything under ``/guilds/1``. Changes made
+    through another path (such as editing a channel through ``/channels/{id}``,
+    which is also listed by ``/guilds/{id}/channels``) or by others are only
+    seen once the cached response expires.
+
+    Cached responses are shared, so their ``data`` shouldn't be modified.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        The maximum number of responses cached, the least recently used are evicted first, by default 1024
+    ttl : float, optional
+        How long (in seconds) a response is cached for, by default 60
+    routes : Dict[str, float], optional
+        The TTL (in seconds) of every cached route, keyed by route template
+        (e.g. ``"GET /guilds/{guild_id}/roles"``), by default ``ttl`` for every route in DEFAULT_CACHED_ROUTES
+
+    Attributes
+    ----------
+    hits : int
+        The number of requests answered from the cache.
+    misses : int
+        The number of cacheable requests which were sent.
+    evictions : int
+        The number of responses evicted to make room for new ones.
+    expirations : int
+        The number of responses dropped once their TTL had passed.
+    invalidations : int
+        The number of responses dropped after a request changed them.
+
+    Example
+    -------
+    .. code:: py
+
+        cache = ResponseCache(routes={"GET /guilds/{guild_id}/roles": 300, "GET /guilds/{guild_id}/emojis": 600})
+        client = DiscordClient(token, response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 60,
+        routes: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.routes = (
+            routes if routes is not None else dict.fromkeys(DEFAULT_CACHED_ROUTES, ttl)
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+        # {key: (expires at (time.monotonic), path, response)}, least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, Any]]" = OrderedDict()
+        self._groups: Dict[str, Set[Hashable]] = {}  # {group: keys}
+        # When (in invalidations) each group was last invalidated, so responses to
+        # requests sent before then aren't cached. Only the latest are kept, any
+        # group forgotten is treated as invalidated at _floor.
+        self._generation = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._floor = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, method: str, route: str) -> Optional[float]:
+        """Get how long responses to a route are cached for.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request.
+        route : str
+            The route template, as returned by :func:`~discord_limits.rate_limits.get_route`.
+
+        Returns
+        -------
+        Optional[float]
+            The TTL (in seconds), or None if the route isn't cached.
+        """
+        if method != "GET":
+            return None
+        return self.routes.get(route)
+
+    def generation(self) -> int:
+        """Get the number of invalidations so far, to be passed to :meth:`set`."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached response.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key of the request.
+
+        Returns
+        -------
+        Optional[Any]
+            The response, or None if it isn't cached or has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self._remove(key)
+            self.expirations += 1
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, path: str, response: Any, ttl: float, generation: int):
+        """Cache a response.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key of the request.
+        path : str
+            The path of the request.
+        response : Any
+            The response to cache.
+        ttl : float
+            How long (in seconds) to cache it for.
+        generation : int
+            The :meth:`generation` when the request was sent.
+        """
+        group = _group(path)
+        if max(self._floor, self._invalidated.get(group, 0)) > generation:
+            return  # Invalidated while the request was in flight
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            while len(self._entries) >= self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._groups.setdefault(group, set()).add(key)
+        self._entries[key] = (time.monotonic() + ttl, path, response)
+
+    def invalidate(self, path: str):
+        """Drop the cached responses which a request to a path may have changed.
+
+        Parameters
+        ----------
+        path : str
+            The path of a request which changed something, e.g. ``/guilds/123/roles/456``.
+        """
+        group = _group(path)
+        self._generation += 1
+        self._invalidated[group] = self._generation
+        self._invalidated.move_to_end(group)
+        if len(self._invalidated) > self.max_entries:
+            self._floor = self._invalidated.popitem(last=False)[1]
+
+        keys = self._groups.get(group)
+        if not keys:
+            return
+        for key in list(keys):
+            cached_path = self._entries[key][1]
+            if (
+                path.startswith(cached_path)  # The path itself, or a path above it
+                and path[len(cached_path) : len(cached_path) + 1] in ("", "/")
+            ) or cached_path.startswith(path + "/"):
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        """Drop every cached response."""
+        self._generation += 1
+        self._floor = self._generation
+        self._invalidated.clear()
+        self._entries.clear()
+        self._groups.clear()
+
+    def _remove(self, key: Hashable):
+        _, path, _ = self._entries.pop(key)
+        group = _group(path)
+        keys = self._groups[group]
+        keys.discard(key)
+        if not keys:
+            del self._groups[group]
+
+    def stats(self) -> Dict[str, int]:
+        """Get the cache counters.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of entries, hits, misses, evictions, expirations and invalidations.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
@@ -1,18 +1,33 @@
 import asyncio
+import time
 import warnings
-import datetime
 from sys import version_info as python_version
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientError, ClientSession, TCPConnector
 from aiohttp import __version__ as aiohttp_version
-from aiolimiter import AsyncLimiter
 
 from . import __version__
+from .batch import Batch, batch_slot
+from .cache import ResponseCache
+from .coalesce import RequestCoalescer
 from .errors import *
 from .paths import Paths
-from .rate_limits import BucketHandler, ClientRateLimits
-
-from typing import Optional
+from .rate_limits import (
+    BucketHandler,
+    ClientRateLimits,
+    InvalidRequestBudget,
+    RateLimitBackend,
+    get_route,
+    check_deadline,
+    is_global_exempt,
+    request_deadline,
+    request_priority,
+)
+from .response import DiscordResponse
+from .retry import RetryPolicy
+
+from functools import partial
+from typing import Awaitable, Callable, Iterable, Optional
 
 
 class DiscordClient(Paths):
@@ -25,6 +40,43 @@ class DiscordClient(Paths):
         The type of token provided ('bot', 'bearer', 'user', None), by default 'bot'
     api_version : int, optional
         The Discord API version to use (6, 7, 8, 9, 10), by default 10
+    suppress_warnings : bool, optional
+        Whether to suppress warnings or not, by default False
+    max_attempts : int, optional
+        The maximum number of attempts to make a request, used if no ``retry_policy`` is given, by default 3
+    connection_limit : int, optional
+        The maximum number of simultaneous connections in the pool (0 for no limit), by default 100
+    keepalive_timeout : float, optional
+        How long (in seconds) an idle connection is kept open for reuse, by default 30
+    dns_cache_ttl : int, optional
+        How long (in seconds) resolved DNS entries are cached for, by default 300
+    global_rate_limit : int, optional
+        The number of requests per second allowed by the global rate limit, by default 50
+    rate_limit_backend : RateLimitBackend, optional
+        Where to store rate limit state shared with other clients using the same token
+        (such as :class:`~discord_limits.shared_memory.SharedMemoryBackend`), by default None
+    max_buckets : int, optional
+        The number of rate limit buckets above which idle ones are dropped even if they were
+        used recently, by default None (no limit)
+    bucket_idle_timeout : float, optional
+        How long (in seconds) an idle rate limit bucket is kept after it was last used, by default 300
+    adaptive_concurrency : bool, optional
+        Whether the number of requests in flight to each bucket adapts to its latency and 429s
+        (see :meth:`ClientRateLimits.concurrency_limits`), by default True
+    rate_limit_cache : str, optional
+        A file to save the learned rate limit buckets to, so they are known from the first
+        request after a restart, by default None
+    rate_limit_cache_interval : float, optional
+        How often (in seconds) the rate limit buckets are saved, by default 60
+    invalid_request_budget : InvalidRequestBudget, optional
+        Tracks invalid requests to avoid a Cloudflare ban, clients in the same process
+        should share one, by default a new InvalidRequestBudget
+    retry_policy : RetryPolicy, optional
+        When and how failed requests are retried, by default a RetryPolicy with ``max_attempts``
+    coalescer : RequestCoalescer, optional
+        Collapses identical GET requests made at the same time into one, by default a new RequestCoalescer
+    response_cache : ResponseCache, optional
+        Caches the responses of read endpoints which change rarely, by default None (no caching)
 
     Attributes
     ----------
@@ -38,6 +90,26 @@ class DiscordClient(Paths):
         Whether to suppress warnings or not. Default is False.
     max_attempts : int
         The maximum number of attempts to make a request. Default is 3.
+    retry_policy : RetryPolicy
+        When and how failed requests are retried.
+    coalescer : RequestCoalescer
+        Collapses identical GET requests, and counts how many were collapsed.
+    response_cache : Optional[ResponseCache]
+        The response cache, and its hit, miss and eviction counters.
+    dropped_requests : int
+        The number of requests dropped as they couldn't be sent before their deadline
+        (see :func:`~discord_limits.rate_limits.deadline`).
+    late_requests : int
+        The number of requests sent before their deadline, but answered after it.
+    invalid_requests : InvalidRequestBudget
+        The invalid request budget, see :meth:`InvalidRequestBudget.metrics`.
+
+    The client keeps a single pooled HTTP session open which is shared by every
+    path. Close it with :meth:`close` once you are done, or use the client as an
+    async context manager::
+
+        async with DiscordClient(token) as client:
+            await client.channel.create_message(channel_id, "Hello World!")
     """
 
     def __init__(
@@ -47,6 +119,20 @@ class DiscordClient(Paths):
         api_version: int = 10,
         suppress_warnings: bool = False,
         max_attempts: int = 3,
+        connection_limit: int = 100,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
+        global_rate_limit: int = 50,
+        rate_limit_backend: Optional[RateLimitBackend] = None,
+        max_buckets: Optional[int] = None,
+        bucket_idle_timeout: float = 300,
+        adaptive_concurrency: bool = True,
+        rate_limit_cache: Optional[str] = None,
+        rate_limit_cache_interval: float = 60,
+        invalid_request_budget: Optional[InvalidRequestBudget] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         super().__init__(self)
 
@@ -76,7 +162,28 @@ class DiscordClient(Paths):
             self.token = None
             self.token_type = None
 
-        self.rate_limits = ClientRateLimits()
+        self._global_rate_limit = global_rate_limit
+        self._rate_limit_backend = rate_limit_backend
+        self._max_buckets = max_buckets
+        self._bucket_idle_timeout = bucket_idle_timeout
+        self._adaptive_concurrency = adaptive_concurrency
+        self.rate_limits = ClientRateLimits(
+            global_rate_limit,
+            rate_limit_backend,
+            max_buckets,
+            bucket_idle_timeout,
+            adaptive_concurrency,
+        )
+        self._rate_limit_cache = rate_limit_cache
+        self._rate_limit_cache_interval = rate_limit_cache_interval
+        self._rate_limit_cache_task: Optional[asyncio.Task] = None
+        if rate_limit_cache is not None:
+            self.rate_limits.load(rate_limit_cache)
+        self.invalid_requests = (
+            invalid_request_budget
+            if invalid_request_budget is not None
+            else InvalidRequestBudget()
+        )
         self._base_url = f"https://discord.com/api/v{api_version}"
         self._base_url_len = len(self._base_url)
 
@@ -84,50 +191,87 @@ class DiscordClient(Paths):
             f"DiscordBot (https://github.com/ninjafella/discord-API-limits {__version__}) Python/{python_version[0]}.{python_version[1]}.{python_version[2]} aiohttp/{aiohttp_version}"
         )
 
-        self.global_limiter = AsyncLimiter(50, 1)
-
         self.suppress_warnings = suppress_warnings
         self.max_attempts = max_attempts
+        self.dropped_requests = 0
+        self.late_requests = 0
+        self.retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy(max_attempts)
+        )
+        self.coalescer = coalescer if coalescer is not None else RequestCoalescer()
+        self.response_cache = response_cache
+
+        self._connection_limit = connection_limit
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[ClientSession] = None
+
+    async def __aenter__(self) -> "DiscordClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def _get_session(self) -> ClientSession:
+        # The session is created lazily as aiohttp needs a running event loop.
+        if self._session is None or self._session.closed:
+            connector = TCPConnector(
+                limit=self._connection_limit,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_cache_ttl,
+            )
+            self._session = ClientSession(connector=connector)
+            if (
+                self._rate_limit_cache is not None
+                and self._rate_limit_cache_task is None
+            ):
+                self._rate_limit_cache_task = asyncio.ensure_future(
+                    self._save_rate_limits_periodically()
+                )
+        return self._session
 
-    def _create_bucket_handler(self, r: ClientResponse, bucket_path: str):
-        status = r.status
+    async def _save_rate_limits_periodically(self):
+        while True:
+            await asyncio.sleep(self._rate_limit_cache_interval)
+            self.rate_limits.save(self._rate_limit_cache)  # type: ignore
 
-        if status == 400:
-            raise BadRequest
-        elif status == 401:
-            raise Unauthorized
-        elif status == 403:
-            raise Forbidden
-        elif status == 404:
-            raise NotFound
-        elif status == 500:
-            raise InternalServerError
+    async def close(self) -> None:
+        """Close the underlying HTTP session and all of its pooled connections.
 
-        if self.rate_limits.buckets.get(r.headers["X-RateLimit-Bucket"]) is not None:
-            bucket_hash = r.headers["X-RateLimit-Bucket"]
-            self.rate_limits.bucket_relations[bucket_path] = bucket_hash
-            self._check_response(r, self.rate_limits.buckets[bucket_hash])
-        else:
-            bh = BucketHandler()
-            self._check_response(r, bh)
-            self.rate_limits.buckets[bh.bucket_hash] = bh
-            self.rate_limits.bucket_relations[bucket_path] = bh.bucket_hash
+        A new session will be opened automatically if another request is made.
+        The rate limit buckets are saved if a ``rate_limit_cache`` was given.
+        """
+        if self._rate_limit_cache_task is not None:
+            self._rate_limit_cache_task.cancel()
+            self._rate_limit_cache_task = None
+        if self._rate_limit_cache is not None:
+            self.rate_limits.save(self._rate_limit_cache)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def _request(
         self,
         method: str,
         path: str,
-        headers: dict = {},
+        headers: Optional[dict] = None,
         json: Optional[dict] = None,
         params: Optional[dict] = None,
         auth: bool = True,
         metadata: Optional[str] = None,
-        _attempts: int = 0,
-    ) -> ClientResponse:  # type: ignore
-
-        if _attempts >= self.max_attempts:
-            raise MaxAttemptsReached
-
+        priority: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> DiscordResponse:
+
+        # Set for every path with discord_limits.priority() and discord_limits.deadline().
+        if priority is None:
+            priority = request_priority.get()
+        if deadline is None:
+            deadline = request_deadline.get()
+
+        # Optional headers such as X-Audit-Log-Reason are passed as None when unset.
+        headers = {k: v for k, v in (headers or {}).items() if v is not None}
         headers["User-Agent"] = self._user_agent
         headers["Accept"] = "application/json"
         headers["Content-Type"] = "application/json"
@@ -138,106 +282,289 @@ class DiscordClient(Paths):
                     "No token has been set. Please set a token with set_new_token()."
                 )
             headers["Authorization"] = self.token
-        cs = ClientSession()
-
         url = self._base_url + path
 
-        request_manager = cs.request(
-            method, url, json=json, params=params, headers=headers
+        route, major = get_route(method, path, metadata)
+        send = partial(
+            self._request_with_retries,
+            method,
+            url,
+            route,
+            major,
+            priority,
+            deadline,
+            headers,
+            json,
+            params,
+        )
+        # Identifies identical GET requests, for coalescing and caching.
+        key = (
+            path,
+            tuple(sorted((k, str(v)) for k, v in params.items())) if params else (),
+            headers.get("Authorization"),
         )
 
-        if metadata is not None:
-            bucket_path = f"{method}:{path}:{metadata}"
-        bucket_path = f"{method}:{path}"
-
-        bucket_hash = self.rate_limits.bucket_relations.get(bucket_path)
-        if bucket_hash is not None:
-            bucket_handler = self.rate_limits.buckets[bucket_hash]
-
-            async with self.rate_limits.global_limiter:
-                async with bucket_handler:
-                    async with cs:
-                        response = await request_manager
-                        try:
-                            self._check_response(response, bucket_handler)
-                        except TooManyRequests:
-                            await self._request(
-                                method,
-                                path,
-                                headers=headers,
-                                json=json,
-                                params=params,
-                                auth=auth,
-                                metadata=metadata,
-                                _attempts=_attempts + 1,
-                            )
-                        except Exception as e:
-                            raise e
-
+        cache = self.response_cache
+        if cache is None:
+            ttl = None
+        elif method != "GET":
+            try:
+                return await send()
+            finally:
+                # Invalidated even if the request failed, as it may have reached Discord.
+                cache.invalidate(path)
+        elif (ttl := cache.ttl_for(method, route)) is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response
+            generation = cache.generation()
+
+        # A request with a deadline must be dropped on its own terms, so it isn't
+        # coalesced, and requests are only coalesced with those of the same priority.
+        if deadline is None and self.coalescer.enabled_for(method, route):
+            response = await self.coalescer.run((*key, priority), route, send)
         else:
-            async with self.rate_limits.global_limiter:
-                async with cs:
-                    response = await request_manager
-                    try:
-                        self._create_bucket_handler(response, bucket_path)
-                    except TooManyRequests:
-                        await self._request(
-                            method,
-                            path,
-                            headers=headers,
-                            json=json,
-                            params=params,
-                            auth=auth,
-                            metadata=metadata,
-                            _attempts=_attempts + 1,
-                        )
-                    except Exception as e:
-                        raise e
-
-    def _check_response(self, r: ClientResponse, bh: BucketHandler):
-        headers = r.headers
+            response = await send()
+        if ttl is not None:
+            cache.set(key, path, response, ttl, generation)  # type: ignore
+        return response
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        major: str,
+        priority: int,
+        deadline: Optional[float],
+        headers: dict,
+        json: Optional[dict],
+        params: Optional[dict],
+    ) -> DiscordResponse:
+        policy = self.retry_policy.for_route(route)
+        budget = self.retry_policy.budget
+        budget.deposit()
+
+        attempts = 0
+        try:
+            while True:
+                attempts += 1
+                try:
+                    response = await self._attempt(
+                        method,
+                        url,
+                        route,
+                        major,
+                        priority,
+                        deadline,
+                        json=json,
+                        params=params,
+                        headers=headers,
+                    )
+                except TooManyRequests as e:
+                    if attempts >= policy.max_attempts:
+                        raise MaxAttemptsReached from e
+                    if not e.paused:
+                        # Shared limits are not tracked by our buckets, and routes without
+                        # a bucket have nothing to pause, so wait here instead.
+                        check_deadline(deadline, e.retry_after)
+                        await asyncio.sleep(e.retry_after)
+                except (ServerError, ClientError, asyncio.TimeoutError) as e:
+                    if (
+                        attempts >= policy.max_attempts
+                        or not policy.is_retryable(method, e)
+                        or not budget.withdraw()
+                    ):
+                        raise
+                    backoff = policy.backoff(attempts)
+                    check_deadline(deadline, backoff)
+                    await asyncio.sleep(backoff)
+                else:
+                    if deadline is not None and time.monotonic() > deadline:
+                        self.late_requests += 1
+                    return response
+        except DeadlineExceeded:
+            self.dropped_requests += 1
+            raise
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        major: str,
+        priority: int,
+        deadline: Optional[float],
+        **kwargs,
+    ) -> DiscordResponse:
+        slot = batch_slot.get()
+        if slot is not None:
+            # Let the batch run other calls while this one waits for its turn.
+            slot.park()
+        authorization = kwargs["headers"].get("Authorization")
+        try:
+            # Interaction responses are critical, and are only refused if the token is.
+            await self.invalid_requests.acquire(
+                is_global_exempt(route), deadline, authorization
+            )
+
+            # Retries happen outside of the bucket so they take their own place in it.
+            rate_limits = self.rate_limits
+            bucket_handler = await rate_limits.get_bucket_or_probe(
+                route, major, deadline
+            )
+            if bucket_handler is not None:
+                await bucket_handler.acquire(priority, deadline)
+            try:
+                await rate_limits.acquire_global(route, priority, deadline)
+                check_deadline(deadline)
+                if slot is not None:
+                    slot.unpark()
+                sent_at = time.monotonic()
+                response = await self._send(method, url, **kwargs)
+                if bucket_handler is not None and response.status != 429:
+                    bucket_handler.observe(time.monotonic() - sent_at)
+                self._check_response(
+                    response, route, major, bucket_handler, authorization
+                )
+            finally:
+                if bucket_handler is not None:
+                    bucket_handler.release()
+                else:
+                    rate_limits.end_probe(route)
+        finally:
+            if slot is not None:
+                slot.unpark()
+        return response
+
+    async def _send(self, method: str, url: str, **kwargs) -> DiscordResponse:
+        async with self._get_session().request(method, url, **kwargs) as r:
+            return DiscordResponse(r.status, r.headers, await r.read())
+
+    def _check_response(
+        self,
+        r: DiscordResponse,
+        route: str,
+        major: str,
+        bh: Optional[BucketHandler],
+        authorization: Optional[str],
+    ):
         status = r.status
+        self.invalid_requests.record(
+            status, r.headers.get("X-RateLimit-Scope"), authorization
+        )
+
+        # Error responses count towards the bucket too, so it is learned from them.
+        bh = self.rate_limits.update_from_headers(r.headers, route, major, bh, status)
 
-        if status == 400:
-            raise BadRequest
+        # The response is attached to the error, for Discord's error code and message.
+        if status == 429:
+            retry_after, scope = self.rate_limits.rate_limited(r.headers, r.data, bh)
+            error = TooManyRequests(retry_after, scope, r)
+            error.paused = scope == "global" or (scope != "shared" and bh is not None)
+            raise error
+        elif status == 400:
+            raise BadRequest(r)
         elif status == 401:
-            raise Unauthorized
+            raise Unauthorized(r)
         elif status == 403:
-            raise Forbidden
+            raise Forbidden(r)
         elif status == 404:
-            raise NotFound
+            raise NotFound(r)
         elif status == 500:
-            raise InternalServerError
-
-        for header in headers:
-            if header == "X-RateLimit-Limit":
-                bh.limit = int(headers["X-RateLimit-Limit"])
-            elif header == "X-RateLimit-Remaining":
-                bh.remaining = int(headers["X-RateLimit-Remaining"])
-            elif header == "X-RateLimit-Reset":
-                bh.reset = datetime.datetime.fromtimestamp(
-                    float(headers["X-RateLimit-Reset"]),
-                    datetime.timezone.utc,
-                )
-            elif header == "X-RateLimit-Bucket" and header != bh.bucket_hash:
-                if bh.bucket_hash == "":
-                    bh.bucket_hash = headers["X-RateLimit-Bucket"]
-                old_hash = bh.bucket_hash
-                bh.bucket_hash = headers["X-RateLimit-Bucket"]
-                self.rate_limits.update_bucket_relations(old_hash, bh.bucket_hash)
-
-        if status == 429:
-            bh.retry_after = float(headers["X-RateLimit-Reset-After"])
-            asyncio.ensure_future(bh.trigger_lock())
-            raise TooManyRequests
+            raise InternalServerError(status, r)
+        elif status > 500:
+            raise ServerError(status, r)
         elif not (300 > status >= 200):
-            raise UnknownError
+            raise UnknownError(r)
+
+    def batch(
+        self,
+        calls: Iterable,
+        concurrency: int = 50,
+        max_pending: Optional[int] = None,
+        ordered: bool = False,
+    ) -> Batch:
+        """Run many calls with bounded concurrency.
+
+        Calls are taken from ``calls`` lazily, and at most ``concurrency`` of them
+        run at a time. Calls waiting for their rate limit bucket don't count
+        towards ``concurrency``, so calls to other buckets carry on in parallel.
+
+        Parameters
+        ----------
+        calls : Iterable
+            Callables returning awaitables (such as ``functools.partial(client.guild.add_role, ...)``), or awaitables.
+        concurrency : int, optional
+            The maximum number of calls running at the same time, by default 50
+        max_pending : int, optional
+            The maximum number of calls started but not yet yielded, by default 4 times ``concurrency``
+        ordered : bool, optional
+            Whether results are yielded in the order of the calls instead of as they complete, by default False
+
+        Returns
+        -------
+        Batch
+            An async iterator of :class:`~discord_limits.batch.BatchResult`. Use it as an async
+            context manager to cancel the remaining calls when leaving the block.
+
+        Example
+        -------
+        .. code:: py
+
+            calls = (partial(client.guild.add_role, guild_id, member_id, role_id) for member_id in member_ids)
+            async with client.batch(calls) as batch:
+                async for result in batch:
+                    if not result.ok:
+                        print(f"Call {result.index} failed: {result.error!r}")
+        """
+        return Batch(calls, concurrency, max_pending, ordered)
+
+    def map(
+        self,
+        func: Callable[..., Awaitable],
+        *iterables: Iterable,
+        concurrency: int = 50,
+        max_pending: Optional[int] = None,
+        ordered: bool = False,
+    ) -> Batch:
+        """Call ``func`` with the items of ``iterables`` (like :func:`map`) as a :meth:`batch`.
+
+        Parameters
+        ----------
+        func : Callable[..., Awaitable]
+            The function to call, such as ``client.channel.get_channel``.
+        *iterables : Iterable
+            The arguments of each call, taken lazily.
+        concurrency : int, optional
+            The maximum number of calls running at the same time, by default 50
+        max_pending : int, optional
+            The maximum number of calls started but not yet yielded, by default 4 times ``concurrency``
+        ordered : bool, optional
+            Whether results are yielded in the order of the calls instead of as they complete, by default False
+
+        Returns
+        -------
+        Batch
+            An async iterator of :class:`~discord_limits.batch.BatchResult`.
+
+        Example
+        -------
+        .. code:: py
+
+            results = await client.map(client.channel.get_channel, channel_ids, ordered=True).gather()
+        """
+        calls = (partial(func, *args) for args in zip(*iterables))
+        return Batch(calls, concurrency, max_pending, ordered)
 
     def set_new_token(
         self, token: Optional[str], token_type: Optional[str] = "bot"
     ) -> None:
         """Set a new token to use.
 
+        Rate limits are tracked per token, so the rate limit state is reset, and
+        the 401 responses to the old token are forgotten.
+
         Parameters
         ----------
         token : str
@@ -245,6 +572,7 @@ class DiscordClient(Paths):
         token_type : str, optional
             The type of token provided ('bot', 'bearer', 'user', None), by default 'bot'
         """
+        self.invalid_requests.forget(self.token)
         if token_type == "bot":
             self.token = f"Bot {token}"
         elif token_type == "bearer":
@@ -258,3 +586,13 @@ class DiscordClient(Paths):
             self.token = token
         else:
             self.token = None
+            token_type = None
+
+        self.token_type = token_type
+        self.rate_limits = ClientRateLimits(
+            self._global_rate_limit,
+            self._rate_limit_backend,
+            self._max_buckets,
+            self._bucket_idle_timeout,
+            self._adaptive_concurrency,
+        )
@@ -0,0 +1,140 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from .batch import batch_slot
+
+
+class RequestCoalescer:
+    """Collapses identical GET requests made at the same time into one (single-flight).
+
+    While a GET request is waiting for its response, the same request (same
+    path, query parameters, token and priority) made again waits for that
+    response instead of being sent. Every caller gets the same
+    :class:`~discord_limits.response.DiscordResponse` (or error), so its ``data``
+    shouldn't be modified. Requests made with a deadline (see
+    :func:`~discord_limits.rate_limits.deadline`) are never coalesced.
+
+    The shared request is only cancelled once every caller waiting for it is cancelled.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether GET requests are coalesced by default, by default True
+    routes : Dict[str, bool], optional
+        Whether GET requests to specific routes are coalesced, keyed by route template
+        (e.g. ``"GET /guilds/{guild_id}/members"``), by default None
+
+    Attributes
+    ----------
+    hits : int
+        The number of requests which waited for an identical request instead of being sent.
+    misses : int
+        The number of coalescable requests which were sent.
+    route_hits : Dict[str, int]
+        The number of hits of every route template.
+
+    Example
+    -------
+    .. code:: py
+
+        coalescer = RequestCoalescer(routes={"GET /guilds/{guild_id}/members": False})
+        client = DiscordClient(token, coalescer=coalescer)
+    """
+
+    def __init__(self, enabled: bool = True, routes: Optional[Dict[str, bool]] = None):
+        self.enabled = enabled
+        self.routes = routes or {}
+        self.hits = 0
+        self.misses = 0
+        self.route_hits: Dict[str, int] = {}
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+
+    def enabled_for(self, method: str, route: str) -> bool:
+        """Whether requests to a route are coalesced.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request.
+        route : str
+            The route template, as returned by :func:`~discord_limits.rate_limits.get_route`.
+
+        Returns
+        -------
+        bool
+            Whether the request is a GET request and coalescing is enabled for its route.
+        """
+        return method == "GET" and self.routes.get(route, self.enabled)
+
+    async def run(
+        self, key: Hashable, route: str, send: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Send a request, or wait for the identical request already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies identical requests.
+        route : str
+            The route template of the request, used for :attr:`route_hits`.
+        send : Callable[[], Awaitable[Any]]
+            Sends the request, only called if no identical request is in flight.
+
+        Returns
+        -------
+        Any
+            The result of ``send``.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._send(send))
+            task.add_done_callback(lambda t: self._done(key, t))
+            self._in_flight[key] = task
+            self._waiters[key] = 0
+        else:
+            self.hits += 1
+            self.route_hits[route] = self.route_hits.get(route, 0) + 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._in_flight.get(key) is task and self._waiters[key] == 1:
+                # Nobody else is waiting for it, and later callers send their own.
+                del self._in_flight[key]
+                del self._waiters[key]
+                task.cancel()
+            raise
+        finally:
+            if key in self._waiters and self._in_flight.get(key) is task:
+                self._waiters[key] -= 1
+
+    async def _send(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        # The task copies the context of the first caller, which may end before
+        # the request does, so it mustn't hold on to the caller's batch slot.
+        batch_slot.set(None)
+        return await send()
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            del self._waiters[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here in case every caller was cancelled
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the coalescing counters.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The hits, misses, hits per route and the number of requests in flight.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "route_hits": dict(self.route_hits),
+            "in_flight": len(self._in_flight),
+        }
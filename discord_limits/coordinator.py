@@ -0,0 +1,245 @@
+"""A small service which shares rate limit state between nodes.
+
+Run it with ``python -m discord_limits.coordinator`` and give every client a
+:class:`NetworkBackend` pointing at it.
+
+The protocol is newline delimited JSON over TCP. Every message is a list of
+``[id, operation, *arguments]``. Queries (``reserve`` and ``acquire_global``)
+are answered with ``[id, result]``, or ``[id, null, error]`` if the operation
+is unknown or its arguments are invalid (such as from a client of another
+version). A message which isn't such a list is answered with ``[0, null, error]``. Notifications (``release``, ``update``, ``lock`` and
+``pause_global``) use the id 0 and are only answered with errors. Messages are
+pipelined: everything sent or answered in the same event loop iteration is
+written at once.
+"""
+
+import argparse
+import asyncio
+from json import dumps, loads
+from typing import Dict, List, Optional
+
+from .rate_limits import MemoryBackend, RateLimitBackend
+
+DEFAULT_PORT = 8125
+
+_QUERIES = ("reserve", "acquire_global")
+_NOTIFICATIONS = ("release", "update", "lock", "pause_global")
+
+
+def _encode(message: list) -> bytes:
+    return dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+class Coordinator:
+    """The coordinator service, holding the state of every connected node.
+
+    Parameters
+    ----------
+    backend : MemoryBackend, optional
+        Where the shared state is kept, by default a new MemoryBackend, which drops
+        buckets that have been idle for 5 minutes
+    """
+
+    def __init__(self, backend: Optional[MemoryBackend] = None):
+        self.backend = backend if backend is not None else MemoryBackend()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        backend = self.backend
+        partial = b""
+        try:
+            while data := await reader.read(65536):
+                lines = (partial + data).split(b"\n")
+                partial = lines.pop()
+                replies = []
+                for line in lines:
+                    message_id = 0  # Until the message is known to have an id
+                    try:
+                        message = loads(line)
+                        if not isinstance(message, list) or len(message) < 2:
+                            raise ValueError("Expected [id, operation, *arguments].")
+                        message_id, operation, *args = message
+                        if operation in _QUERIES:
+                            result = await getattr(backend, operation)(*args)
+                            replies.append(_encode([message_id, result]))
+                        elif operation in _NOTIFICATIONS:
+                            getattr(backend, operation)(*args)
+                        else:
+                            raise ValueError(f"Unknown operation {operation!r}.")
+                    except (TypeError, ValueError) as e:
+                        # Answered even for notifications, the node ignores id 0.
+                        replies.append(_encode([message_id, None, str(e)]))
+                if replies:
+                    writer.write(b"".join(replies))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        """Start accepting connections.
+
+        Parameters
+        ----------
+        host : str, optional
+            The host to listen on, by default "127.0.0.1"
+        port : int, optional
+            The port to listen on, by default 8125
+
+        Returns
+        -------
+        asyncio.Server
+            The running server.
+        """
+        return await asyncio.start_server(self._handle, host, port)
+
+
+class NetworkBackend(RateLimitBackend):
+    """A rate limit backend stored by a :class:`Coordinator` service.
+
+    Every node using the same token connects to the same coordinator, so they
+    share their buckets and global rate limit.
+
+    Parameters
+    ----------
+    host : str, optional
+        The host of the coordinator, by default "127.0.0.1"
+    port : int, optional
+        The port of the coordinator, by default 8125
+    timeout : float, optional
+        How long (in seconds) to wait for the coordinator to connect or answer, by default 5
+
+    Raises
+    ------
+    ConnectionError
+        From :meth:`reserve` and :meth:`acquire_global` if the coordinator cannot be
+        reached, doesn't answer within ``timeout`` or answers with an error.
+    """
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, timeout: float = 5
+    ):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connecting: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._outgoing: List[bytes] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._next_id = 0
+
+    async def _connect(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        self._writer = writer
+        asyncio.ensure_future(self._read(reader, writer))
+        self._flush()
+
+    async def _read(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        partial = b""
+        try:
+            while data := await reader.read(65536):
+                lines = (partial + data).split(b"\n")
+                partial = lines.pop()
+                for line in lines:
+                    message_id, result, *error = loads(line)
+                    future = self._pending.pop(message_id, None)
+                    if future is None or future.done():
+                        continue
+                    if error:
+                        future.set_exception(
+                            ConnectionError(f"The coordinator refused: {error[0]}")
+                        )
+                    else:
+                        future.set_result(result)
+        except ConnectionError:
+            pass
+        finally:
+            if self._writer is writer:
+                self._writer = None
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Lost the connection to the coordinator.")
+                    )
+
+    def _send(self, message: list):
+        self._outgoing.append(_encode(message))
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self):
+        self._flush_handle = None
+        if self._writer is None or not self._outgoing:
+            return  # Anything left is sent once connected
+        self._writer.write(b"".join(self._outgoing))
+        self._outgoing.clear()
+
+    async def _call(self, operation: str, *args) -> float:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        try:
+            if self._writer is None:
+                if self._connecting is None or self._connecting.done():
+                    self._connecting = asyncio.ensure_future(self._connect())
+                await asyncio.wait_for(asyncio.shield(self._connecting), self.timeout)
+
+            self._next_id += 1
+            message_id = self._next_id
+            future = loop.create_future()
+            self._pending[message_id] = future
+            self._send([message_id, operation, *args])
+            try:
+                return await asyncio.wait_for(future, deadline - loop.time())
+            finally:
+                self._pending.pop(message_id, None)
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                f"The coordinator didn't answer within {self.timeout} seconds."
+            ) from None
+
+    async def reserve(self, key: str, limit: Optional[int] = None) -> float:
+        return await self._call("reserve", key, limit)
+
+    def release(self, key: str) -> None:
+        self._send([0, "release", key])
+
+    def update(self, key: str, limit: int, remaining: int, reset_after: float) -> None:
+        self._send([0, "update", key, limit, remaining, reset_after])
+
+    def lock(self, key: str, retry_after: float) -> None:
+        self._send([0, "lock", key, retry_after])
+
+    async def acquire_global(self, rate: int, key: str = "") -> float:
+        return await self._call("acquire_global", rate, key)
+
+    def pause_global(self, retry_after: float, key: str = "") -> None:
+        self._send([0, "pause_global", retry_after, key])
+
+    async def close(self) -> None:
+        """Close the connection to the coordinator."""
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+
+async def _main(host: str, port: int):
+    server = await Coordinator().serve(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m discord_limits.coordinator",
+        description="Share rate limit state between discord_limits clients.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="the host to listen on")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="the port to listen on"
+    )
+    args = parser.parse_args()
+    asyncio.run(_main(args.host, args.port))
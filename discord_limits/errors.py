@@ -1,3 +1,9 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .response import DiscordResponse
+
+
 class DiscordClientError(Exception):
     pass
 
@@ -7,7 +13,46 @@ class InvalidParams(Exception):
 
 
 class ResponseError(DiscordClientError):
-    pass
+    """An error response from Discord.
+
+    Parameters
+    ----------
+    response : DiscordResponse, optional
+        The response, by default None
+
+    Attributes
+    ----------
+    response : Optional[DiscordResponse]
+        The response, with its status, headers and decoded body.
+    status : Optional[int]
+        The HTTP status code of the response.
+    code : Optional[int]
+        The JSON error code from Discord (e.g. 50035 for invalid form bodies).
+    text : Optional[str]
+        The error message from Discord.
+    errors : Any
+        The detailed errors from Discord (such as which fields are invalid), if any.
+    """
+
+    def __init__(self, response: Optional["DiscordResponse"] = None, *args):
+        self.response = response
+        self.status: Optional[int] = None
+        self.code: Optional[int] = None
+        self.text: Optional[str] = None
+        self.errors: Any = None
+        if response is not None:
+            self.status = response.status
+            data = response.data
+            if isinstance(data, dict):
+                self.code = data.get("code")
+                self.text = data.get("message")
+                self.errors = data.get("errors")
+        if not args and self.status is not None:
+            message = f"Discord returned a {self.status} response"
+            if self.text is not None:
+                message = f"{message}: {self.text} (error code: {self.code})"
+            args = (message,)
+        super().__init__(*args)
 
 
 class BadRequest(ResponseError):
@@ -27,14 +72,38 @@ class NotFound(ResponseError):
 
 
 class TooManyRequests(ResponseError):
-    pass
 
+    # Whether the bucket or the global rate limit was paused until the request can be retried
+    paused: bool = False
+
+    def __init__(
+        self,
+        retry_after: float = 0,
+        scope: str = "user",
+        response: Optional["DiscordResponse"] = None,
+    ):
+        self.retry_after = retry_after
+        self.scope = scope
+        super().__init__(
+            response, f"Rate limited ({scope}), retry after {retry_after} seconds."
+        )
+
+
+class ServerError(ResponseError):
+    """A 5xx response, which is retried by the client's retry policy."""
+
+    def __init__(self, status: int = 500, response: Optional["DiscordResponse"] = None):
+        super().__init__(response)
+        self.status = status
+        if not self.args:
+            self.args = (f"Discord returned a {status} response.",)
 
-class InternalServerError(ResponseError):
+
+class InternalServerError(ServerError):
     pass
 
 
-class UnknownError(DiscordClientError):
+class UnknownError(ResponseError):
     pass
 
 
@@ -42,6 +111,18 @@ class MaxAttemptsReached(Exception):
     pass
 
 
+class CircuitOpen(DiscordClientError):
+    """Raised instead of sending a request which would risk a Cloudflare ban."""
+
+    pass
+
+
+class DeadlineExceeded(DiscordClientError):
+    """Raised instead of sending a request which can no longer be answered before its deadline."""
+
+    pass
+
+
 class OldMessageID(Exception):
 
     def __init__(self, message_id: int, msg: str):
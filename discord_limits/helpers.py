@@ -1,6 +1,18 @@
 import datetime
+from array import array
+from typing import Any, Iterable, Optional, Tuple, Union
+
 from .errors import OldMessageID
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the batch helpers fall back to array.array
+    np = None
+
+# The first second of 2015, in milliseconds since the Unix epoch.
+DISCORD_EPOCH = 1420070400000
+_UNIX_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
 
 def snowflake_time(id: int, /) -> datetime.datetime:
     """Returns the creation time of the given snowflake.
@@ -18,10 +30,34 @@ def snowflake_time(id: int, /) -> datetime.datetime:
     :class:`datetime.datetime`
         An aware datetime in UTC representing the creation time of the snowflake.
     """
-    timestamp = ((id >> 22) + 1420070400000) / 1000
+    timestamp = ((id >> 22) + DISCORD_EPOCH) / 1000
     return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
 
 
+def time_snowflake(dt: datetime.datetime, /, high: bool = False) -> int:
+    """Returns a snowflake corresponding to the given time, the inverse of :func:`snowflake_time`.
+
+    Parameters
+    -----------
+    dt: :class:`datetime.datetime`
+        The time. A naive datetime is assumed to be in local time.
+    high: :class:`bool`
+        Whether to return the highest snowflake of that millisecond instead of
+        the lowest, by default False. Use ``high=True`` for an ``after`` bound and
+        ``high=False`` for a ``before`` bound to get the messages strictly after
+        or before that time.
+
+    Returns
+    --------
+    :class:`int`
+        The snowflake.
+    """
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    milliseconds = (dt - _UNIX_EPOCH) // datetime.timedelta(milliseconds=1)
+    return max(milliseconds - DISCORD_EPOCH, 0) << 22 | (2**22 - 1 if high else 0)
+
+
 def check_bulk_delete_ids(message_ids: list[int]):
     """Check if the messages are younger than 14 days.
 
@@ -35,10 +71,210 @@ def check_bulk_delete_ids(message_ids: list[int]):
     ValueError
         If the message ID is older than 14 days.
     """
-    now = datetime.datetime.now(datetime.timezone.utc)
+    # A message is too old if it was created at or before the cutoff's millisecond.
+    cutoff = time_snowflake(
+        datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=14),
+        high=True,
+    )
     for message in message_ids:
-        if (now - snowflake_time(int(message))) >= datetime.timedelta(days=14):
+        if int(message) <= cutoff:
             raise OldMessageID(
                 message,
                 f"The message ID {message} is older than 14 days and cannot be deleted in bulk.",
             )
+
+
+# Snowflakes given to the batch helpers below can be any iterable of IDs (ints or
+# strings), such as an array.array("Q") or a NumPy array. They return NumPy arrays
+# if NumPy is installed, otherwise array.array.
+Snowflakes = Iterable[Union[int, str]]
+
+
+def as_snowflake_array(ids: Snowflakes, /) -> Any:
+    """Convert IDs to an array of unsigned 64-bit integers.
+
+    Parameters
+    ----------
+    ids : Snowflakes
+        The IDs, as ints or strings.
+
+    Returns
+    -------
+    numpy.ndarray or array.array
+        The IDs. Arrays which already hold unsigned 64-bit integers are not copied.
+    """
+    if np is not None:
+        if isinstance(ids, np.ndarray):
+            return ids.astype(np.uint64, copy=False)
+        if isinstance(ids, array) and ids.typecode == "Q":
+            return np.frombuffer(ids, dtype=np.uint64)
+        return np.fromiter(map(int, ids), dtype=np.uint64)
+    if isinstance(ids, array) and ids.typecode == "Q":
+        return ids
+    return array("Q", map(int, ids))
+
+
+def snowflake_timestamps(ids: Snowflakes, /) -> Any:
+    """Returns the creation times of many snowflakes at once.
+
+    Parameters
+    ----------
+    ids : Snowflakes
+        The snowflake IDs.
+
+    Returns
+    -------
+    numpy.ndarray or array.array
+        The creation times, as signed 64-bit milliseconds since the Unix epoch.
+    """
+    ids = as_snowflake_array(ids)
+    if np is not None:
+        return (ids >> np.uint64(22)).astype(np.int64) + DISCORD_EPOCH
+    return array("q", [(id >> 22) + DISCORD_EPOCH for id in ids])
+
+
+def decode_snowflakes(ids: Snowflakes, /) -> Tuple[Any, Any, Any, Any]:
+    """Split many snowflakes into their fields at once.
+
+    Parameters
+    ----------
+    ids : Snowflakes
+        The snowflake IDs.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray or array.array, ...]
+        The creation times (milliseconds since the Unix epoch), internal worker
+        IDs, internal process IDs and increments of the snowflakes.
+    """
+    ids = as_snowflake_array(ids)
+    if np is not None:
+        return (
+            snowflake_timestamps(ids),
+            ((ids >> np.uint64(17)) & np.uint64(0x1F)).astype(np.uint8),
+            ((ids >> np.uint64(12)) & np.uint64(0x1F)).astype(np.uint8),
+            (ids & np.uint64(0xFFF)).astype(np.uint16),
+        )
+    return (
+        snowflake_timestamps(ids),
+        array("B", [(id >> 17) & 0x1F for id in ids]),
+        array("B", [(id >> 12) & 0x1F for id in ids]),
+        array("H", [id & 0xFFF for id in ids]),
+    )
+
+
+def snowflake_bounds(
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+) -> Tuple[Optional[int], Optional[int]]:
+    """Returns the snowflakes bounding a period, for ``after`` and ``before`` parameters.
+
+    Parameters
+    ----------
+    start : datetime.datetime, optional
+        The start of the period (inclusive), by default None (no start)
+    end : datetime.datetime, optional
+        The end of the period (exclusive), by default None (no end)
+
+    Returns
+    -------
+    Tuple[Optional[int], Optional[int]]
+        The IDs created during the period are greater than the first and less
+        than the second. Either is None if the period has no start or end, and
+        the first is 0 if the period starts before the first snowflake.
+    """
+    after = max(time_snowflake(start) - 1, 0) if start is not None else None
+    before = time_snowflake(end) if end is not None else None
+    return after, before
+
+
+def snowflakes_between(
+    ids: Snowflakes,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+) -> Any:
+    """Keep the snowflakes created during a period.
+
+    Parameters
+    ----------
+    ids : Snowflakes
+        The snowflake IDs.
+    start : datetime.datetime, optional
+        The start of the period (inclusive), by default None (no start)
+    end : datetime.datetime, optional
+        The end of the period (exclusive), by default None (no end)
+
+    Returns
+    -------
+    numpy.ndarray or array.array
+        The IDs created during the period, in their original order.
+    """
+    ids = as_snowflake_array(ids)
+    low = time_snowflake(start) if start is not None else 0
+    if np is not None:
+        keep = ids >= np.uint64(low)
+        if end is not None:
+            keep &= ids < np.uint64(time_snowflake(end))
+        return ids[keep]
+    high = time_snowflake(end) if end is not None else 2**64
+    return array("Q", [id for id in ids if low <= id < high])
+
+
+def split_snowflakes_by_age(
+    ids: Snowflakes,
+    /,
+    max_age: datetime.timedelta = datetime.timedelta(days=14),
+    now: Optional[datetime.datetime] = None,
+) -> Tuple[Any, Any]:
+    """Split snowflakes into those younger than an age and the others.
+
+    With the default age, the first can be deleted with
+    :meth:`ChannelPaths.bulk_delete_messages` and the others must be deleted one
+    at a time.
+
+    Parameters
+    ----------
+    ids : Snowflakes
+        The snowflake IDs.
+    max_age : datetime.timedelta, optional
+        The age, by default 14 days
+    now : datetime.datetime, optional
+        The current time, by default the time of the call
+
+    Returns
+    -------
+    Tuple[numpy.ndarray or array.array, numpy.ndarray or array.array]
+        The IDs younger than ``max_age``, and the others, in their original order.
+    """
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+    cutoff = time_snowflake(now - max_age, high=True)
+    ids = as_snowflake_array(ids)
+    if np is not None:
+        young = ids > np.uint64(cutoff)
+        return ids[young], ids[~young]
+    return (
+        array("Q", [id for id in ids if id > cutoff]),
+        array("Q", [id for id in ids if id <= cutoff]),
+    )
+
+
+def sort_snowflakes(ids: Snowflakes, /, reverse: bool = False) -> Any:
+    """Sort snowflakes by creation time.
+
+    Parameters
+    ----------
+    ids : Snowflakes
+        The snowflake IDs.
+    reverse : bool, optional
+        Whether to put the newest first, by default False
+
+    Returns
+    -------
+    numpy.ndarray or array.array
+        A sorted copy of the IDs.
+    """
+    if np is not None:
+        ids = np.sort(as_snowflake_array(ids))
+        return ids[::-1].copy() if reverse else ids
+    return array("Q", sorted(map(int, ids), reverse=reverse))
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -23,7 +23,7 @@ class ApplicationPaths:
 
     async def get_global_application_commands(
         self, application_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Fetch all of the global commands for an application.
 
         Parameters
@@ -33,7 +33,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of application command objects.
         """
         path = f"/applications/{application_id}/commands"
@@ -41,7 +41,7 @@ class ApplicationPaths:
 
     async def create_global_application_command(
         self, application_id: int, payload: dict
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a global command.
 
         Parameters
@@ -53,7 +53,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An application command object.
         """
         path = f"/applications/{application_id}/commands"
@@ -61,7 +61,7 @@ class ApplicationPaths:
 
     async def get_global_application_command(
         self, application_id: int, command_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a global command.
 
         Parameters
@@ -73,7 +73,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An application command object.
         """
         path = f"/applications/{application_id}/commands/{command_id}"
@@ -81,7 +81,7 @@ class ApplicationPaths:
 
     async def edit_global_application_command(
         self, application_id: int, command_id: int, payload: dict
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a global command.
 
         Parameters
@@ -95,7 +95,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An application command object.
         """
         path = f"/applications/{application_id}/commands/{command_id}"
@@ -109,7 +109,7 @@ class ApplicationPaths:
 
     async def delete_global_application_command(
         self, application_id: int, command_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a global command.
 
         Parameters
@@ -121,7 +121,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/applications/{application_id}/commands/{command_id}"
@@ -129,7 +129,7 @@ class ApplicationPaths:
 
     async def bulk_overwrite_global_application_commands(
         self, application_id: int, payload: dict
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Bulk edit global commands.
 
         Parameters
@@ -141,7 +141,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of application command objects.
         """
         path = f"/applications/{application_id}/commands"
@@ -151,7 +151,7 @@ class ApplicationPaths:
 
     async def get_guild_application_commands(
         self, application_id: int, guild_id: int, with_localisations: bool = False
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Fetch all of the guild commands for an application.
 
         Parameters
@@ -165,7 +165,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of application command objects.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands"
@@ -173,7 +173,7 @@ class ApplicationPaths:
 
     async def create_guild_application_command(
         self, application_id: int, guild_id: int, payload: dict
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a guild command.
 
         Parameters
@@ -187,7 +187,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An application command object.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands"
@@ -195,7 +195,7 @@ class ApplicationPaths:
 
     async def get_guild_application_command(
         self, application_id: int, guild_id: int, command_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a guild command.
 
         Parameters
@@ -209,7 +209,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An application command object.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}"
@@ -217,7 +217,7 @@ class ApplicationPaths:
 
     async def edit_guild_application_command(
         self, application_id: int, guild_id: int, command_id: int, payload: dict
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a guild command.
 
         Parameters
@@ -233,7 +233,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An application command object.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}"
@@ -247,7 +247,7 @@ class ApplicationPaths:
 
     async def delete_guild_application_command(
         self, application_id: int, guild_id: int, command_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a guild command.
 
         Parameters
@@ -261,7 +261,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}"
@@ -269,7 +269,7 @@ class ApplicationPaths:
 
     async def bulk_overwrite_guild_application_commands(
         self, application_id: int, guild_id: int, payload: dict
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Bulk overwrite guild commands.
 
         Parameters
@@ -283,7 +283,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of application command objects.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands"
@@ -291,7 +291,7 @@ class ApplicationPaths:
 
     async def get_guild_application_command_permissions(
         self, application_id: int, guild_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Fetch all of the guild application command permissions for an application.
 
         Parameters
@@ -303,7 +303,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of guild application command permissions objects.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands/permissions"
@@ -311,7 +311,7 @@ class ApplicationPaths:
 
     async def get_application_command_permissions(
         self, application_id: int, guild_id: int, command_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get permissions for a specific command for your application in a guild.
 
         Parameters
@@ -325,7 +325,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild application command permissions object.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions"
@@ -333,7 +333,7 @@ class ApplicationPaths:
 
     async def edit_application_command_permissions(
         self, application_id: int, guild_id: int, command_id: int, payload: dict
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a guild application command permissions.
 
         Parameters
@@ -349,7 +349,7 @@ class ApplicationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild application command permissions object.
         """
         path = f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions"
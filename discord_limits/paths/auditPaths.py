@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -21,7 +21,7 @@ class AuditPaths:
 
     async def get_audit_logs(
         self, guild_id: int, limit=50, before=None, user_id=None, action_type=None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get the audit logs for a guild.
 
         Parameters
@@ -39,7 +39,7 @@ class AuditPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of audit logs.
 
         Raises
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -19,7 +19,7 @@ class AutoModerationPaths:
     def __init__(self, client: "DiscordClient"):
         self._client = client
 
-    async def list_auto_moderation_rules(self, guild_id: int) -> ClientResponse:
+    async def list_auto_moderation_rules(self, guild_id: int) -> DiscordResponse:
         """Get a list of all rules currently configured for guild.
 
         Parameters
@@ -29,7 +29,7 @@ class AutoModerationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             List of auto moderation rule objects.
         """
         path = f"/guilds/{guild_id}/auto-moderation/rules"
@@ -37,7 +37,7 @@ class AutoModerationPaths:
 
     async def get_auto_moderation_rule(
         self, guild_id: int, rule_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a single rule.
 
         Parameters
@@ -49,7 +49,7 @@ class AutoModerationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A auto moderation rule object.
         """
         path = f"/guilds/{guild_id}/auto-moderation/rules/{rule_id}"
@@ -57,7 +57,7 @@ class AutoModerationPaths:
 
     async def create_auto_moderation_rule(
         self, guild_id: int, **options: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a new rule.
 
         Parameters
@@ -67,7 +67,7 @@ class AutoModerationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A auto moderation rule object.
         """
         path = f"/guilds/{guild_id}/auto-moderation/rules"
@@ -86,7 +86,7 @@ class AutoModerationPaths:
 
     async def modify_auto_moderation_rule(
         self, guild_id: int, rule_id: int, **options: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Modify an existing rule.
 
         Parameters
@@ -98,7 +98,7 @@ class AutoModerationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A auto moderation rule object.
         """
         path = f"/guilds/{guild_id}/auto-moderation/rules/{rule_id}"
@@ -116,7 +116,7 @@ class AutoModerationPaths:
 
     async def delete_auto_moderation_rule(
         self, guild_id: int, rule_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a rule.
 
         Parameters
@@ -128,7 +128,7 @@ class AutoModerationPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/auto-moderation/rules/{rule_id}"
@@ -1,6 +1,19 @@
-from typing import TYPE_CHECKING, Any, List, Optional, TypeVar
-
-from aiohttp import ClientResponse
+import asyncio
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -9,6 +22,7 @@ if TYPE_CHECKING:
 
 import datetime
 from discord_limits import helpers
+from discord_limits.batch import batch_slot
 
 ISO8601_timestamp = TypeVar("ISO8601_timestamp", str, bytes)
 
@@ -24,7 +38,7 @@ class ChannelPaths:
     def __init__(self, client: "DiscordClient"):
         self._client = client
 
-    async def get_channel(self, channel_id: int) -> ClientResponse:
+    async def get_channel(self, channel_id: int) -> DiscordResponse:
         """Get a channel by ID.
 
         Parameters
@@ -34,7 +48,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             Channel information.
         """
         path = f"/channels/{channel_id}"
@@ -42,7 +56,7 @@ class ChannelPaths:
 
     async def edit_channel(
         self, channel_id: int, *, reason: Optional[str] = None, **options: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Update a channel's settings.
 
         Parameters
@@ -56,7 +70,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A dict containing a channel object.
         """
         path = f"/channels/{channel_id}"
@@ -87,7 +101,7 @@ class ChannelPaths:
 
     async def delete_channel(
         self, channel_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a channel, or close a private message.
 
         Parameters
@@ -99,7 +113,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The responce from Discord.
         """
         path = f"/channels/{channel_id}"
@@ -114,7 +128,7 @@ class ChannelPaths:
         before: Optional[int] = None,
         after: Optional[int] = None,
         around: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get messages from a channel.
 
         Parameters
@@ -132,7 +146,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of message objects.
 
         Raises
@@ -157,7 +171,200 @@ class ChannelPaths:
 
         return await self._client._request("GET", path, params=params)
 
-    async def get_message(self, channel_id: int, message_id: int) -> ClientResponse:
+    async def _message_pages(
+        self,
+        channel_id: int,
+        after: Optional[int],
+        before: Optional[int],
+        oldest_first: bool,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # Pages of up to 100 messages between two snowflakes (exclusive), in order.
+        if oldest_first:
+            cursor = after if after is not None else 0
+        else:
+            cursor = before
+        while True:
+            if oldest_first:
+                response = await self.get_channel_messages(
+                    channel_id, 100, after=cursor
+                )
+            else:
+                response = await self.get_channel_messages(
+                    channel_id, 100, before=cursor
+                )
+            messages = response.data or []
+            page = [
+                message
+                for message in messages
+                if (after is None or int(message["id"]) > after)
+                and (before is None or int(message["id"]) < before)
+            ]
+            page.sort(key=lambda message: int(message["id"]), reverse=not oldest_first)
+            if page:
+                yield page
+                cursor = int(page[-1]["id"])
+            # A short page is the last one, and a trimmed page has reached the bound.
+            if len(messages) < 100 or len(page) < len(messages):
+                return
+
+    async def iter_channel_messages(
+        self,
+        channel_id: int,
+        after: Optional[Union[int, datetime.datetime]] = None,
+        before: Optional[Union[int, datetime.datetime]] = None,
+        oldest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the messages of a channel, fetching 100 at a time as they are needed.
+
+        Parameters
+        ----------
+        channel_id : int
+            The ID of the channel to get messages from
+        after : Union[int, datetime.datetime], optional
+            Only get messages after this message ID or time, by default None
+        before : Union[int, datetime.datetime], optional
+            Only get messages before this message ID or time, by default None
+        oldest_first : bool, optional
+            Whether to start from the oldest message instead of the newest, by default False
+        limit : int, optional
+            The maximum number of messages to get, by default None (no limit)
+
+        Yields
+        ------
+        Dict[str, Any]
+            Message objects.
+
+        Example
+        -------
+        .. code:: py
+
+            since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=1)
+            async for message in client.channel.iter_channel_messages(channel_id, after=since):
+                print(message["content"])
+        """
+        if isinstance(after, datetime.datetime):
+            after = helpers.time_snowflake(after, high=True)
+        if isinstance(before, datetime.datetime):
+            before = helpers.time_snowflake(before)
+        if limit is not None and limit <= 0:
+            return
+
+        count = 0
+        async for page in self._message_pages(channel_id, after, before, oldest_first):
+            for message in page:
+                yield message
+                count += 1
+                if count == limit:
+                    return
+
+    async def backfill_channel_messages(
+        self,
+        channel_id: int,
+        after: Optional[Union[int, datetime.datetime]] = None,
+        before: Optional[Union[int, datetime.datetime]] = None,
+        concurrency: int = 4,
+        slices: int = 64,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the messages of a channel oldest first, fetching several time slices at once.
+
+        The time range is split into ``slices`` equal slices, and up to
+        ``concurrency`` of them are fetched at the same time (as far as the
+        channel's rate limit allows). Slices are yielded one after the other, so
+        messages are still yielded in order. At most ``2 * concurrency`` slices are
+        fetched ahead of the messages being yielded, which bounds memory use.
+
+        Parameters
+        ----------
+        channel_id : int
+            The ID of the channel to get messages from
+        after : Union[int, datetime.datetime], optional
+            Only get messages after this message ID or time, by default None (the creation of the channel)
+        before : Union[int, datetime.datetime], optional
+            Only get messages before this message ID or time, by default None (now)
+        concurrency : int, optional
+            The maximum number of slices fetched at the same time, by default 4
+        slices : int, optional
+            The number of slices the time range is split into, by default 64
+
+        Yields
+        ------
+        Dict[str, Any]
+            Message objects, oldest first.
+
+        Raises
+        ------
+        InvalidParams
+            ``concurrency`` or ``slices`` is less than 1.
+        """
+        if concurrency < 1 or slices < 1:
+            raise InvalidParams("concurrency and slices must be at least 1")
+        if isinstance(after, datetime.datetime):
+            after = helpers.time_snowflake(after, high=True)
+        elif after is None:
+            after = int(channel_id)  # Messages are newer than their channel
+        if isinstance(before, datetime.datetime):
+            before = helpers.time_snowflake(before)
+        elif before is None:
+            before = helpers.time_snowflake(
+                datetime.datetime.now(datetime.timezone.utc), high=True
+            )
+        if before - after <= 1:
+            return
+
+        # Slice i gets the messages in (bounds[i], bounds[i + 1]].
+        bounds = [after + (before - 1 - after) * i // slices for i in range(slices + 1)]
+        # The slices not yielded yet, in order, with their pages and fetching task.
+        pending: Deque[Tuple[asyncio.Queue, asyncio.Task]] = deque()
+        next_slice = 0
+        closed = False
+
+        async def fetch(queue: asyncio.Queue, low: int, high: int):
+            # The task copies the caller's context, but mustn't use its batch slot.
+            batch_slot.set(None)
+            try:
+                async for page in self._message_pages(channel_id, low, high + 1, True):
+                    queue.put_nowait(page)
+            except Exception as e:
+                queue.put_nowait(e)
+            else:
+                queue.put_nowait(None)
+
+        def start_slices(*args):
+            nonlocal next_slice
+            fetching = sum(not task.done() for _, task in pending)
+            while (
+                not closed
+                and next_slice < slices
+                and fetching < concurrency
+                and len(pending) < 2 * concurrency
+            ):
+                queue: asyncio.Queue = asyncio.Queue()
+                task = asyncio.ensure_future(
+                    fetch(queue, bounds[next_slice], bounds[next_slice + 1])
+                )
+                task.add_done_callback(start_slices)
+                pending.append((queue, task))
+                next_slice += 1
+                fetching += 1
+
+        start_slices()
+        try:
+            while pending:
+                queue = pending[0][0]
+                while (page := await queue.get()) is not None:
+                    if isinstance(page, Exception):
+                        raise page
+                    for message in page:
+                        yield message
+                pending.popleft()
+                start_slices()
+        finally:
+            closed = True
+            for _, task in pending:
+                task.cancel()
+
+    async def get_message(self, channel_id: int, message_id: int) -> DiscordResponse:
         """Get a message from a channel.
 
         Parameters
@@ -169,7 +376,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object.
         """
         path = f"/channels/{channel_id}/messages/{message_id}"
@@ -185,7 +392,7 @@ class ChannelPaths:
         message_reference: Optional[dict] = None,
         components: Optional[List[dict]] = None,
         sticker_ids: Optional[List[int]] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Post a message to a guild text or DM channel.
 
         Parameters
@@ -209,7 +416,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object
 
         Raises
@@ -242,7 +449,7 @@ class ChannelPaths:
 
     async def crosspost_message(
         self, channel_id: int, message_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Crosspost a message in a News Channel to following channels.
 
         Parameters
@@ -254,7 +461,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/crosspost"
@@ -262,7 +469,7 @@ class ChannelPaths:
 
     async def add_reaction(
         self, channel_id: int, message_id: int, emoji: str
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a reaction for a message.
 
         Parameters
@@ -276,7 +483,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
@@ -284,7 +491,7 @@ class ChannelPaths:
 
     async def remove_own_reaction(
         self, channel_id: int, message_id: int, emoji: str
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Remove a reaction from a message.
 
         Parameters
@@ -298,7 +505,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
@@ -306,7 +513,7 @@ class ChannelPaths:
 
     async def remove_reaction(
         self, channel_id: int, message_id: int, emoji: str, member_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Remove a users reaction from a message.
 
         Parameters
@@ -322,7 +529,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{member_id}"
@@ -335,7 +542,7 @@ class ChannelPaths:
         emoji: str,
         limit: int = 25,
         after: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a list of users that reacted with this emoji.
 
         Parameters
@@ -353,7 +560,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of user objects.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}"
@@ -365,7 +572,7 @@ class ChannelPaths:
 
         return await self._client._request("GET", path, params=params)
 
-    async def clear_reactions(self, channel_id: int, message_id: int) -> ClientResponse:
+    async def clear_reactions(self, channel_id: int, message_id: int) -> DiscordResponse:
         """Deletes all reactions on a message.
 
         Parameters
@@ -377,7 +584,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/reactions"
@@ -385,7 +592,7 @@ class ChannelPaths:
 
     async def clear_single_reaction(
         self, channel_id: int, message_id: int, emoji: str
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Deletes all the reactions for a given emoji on a message.
 
         Parameters
@@ -399,7 +606,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}"
@@ -413,7 +620,7 @@ class ChannelPaths:
         embeds: Optional[List[dict]] = None,
         allowed_mentions: Optional[dict] = None,
         components: Optional[List[Any]] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a previously sent message.
 
         Parameters
@@ -433,7 +640,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             _description_
         """
         path = f"/channels/{channel_id}/messages/{message_id}"
@@ -452,7 +659,7 @@ class ChannelPaths:
 
     async def delete_message(
         self, channel_id: int, message_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a message.
 
         Parameters
@@ -466,7 +673,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/messages/{message_id}"
@@ -492,7 +699,7 @@ class ChannelPaths:
 
     async def bulk_delete_messages(
         self, channel_id: int, message_ids: List[int], reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete multiple messages.
 
         Parameters
@@ -506,7 +713,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         helpers.check_bulk_delete_ids(message_ids)
@@ -526,7 +733,7 @@ class ChannelPaths:
         deny: str,
         type: int,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit the channel permission overwrites for a user or role in a channel.
 
         Parameters
@@ -546,7 +753,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/permissions/{overwrite_id}"
@@ -555,7 +762,7 @@ class ChannelPaths:
             "PUT", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_channel_invites(self, channel_id: int) -> ClientResponse:
+    async def get_channel_invites(self, channel_id: int) -> DiscordResponse:
         """Get a list of invites for a channel.
 
         Parameters
@@ -565,7 +772,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of invite objects
         """
         path = f"/channels/{channel_id}/invites"
@@ -583,7 +790,7 @@ class ChannelPaths:
         target_type: Optional[int] = None,
         target_user_id: Optional[int] = None,
         target_application_id: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a new invite for a channel.
 
         Parameters
@@ -609,7 +816,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An invite object.
         """
         path = f"/channels/{channel_id}/invites"
@@ -635,7 +842,7 @@ class ChannelPaths:
 
     async def delete_channel_permissions(
         self, channel_id: int, overwrite_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a channel permission overwrite for a user or role in a channel.
 
         Parameters
@@ -649,7 +856,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/permissions/{overwrite_id}"
@@ -659,7 +866,7 @@ class ChannelPaths:
 
     async def follow_news_channel(
         self, channel_id: int, webhook_channel_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Follow a News Channel to send messages to a target channel.
 
         Parameters
@@ -673,7 +880,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/followers"
@@ -684,7 +891,7 @@ class ChannelPaths:
             "POST", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def start_typing(self, channel_id: int) -> ClientResponse:
+    async def start_typing(self, channel_id: int) -> DiscordResponse:
         """Post a typing indicator for the specified channel.
 
         Parameters
@@ -694,13 +901,13 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/typing"
         return await self._client._request("POST", path)
 
-    async def get_pinned_messages(self, channel_id: int) -> ClientResponse:
+    async def get_pinned_messages(self, channel_id: int) -> DiscordResponse:
         """Get a list of pinned messages in a channel.
 
         Parameters
@@ -710,7 +917,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of message objects.
         """
         path = f"/channels/{channel_id}/pins"
@@ -718,7 +925,7 @@ class ChannelPaths:
 
     async def pin_message(
         self, channel_id: int, message_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Pin a message in a channel.
 
         Parameters
@@ -732,7 +939,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/pins/{message_id}"
@@ -742,7 +949,7 @@ class ChannelPaths:
 
     async def unpin_message(
         self, channel_id: int, message_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Unpin a message in a channel.
 
         Parameters
@@ -756,7 +963,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/pins/{message_id}"
@@ -770,7 +977,7 @@ class ChannelPaths:
         user_id: int,
         access_token: str,
         nickname: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Adds a recipient to a Group DM using their access token.
 
         Parameters
@@ -786,7 +993,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/recipients/{user_id}"
@@ -795,7 +1002,7 @@ class ChannelPaths:
 
     async def remove_group_recipient(
         self, channel_id: int, user_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Removes a recipient from a Group DM.
 
         Parameters
@@ -807,7 +1014,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/recipients/{user_id}"
@@ -822,7 +1029,7 @@ class ChannelPaths:
         auto_archive_duration: int,
         rate_limit_per_user: int,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Creates a new thread from an existing message.
 
         Parameters
@@ -842,7 +1049,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A channel object.
         """
         path = f"/channels/{channel_id}/messages/{message_id}/threads"
@@ -865,7 +1072,7 @@ class ChannelPaths:
         invitable: bool = True,
         rate_limit_per_user: Optional[int] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Creates a new thread.
 
         Parameters
@@ -887,7 +1094,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A channel object.
         """
         path = f"/channels/{channel_id}/threads"
@@ -911,7 +1118,7 @@ class ChannelPaths:
         message: dict,
         rate_limit_per_user: Optional[int] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Creates a new thread in a forum channel.
 
         Parameters
@@ -931,7 +1138,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A channel object, with a nested message object.
 
         Raises
@@ -978,7 +1185,7 @@ class ChannelPaths:
             "POST", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def join_thread(self, channel_id: int) -> ClientResponse:
+    async def join_thread(self, channel_id: int) -> DiscordResponse:
         """Adds the current user to a thread.
 
         Parameters
@@ -988,13 +1195,13 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/thread-members/@me"
         return await self._client._request("PUT", path)
 
-    async def add_user_to_thread(self, channel_id: int, user_id: int) -> ClientResponse:
+    async def add_user_to_thread(self, channel_id: int, user_id: int) -> DiscordResponse:
         """Adds another member to a thread.
 
         Parameters
@@ -1006,13 +1213,13 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/thread-members/{user_id}"
         return await self._client._request("PUT", path)
 
-    async def leave_thread(self, channel_id: int) -> ClientResponse:
+    async def leave_thread(self, channel_id: int) -> DiscordResponse:
         """Removes the current user from a thread.
 
         Parameters
@@ -1022,7 +1229,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/thread-members/@me"
@@ -1030,7 +1237,7 @@ class ChannelPaths:
 
     async def remove_user_from_thread(
         self, channel_id: int, user_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Removes a member from a thread.
 
         Parameters
@@ -1042,13 +1249,13 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/channels/{channel_id}/thread-members/{user_id}"
         return await self._client._request("DELETE", path)
 
-    async def get_thread_member(self, channel_id: int, user_id: int) -> ClientResponse:
+    async def get_thread_member(self, channel_id: int, user_id: int) -> DiscordResponse:
         """Gets a thread member.
 
         Parameters
@@ -1060,13 +1267,13 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A thread member object.
         """
         path = f"/channels/{channel_id}/thread-members/{user_id}"
         return await self._client._request("GET", path)
 
-    async def get_thread_members(self, channel_id: int) -> ClientResponse:
+    async def get_thread_members(self, channel_id: int) -> DiscordResponse:
         """Gets all thread members.
 
         Parameters
@@ -1076,7 +1283,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of thread member objects.
         """
         path = f"/channels/{channel_id}/thread-members"
@@ -1087,7 +1294,7 @@ class ChannelPaths:
         channel_id: int,
         before: Optional[ISO8601_timestamp] = None,
         limit: int = 50,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Returns archived threads in the channel that are public.
 
         Parameters
@@ -1101,7 +1308,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of archived threads in the channel that are public.
         """
         path = f"/channels/{channel_id}/threads/archived/public"
@@ -1114,7 +1321,7 @@ class ChannelPaths:
 
     async def get_private_archived_threads(
         self, channel_id: int, before: Optional[ISO8601_timestamp] = None, limit=50
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Returns archived threads in the channel that are private.
 
         Parameters
@@ -1128,7 +1335,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of archived threads in the channel that are private.
         """
         path = f"/channels/{channel_id}/threads/archived/private"
@@ -1141,7 +1348,7 @@ class ChannelPaths:
 
     async def get_joined_private_archived_threads(
         self, channel_id: int, before: Optional[int] = None, limit: int = 50
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Returns archived joined threads in the channel that are private.
 
         Parameters
@@ -1155,7 +1362,7 @@ class ChannelPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of archived joined threads in the channel that are private.
         """
         path = f"/channels/{channel_id}/users/@me/threads/archived/private"
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -19,7 +19,7 @@ class EmojiPaths:
     def __init__(self, client: "DiscordClient"):
         self._client = client
 
-    async def get_guild_emojis(self, guild_id: int) -> ClientResponse:
+    async def get_guild_emojis(self, guild_id: int) -> DiscordResponse:
         """Gets all emojis in a guild.
 
         Parameters
@@ -29,13 +29,13 @@ class EmojiPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of emoji objects.
         """
         path = f"/guilds/{guild_id}/emojis"
         return await self._client._request("GET", path)
 
-    async def get_guild_emoji(self, guild_id: int, emoji_id: int) -> ClientResponse:
+    async def get_guild_emoji(self, guild_id: int, emoji_id: int) -> DiscordResponse:
         """Gets an emoji in a guild.
 
         Parameters
@@ -47,14 +47,14 @@ class EmojiPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An emoji object.
         """
         path = f"/guilds/{guild_id}/emojis/{emoji_id}"
         return await self._client._request("GET", path)
 
     """
-    async def create_guild_emoji(self, guild_id: int, name, image, *, roles = None, reason: str = None) -> ClientResponse:
+    async def create_guild_emoji(self, guild_id: int, name, image, *, roles = None, reason: str = None) -> DiscordResponse:
         payload = {
             'name': name,
             'image': image,
@@ -72,7 +72,7 @@ class EmojiPaths:
         name: Optional[str] = None,
         roles: Optional[List[int]] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edits a custom emoji.
 
         Parameters
@@ -90,7 +90,7 @@ class EmojiPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An emoji object.
         """
         path = f"/guilds/{guild_id}/emojis/{emoji_id}"
@@ -105,7 +105,7 @@ class EmojiPaths:
 
     async def delete_custom_emoji(
         self, guild_id: int, emoji_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Deletes a custom emoji.
 
         Parameters
@@ -119,7 +119,7 @@ class EmojiPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/emojis/{emoji_id}"
@@ -1,6 +1,19 @@
-from typing import TYPE_CHECKING, Any, List, TypeVar, Optional
-
-from aiohttp import ClientResponse
+import asyncio
+import json
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    List,
+    Tuple,
+    TypeVar,
+    Optional,
+)
+
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -10,6 +23,46 @@ if TYPE_CHECKING:
 ISO8601_timestamp = TypeVar("ISO8601_timestamp", str, bytes)
 
 
+def _load_checkpoint(
+    checkpoint: str, path: str, guild_id: int
+) -> Tuple[Optional[int], int, int]:
+    # The member ID to resume after, the position in the file, and the number of members written.
+    try:
+        with open(checkpoint, encoding="utf-8") as f:
+            state = json.load(f)
+        if state["guild_id"] == str(guild_id) and os.path.exists(path):
+            return state["after"], state["offset"], state["count"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None, 0, 0
+
+
+def _open_export(path: str, offset: int) -> BinaryIO:
+    f = open(path, "ab" if offset else "wb")
+    f.truncate(offset)  # Drop anything written after the checkpoint
+    return f
+
+
+def _write_page(
+    f: BinaryIO, page: List[Dict[str, Any]], checkpoint: str, state: Dict[str, Any]
+):
+    # Runs in a thread, as fsync can block for a while.
+    f.write(
+        b"".join(
+            json.dumps(member, separators=(",", ":")).encode() + b"\n"
+            for member in page
+        )
+    )
+    f.flush()
+    os.fsync(f.fileno())
+
+    state["offset"] = f.tell()
+    temp_path = f"{checkpoint}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as cf:
+        json.dump(state, cf)
+    os.replace(temp_path, checkpoint)
+
+
 class GuildPaths:
     """
     Parameters
@@ -33,7 +86,7 @@ class GuildPaths:
         afk_timeout: Optional[int] = None,
         system_channel_id: Optional[int] = None,
         system_channel_flags: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a new guild.
 
         Parameters
@@ -61,7 +114,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild object.
         """
         path = "/guilds"
@@ -91,7 +144,7 @@ class GuildPaths:
 
     async def get_guild(
         self, guild_id: int, with_counts: bool = True
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a guild by ID.
 
         Parameters
@@ -103,14 +156,14 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild object.
         """
         path = f"/guilds/{guild_id}"
         params = {"with_counts": with_counts}
         return await self._client._request("GET", path, params=params)
 
-    async def get_guild_preview(self, guild_id: int) -> ClientResponse:
+    async def get_guild_preview(self, guild_id: int) -> DiscordResponse:
         """Get a guild preview by ID.
 
         Parameters
@@ -120,7 +173,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild preview object.
         """
         path = f"/guilds/{guild_id}/preview"
@@ -128,7 +181,7 @@ class GuildPaths:
 
     async def edit_guild(
         self, guild_id: int, reason: Optional[str] = None, **options: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a guild.
 
         Parameters
@@ -142,7 +195,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild object.
         """
         path = f"/guilds/{guild_id}"
@@ -175,7 +228,7 @@ class GuildPaths:
             "PATCH", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def delete_guild(self, guild_id: int) -> ClientResponse:
+    async def delete_guild(self, guild_id: int) -> DiscordResponse:
         """Delete a guild.
 
         Parameters
@@ -185,13 +238,13 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}"
         return await self._client._request("DELETE", path)
 
-    async def get_guild_channels(self, guild_id: int) -> ClientResponse:
+    async def get_guild_channels(self, guild_id: int) -> DiscordResponse:
         """Get a guild's channels.
 
         Parameters
@@ -201,7 +254,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of guild channel objects.
         """
         path = f"/guilds/{guild_id}/channels"
@@ -209,7 +262,7 @@ class GuildPaths:
 
     async def create_channel(
         self, guild_id: int, name: str, *, reason: Optional[str] = None, **options: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a channel in a guild.
 
         Parameters
@@ -225,7 +278,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A channel object.
         """
         path = f"/guilds/{guild_id}/channels"
@@ -262,7 +315,7 @@ class GuildPaths:
         sync_permissions: bool,
         parent_id: int,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a channel's position in the channel list.
 
         Parameters
@@ -282,7 +335,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/channels"
@@ -298,7 +351,7 @@ class GuildPaths:
             "PATCH", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_active_threads(self, guild_id: int) -> ClientResponse:
+    async def get_active_threads(self, guild_id: int) -> DiscordResponse:
         """Get a guild's active threads.
 
         Parameters
@@ -308,13 +361,13 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of threads and members.
         """
         path = f"/guilds/{guild_id}/threads/active"
         return await self._client._request("GET", path)
 
-    async def get_member(self, guild_id: int, member_id: int) -> ClientResponse:
+    async def get_member(self, guild_id: int, member_id: int) -> DiscordResponse:
         """Get a member in a guild.
 
         Parameters
@@ -326,7 +379,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild member object.
         """
         path = f"/guilds/{guild_id}/members/{member_id}"
@@ -334,7 +387,7 @@ class GuildPaths:
 
     async def get_members(
         self, guild_id: int, limit: int = 1, after: Optional[int] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a list of members in a guild.
 
         Parameters
@@ -348,7 +401,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of guild member objects.
 
         Raises
@@ -369,9 +422,113 @@ class GuildPaths:
 
         return await self._client._request("GET", path, params=params)
 
+    async def iter_member_pages(
+        self, guild_id: int, after: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over the members of a guild, 1000 at a time.
+
+        Only one page is held in memory at a time.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild to get members from.
+        after : int, optional
+            Only get members with a higher user ID, by default None
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            Pages of up to 1000 guild member objects, in user ID order.
+        """
+        while True:
+            page = (await self.get_members(guild_id, 1000, after)).data or []
+            if page:
+                yield page
+                after = max(int(member["user"]["id"]) for member in page)
+            if len(page) < 1000:
+                return
+
+    async def iter_members(
+        self, guild_id: int, after: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the members of a guild, fetching 1000 at a time as they are needed.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild to get members from.
+        after : int, optional
+            Only get members with a higher user ID, by default None
+
+        Yields
+        ------
+        Dict[str, Any]
+            Guild member objects, in user ID order.
+        """
+        async for page in self.iter_member_pages(guild_id, after):
+            for member in page:
+                yield member
+
+    async def export_members(
+        self, guild_id: int, path: str, checkpoint: Optional[str] = None
+    ) -> int:
+        """Write the members of a guild to a file, one JSON object per line (NDJSON).
+
+        Members are written page by page as they are fetched. After every page the
+        file is flushed and the position reached is saved to ``checkpoint``, so
+        an export which was interrupted resumes from the last saved page when it
+        is run again (anything written after it is discarded). The checkpoint is
+        deleted once the export is complete. Files are written in a thread, so
+        other requests carry on while a page is synced to disk.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild to get members from.
+        path : str
+            The file to write to.
+        checkpoint : str, optional
+            The file the position is saved to, by default ``path`` + ".checkpoint"
+
+        Returns
+        -------
+        int
+            The number of members in the file.
+        """
+        if checkpoint is None:
+            checkpoint = f"{path}.checkpoint"
+
+        after, offset, count = await asyncio.to_thread(
+            _load_checkpoint, checkpoint, path, guild_id
+        )
+        f = await asyncio.to_thread(_open_export, path, offset)
+        write: Optional[asyncio.Future] = None
+        try:
+            async for page in self.iter_member_pages(guild_id, after):
+                after = max(int(member["user"]["id"]) for member in page)
+                count += len(page)
+                state = {"guild_id": str(guild_id), "after": after, "count": count}
+                write = asyncio.ensure_future(
+                    asyncio.to_thread(_write_page, f, page, checkpoint, state)
+                )
+                await asyncio.shield(write)
+        finally:
+            if write is not None and not write.done():
+                # A thread can't be interrupted, the file is closed once it is done.
+                write.add_done_callback(lambda _: f.close())
+            else:
+                f.close()
+
+        try:
+            await asyncio.to_thread(os.remove, checkpoint)
+        except FileNotFoundError:
+            pass
+        return count
+
     async def search_guild_members(
         self, guild_id: int, query: str, limit: int = 1
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Search for members in a guild.
 
         Parameters
@@ -385,7 +542,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of guild member objects.
 
         Raises
@@ -413,7 +570,7 @@ class GuildPaths:
         roles: Optional[List[int]] = None,
         mute: bool = False,
         deaf: bool = False,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Add a member to a guild.
 
         Parameters
@@ -435,7 +592,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/members/{user_id}"
@@ -460,7 +617,7 @@ class GuildPaths:
         channel_id: Optional[int] = None,
         timeout: Optional[ISO8601_timestamp] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Modify a member in a guild.
 
         Parameters
@@ -486,7 +643,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/members/{user_id}"
@@ -510,7 +667,7 @@ class GuildPaths:
 
     async def modify_current_member(
         self, guild_id: int, nick: str, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Modify the current user in a guild.
 
         Parameters
@@ -524,7 +681,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/members/@me"
@@ -535,7 +692,7 @@ class GuildPaths:
 
     async def add_role(
         self, guild_id: int, user_id: int, role_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Add a role to a member in a guild.
 
         Parameters
@@ -551,7 +708,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/members/{user_id}/roles/{role_id}"
@@ -561,7 +718,7 @@ class GuildPaths:
 
     async def remove_role(
         self, guild_id: int, user_id: int, role_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Remove a role from a member in a guild.
 
         Parameters
@@ -577,7 +734,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/members/{user_id}/roles/{role_id}"
@@ -587,7 +744,7 @@ class GuildPaths:
 
     async def kick(
         self, user_id: int, guild_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Kick a member from a guild.
 
         Parameters
@@ -601,7 +758,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/members/{user_id}"
@@ -615,7 +772,7 @@ class GuildPaths:
         limit: int = 1000,
         before: Optional[int] = None,
         after: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a list of all bans in a guild.
 
         Parameters
@@ -631,7 +788,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of ban objects.
         """
         path = f"/guilds/{guild_id}/bans"
@@ -645,7 +802,7 @@ class GuildPaths:
 
         return await self._client._request("GET", path, params=params)
 
-    async def get_ban(self, user_id: int, guild_id: int) -> ClientResponse:
+    async def get_ban(self, user_id: int, guild_id: int) -> DiscordResponse:
         """Get a ban from a guild.
 
         Parameters
@@ -657,7 +814,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A ban object.
         """
         path = f"/guilds/{guild_id}/bans/{user_id}"
@@ -669,7 +826,7 @@ class GuildPaths:
         guild_id: int,
         delete_message_days: int = 0,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Ban a user from a guild.
 
         Parameters
@@ -685,7 +842,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A ban object.
 
         Raises
@@ -708,7 +865,7 @@ class GuildPaths:
 
     async def unban(
         self, user_id: int, guild_id: int, *, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Unban a user from a guild.
 
         Parameters
@@ -722,7 +879,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/bans/{user_id}"
@@ -730,7 +887,7 @@ class GuildPaths:
             "DELETE", path, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_roles(self, guild_id: int) -> ClientResponse:
+    async def get_roles(self, guild_id: int) -> DiscordResponse:
         """Get a list of all roles in a guild.
 
         Parameters
@@ -740,7 +897,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of role objects.
         """
         path = f"/guilds/{guild_id}/roles"
@@ -756,7 +913,7 @@ class GuildPaths:
         unicode_emoji: Optional[str] = None,
         mentionable: Optional[bool] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a role in a guild.
 
         Parameters
@@ -780,7 +937,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A role object.
         """
         path = f"/guilds/{guild_id}/roles"
@@ -803,7 +960,7 @@ class GuildPaths:
 
     async def move_role_position(
         self, guild_id: int, role_id: int, position: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Move a role's position in a guild.
 
         Parameters
@@ -819,7 +976,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of role objects.
         """
         path = f"/guilds/{guild_id}/roles"
@@ -830,7 +987,7 @@ class GuildPaths:
 
     async def edit_role(
         self, guild_id: int, role_id: int, reason: Optional[str] = None, **fields: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a role in a guild.
 
         Parameters
@@ -846,7 +1003,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A role object.
         """
         path = f"/guilds/{guild_id}/roles/{role_id}"
@@ -865,7 +1022,7 @@ class GuildPaths:
 
     async def delete_role(
         self, guild_id: int, role_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a role from a guild.
 
         Parameters
@@ -879,7 +1036,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/roles/{role_id}"
@@ -889,7 +1046,7 @@ class GuildPaths:
 
     async def estimate_pruned_members(
         self, guild_id: int, days: int = 7, roles: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get the number of members that would be removed from a guild if prune was run.
 
         Parameters
@@ -903,7 +1060,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
 
         Raises
@@ -931,7 +1088,7 @@ class GuildPaths:
         compute_prune_count: bool = False,
         roles: Optional[List[int]] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Prune members from a guild.
 
         Parameters
@@ -949,7 +1106,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
 
         Raises
@@ -973,7 +1130,7 @@ class GuildPaths:
             "POST", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_voice_regions(self, guild_id: int) -> ClientResponse:
+    async def get_voice_regions(self, guild_id: int) -> DiscordResponse:
         """Get the voice regions for a guild.
 
         Parameters
@@ -983,13 +1140,13 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of voice region objects.
         """
         path = f"/guilds/{guild_id}/regions"
         return await self._client._request("GET", path)
 
-    async def get_guild_invites(self, guild_id: int) -> ClientResponse:
+    async def get_guild_invites(self, guild_id: int) -> DiscordResponse:
         """Get the invites for a guild.
 
         Parameters
@@ -999,13 +1156,13 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of invite objects.
         """
         path = f"/guilds/{guild_id}/invites"
         return await self._client._request("GET", path)
 
-    async def get_guild_integrations(self, guild_id: int) -> ClientResponse:
+    async def get_guild_integrations(self, guild_id: int) -> DiscordResponse:
         """Get the integrations for a guild.
 
         Parameters
@@ -1015,7 +1172,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of integration objects.
         """
         path = f"/guilds/{guild_id}/integrations"
@@ -1023,7 +1180,7 @@ class GuildPaths:
 
     async def create_integration(
         self, guild_id: int, type: Any, id: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create an integration for a guild.
 
         Parameters
@@ -1037,7 +1194,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/integrations"
@@ -1051,7 +1208,7 @@ class GuildPaths:
 
     async def edit_integration(
         self, guild_id: int, integration_id: int, **payload: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit an integration for a guild.
 
         Parameters
@@ -1065,7 +1222,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/integrations/{integration_id}"
@@ -1074,7 +1231,7 @@ class GuildPaths:
 
     async def sync_integration(
         self, guild_id: int, integration_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Sync an integration for a guild.
 
         Parameters
@@ -1086,7 +1243,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/integrations/{integration_id}/sync"
@@ -1095,7 +1252,7 @@ class GuildPaths:
 
     async def delete_guild_integration(
         self, guild_id: int, integration_id: int, *, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete an integration for a guild.
 
         Parameters
@@ -1109,7 +1266,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/integrations/{integration_id}"
@@ -1118,7 +1275,7 @@ class GuildPaths:
             "DELETE", path, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_guild_widget_settings(self, guild_id: int) -> ClientResponse:
+    async def get_guild_widget_settings(self, guild_id: int) -> DiscordResponse:
         """Get the widget settings for a guild.
 
         Parameters
@@ -1128,7 +1285,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild widget settings object.
         """
         path = f"/guilds/{guild_id}/widget"
@@ -1136,7 +1293,7 @@ class GuildPaths:
 
     async def edit_widget(
         self, guild_id: int, enabled, channel_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit the widget settings for a guild.
 
         Parameters
@@ -1152,7 +1309,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild widget settings object.
         """
         path = f"/guilds/{guild_id}/widget"
@@ -1164,7 +1321,7 @@ class GuildPaths:
             "PATCH", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_guild_widget(self, guild_id: int) -> ClientResponse:
+    async def get_guild_widget(self, guild_id: int) -> DiscordResponse:
         """Get the widget for a guild.
 
         Parameters
@@ -1174,13 +1331,13 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild widget object.
         """
         path = f"/guilds/{guild_id}/widget.json"
         return await self._client._request("GET", path)
 
-    async def get_vanity_code(self, guild_id: int) -> ClientResponse:
+    async def get_vanity_code(self, guild_id: int) -> DiscordResponse:
         """Get the vanity URL for a guild.
 
         Parameters
@@ -1190,7 +1347,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A partial invite object.
         """
         path = f"/guilds/{guild_id}/vanity-url"
@@ -1198,7 +1355,7 @@ class GuildPaths:
 
     async def change_vanity_code(
         self, guild_id: int, code, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Change the vanity URL for a guild.
 
         Parameters
@@ -1212,7 +1369,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/vanity-url"
@@ -1221,7 +1378,7 @@ class GuildPaths:
             "PATCH", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_guild_welcome_screen(self, guild_id: int) -> ClientResponse:
+    async def get_guild_welcome_screen(self, guild_id: int) -> DiscordResponse:
         """Get the welcome screen for a guild.
 
         Parameters
@@ -1231,7 +1388,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A welcome screen object.
         """
         path = f"/guilds/{guild_id}/welcome-screen"
@@ -1244,7 +1401,7 @@ class GuildPaths:
         welcome_channels: Optional[List[Any]] = None,
         description: Optional[str] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit the welcome screen for a guild.
 
         Parameters
@@ -1262,7 +1419,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A welcome screen object.
         """
         path = f"/guilds/{guild_id}/welcome-screen"
@@ -1283,7 +1440,7 @@ class GuildPaths:
         channel_id: int,
         suppress: Optional[bool] = None,
         request_to_speak_timestamp: Optional[ISO8601_timestamp] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit the voice state for a user.
 
         Parameters
@@ -1299,7 +1456,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/voice-states/@me"
@@ -1318,7 +1475,7 @@ class GuildPaths:
         user_id: int,
         channel_id: int,
         suppress: Optional[bool] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit the voice state for a user.
 
         Parameters
@@ -1334,7 +1491,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             _description_
         """
         path = f"/guilds/{guild_id}/voice-states/{user_id}"
@@ -1351,7 +1508,7 @@ class GuildPaths:
 
     async def get_scheduled_events(
         self, guild_id: int, with_user_count: bool
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get the scheduled events for a guild.
 
         Parameters
@@ -1363,7 +1520,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of guild scheduled event objects.
         """
         path = f"/guilds/{guild_id}/scheduled-events"
@@ -1372,7 +1529,7 @@ class GuildPaths:
 
     async def create_guild_scheduled_event(
         self, guild_id: int, reason: Optional[str] = None, **payload: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a scheduled event for a guild.
 
         Parameters
@@ -1386,7 +1543,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild scheduled event object.
         """
         path = f"/guilds/{guild_id}/scheduled-events"
@@ -1409,7 +1566,7 @@ class GuildPaths:
 
     async def get_scheduled_event(
         self, guild_id: int, guild_scheduled_event_id: int, with_user_count: bool
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a scheduled event for a guild.
 
         Parameters
@@ -1423,7 +1580,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild scheduled event object.
         """
         path = f"/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}"
@@ -1437,7 +1594,7 @@ class GuildPaths:
         *,
         reason: Optional[str] = None,
         **payload: Any,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a scheduled event for a guild.
 
         Parameters
@@ -1453,7 +1610,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild scheduled event object.
         """
         path = f"/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}"
@@ -1477,7 +1634,7 @@ class GuildPaths:
 
     async def delete_scheduled_event(
         self, guild_id: int, guild_scheduled_event_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a scheduled event for a guild.
 
         Parameters
@@ -1491,7 +1648,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}"
@@ -1507,7 +1664,7 @@ class GuildPaths:
         with_member: bool,
         before: Optional[int] = None,
         after: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get the users subscribed to a scheduled event.
 
         Parameters
@@ -1527,7 +1684,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of guild scheduled event user objects.
         """
         path = f"/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}/users"
@@ -1548,7 +1705,7 @@ class GuildPaths:
     Guild Template
     """
 
-    async def get_template(self, code: str) -> ClientResponse:
+    async def get_template(self, code: str) -> DiscordResponse:
         """Get a guild template.
 
         Parameters
@@ -1558,13 +1715,13 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild template object.
         """
         path = f"/guilds/templates/{code}"
         return await self._client._request("GET", path)
 
-    async def create_from_template(self, code: str, name: str) -> ClientResponse:
+    async def create_from_template(self, code: str, name: str) -> DiscordResponse:
         """Create a guild from a template.
 
         Parameters
@@ -1576,7 +1733,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild object.
         """
         path = f"/guilds/templates/{code}"
@@ -1585,7 +1742,7 @@ class GuildPaths:
         }
         return await self._client._request("POST", path, json=payload)
 
-    async def get_guild_templates(self, guild_id: int) -> ClientResponse:
+    async def get_guild_templates(self, guild_id: int) -> DiscordResponse:
         """Get a guild's templates.
 
         Parameters
@@ -1595,7 +1752,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of guild template objects.
         """
         path = f"/guilds/{guild_id}/templates"
@@ -1603,7 +1760,7 @@ class GuildPaths:
 
     async def create_template(
         self, guild_id: int, name: str, description: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a template for a guild.
 
         Parameters
@@ -1617,7 +1774,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild template object.
         """
         path = f"/guilds/{guild_id}/templates"
@@ -1628,7 +1785,7 @@ class GuildPaths:
             payload["description"] = description[:120]
         return await self._client._request("POST", path, json=payload)
 
-    async def sync_template(self, guild_id: int, code: str) -> ClientResponse:
+    async def sync_template(self, guild_id: int, code: str) -> DiscordResponse:
         """Sync a template for a guild.
 
         Parameters
@@ -1640,7 +1797,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild template object.
         """
         path = f"/guilds/{guild_id}/templates/{code}"
@@ -1648,7 +1805,7 @@ class GuildPaths:
 
     async def edit_template(
         self, guild_id: int, code: str, name: str, description: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a template for a guild.
 
         Parameters
@@ -1664,7 +1821,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild template object.
         """
         path = f"/guilds/{guild_id}/templates/{code}"
@@ -1675,7 +1832,7 @@ class GuildPaths:
             payload["description"] = description[:120]
         return await self._client._request("PATCH", path, json=payload)
 
-    async def delete_template(self, guild_id: int, code: str) -> ClientResponse:
+    async def delete_template(self, guild_id: int, code: str) -> DiscordResponse:
         """Delete a template for a guild.
 
         Parameters
@@ -1687,7 +1844,7 @@ class GuildPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild template object.
         """
         path = f"/guilds/{guild_id}/templates/{code}"
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any, List, Optional
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -25,7 +25,7 @@ class InteractionsPaths:
         interaction_token: str,
         type: int,
         data: Optional[dict] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create an interaction response.
 
         Parameters
@@ -41,7 +41,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/interactions/{interaction_id}/{interaction_token}/callback"
@@ -52,7 +52,7 @@ class InteractionsPaths:
 
     async def get_original_interaction_response(
         self, application_id: int, interaction_token: str
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get the original interaction response.
 
         Parameters
@@ -64,7 +64,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/webhooks/{application_id}/{interaction_token}/messages/@original"
@@ -78,7 +78,7 @@ class InteractionsPaths:
         embeds: Optional[List[dict]] = None,
         allowed_mentions: Any = None,
         components: Optional[List[Any]] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit the original interaction response.
 
         Parameters
@@ -98,7 +98,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object.
         """
         path = f"/webhooks/{application_id}/{interaction_token}/messages/@original"
@@ -114,7 +114,7 @@ class InteractionsPaths:
 
     async def delete_original_interaction_response(
         self, application_id: int, interaction_token: str
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete the original interaction response.
 
         Parameters
@@ -126,7 +126,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/webhooks/{application_id}/{interaction_token}/messages/@original"
@@ -141,7 +141,7 @@ class InteractionsPaths:
         embeds: Optional[List[dict]] = None,
         allowed_mentions: Any = None,
         components: Optional[List[Any]] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a followup message.
 
         Parameters
@@ -163,7 +163,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object.
         """
         path = f"/webhooks/{application_id}/{interaction_token}"
@@ -185,7 +185,7 @@ class InteractionsPaths:
 
     async def get_followup_message(
         self, application_id: int, interaction_token: str, message_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a followup message.
 
         Parameters
@@ -199,7 +199,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/webhooks/{application_id}/{interaction_token}/messages/{message_id}"
@@ -214,7 +214,7 @@ class InteractionsPaths:
         embeds: Optional[List[dict]] = None,
         allowed_mentions: Any = None,
         components: Optional[List[Any]] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a followup message.
 
         Parameters
@@ -236,7 +236,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object.
         """
         path = f"/webhooks/{application_id}/{interaction_token}/messages/{message_id}"
@@ -256,7 +256,7 @@ class InteractionsPaths:
         interaction_token: str,
         message_id: int,
         thread_id: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a followup message.
 
         Parameters
@@ -272,7 +272,7 @@ class InteractionsPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         payload = {}
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -26,7 +26,7 @@ class InvitePaths:
         with_counts: bool = True,
         with_expiration: bool = True,
         guild_scheduled_event_id: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get an invite.
 
         Parameters
@@ -42,7 +42,7 @@ class InvitePaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An invite object.
         """
         path = f"/invites/{invite_id}"
@@ -58,7 +58,7 @@ class InvitePaths:
 
     async def delete_invite(
         self, invite_id: str, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete an invite.
 
         Parameters
@@ -70,7 +70,7 @@ class InvitePaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An invite object.
         """
         path = f"/invites/{invite_id}"
@@ -1,4 +1,4 @@
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -93,51 +93,51 @@ class Paths:
             self._client
         )  #: WebhookPaths: The webhook paths.
 
-    async def list_voice_regions(self) -> ClientResponse:
+    async def list_voice_regions(self) -> DiscordResponse:
         """Get a list of voice regions.
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of voice region objects.
         """
         path = "/voice/regions"
         return await self._client._request("GET", path)
 
-    async def get_gateway(self) -> ClientResponse:
+    async def get_gateway(self) -> DiscordResponse:
         """Get the gateway URL.
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = "/gateway"
         return await self._client._request("GET", path, auth=False)
 
-    async def get_bot_gateway(self) -> ClientResponse:
+    async def get_bot_gateway(self) -> DiscordResponse:
         """Get the gateway URL for a bot.
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = "/gateway/bot"
         return await self._client._request("GET", path)
 
-    async def application_info(self) -> ClientResponse:
+    async def application_info(self) -> DiscordResponse:
         """Get the application info.
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             An application object.
         """
         path = "/oauth2/applications/@me"
         return await self._client._request("GET", path)
 
-    async def authorisation_info(self, bearer_token: str) -> ClientResponse:
+    async def authorisation_info(self, bearer_token: str) -> DiscordResponse:
         """Get the authorisation info.
 
         Parameters
@@ -147,7 +147,7 @@ class Paths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = "/oauth2/@me"
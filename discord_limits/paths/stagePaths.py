@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any, Optional
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -21,7 +21,7 @@ class StagePaths:
 
     async def create_stage_instance(
         self, *, reason: Optional[str] = None, **payload: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a stage instance.
 
         Parameters
@@ -33,7 +33,7 @@ class StagePaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A stage instance object.
         """
         path = "/stage-instances"
@@ -48,7 +48,7 @@ class StagePaths:
             "POST", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_stage_instance(self, channel_id: int) -> ClientResponse:
+    async def get_stage_instance(self, channel_id: int) -> DiscordResponse:
         """Get a stage instance.
 
         Parameters
@@ -58,7 +58,7 @@ class StagePaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A stage instance object.
         """
         path = f"/stage-instances/{channel_id}"
@@ -66,7 +66,7 @@ class StagePaths:
 
     async def edit_stage_instance(
         self, channel_id: int, *, reason: Optional[str] = None, **payload: Any
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a stage instance.
 
         Parameters
@@ -80,7 +80,7 @@ class StagePaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A stage instance object.
         """
         path = f"/stage-instances/{channel_id}"
@@ -96,7 +96,7 @@ class StagePaths:
 
     async def delete_stage_instance(
         self, channel_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a stage instance.
 
         Parameters
@@ -108,7 +108,7 @@ class StagePaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/stage-instances/{channel_id}"
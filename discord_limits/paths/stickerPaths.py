@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -19,7 +19,7 @@ class StickerPaths:
     def __init__(self, client: "DiscordClient"):
         self._client = client
 
-    async def get_sticker(self, sticker_id: int) -> ClientResponse:
+    async def get_sticker(self, sticker_id: int) -> DiscordResponse:
         """Get a sticker.
 
         Parameters
@@ -29,24 +29,24 @@ class StickerPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A sticker object.
         """
         path = f"/stickers/{sticker_id}"
         return await self._client._request("GET", path)
 
-    async def list_nitro_sticker_packs(self) -> ClientResponse:
+    async def list_nitro_sticker_packs(self) -> DiscordResponse:
         """List all nitro sticker packs.
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of sticker pack objects.
         """
         path = "/sticker-packs"
         return await self._client._request("GET", path)
 
-    async def list_guild_stickers(self, guild_id: int) -> ClientResponse:
+    async def list_guild_stickers(self, guild_id: int) -> DiscordResponse:
         """List all stickers in a guild.
 
         Parameters
@@ -56,13 +56,13 @@ class StickerPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of sticker objects.
         """
         path = f"/guilds/{guild_id}/stickers"
         return await self._client._request("GET", path)
 
-    async def get_guild_sticker(self, guild_id: int, sticker_id: int) -> ClientResponse:
+    async def get_guild_sticker(self, guild_id: int, sticker_id: int) -> DiscordResponse:
         """Get a sticker in a guild.
 
         Parameters
@@ -74,7 +74,7 @@ class StickerPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A sticker object.
         """
         path = f"/guilds/{guild_id}/stickers/{sticker_id}"
@@ -89,7 +89,7 @@ class StickerPaths:
         description: Optional[str] = None,
         tags: Optional[str] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Modify a sticker in a guild.
 
         Parameters
@@ -109,7 +109,7 @@ class StickerPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A sticker object.
         """
         path = f"/guilds/{guild_id}/stickers/{sticker_id}"
@@ -127,7 +127,7 @@ class StickerPaths:
 
     async def delete_guild_sticker(
         self, guild_id: int, sticker_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a sticker in a guild.
 
         Parameters
@@ -141,7 +141,7 @@ class StickerPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/guilds/{guild_id}/stickers/{sticker_id}"
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -19,18 +19,18 @@ class UserPaths:
     def __init__(self, client: "DiscordClient"):
         self._client = client
 
-    async def get_current_user(self) -> ClientResponse:
+    async def get_current_user(self) -> DiscordResponse:
         """Get the current user.
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A user object.
         """
         path = "/users/@me"
         return await self._client._request("GET", path)
 
-    async def get_user(self, user_id: int) -> ClientResponse:
+    async def get_user(self, user_id: int) -> DiscordResponse:
         """Get a user.
 
         Parameters
@@ -40,13 +40,13 @@ class UserPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A user object.
         """
         path = f"/users/{user_id}"
         return await self._client._request("GET", path)
 
-    async def edit_current_user(self, username: str) -> ClientResponse:
+    async def edit_current_user(self, username: str) -> DiscordResponse:
         """Edit the current user.
 
         Parameters
@@ -56,7 +56,7 @@ class UserPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A user object.
         """
         path = "/users/@me"
@@ -68,7 +68,7 @@ class UserPaths:
         limit: int = 200,
         before: Optional[int] = None,
         after: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get the current user's guilds.
 
         Parameters
@@ -82,7 +82,7 @@ class UserPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of partial guild objects.
 
         Raises
@@ -105,7 +105,7 @@ class UserPaths:
 
         return await self._client._request("GET", path, params=params)
 
-    async def get_current_user_guild_member(self, guild_id: int) -> ClientResponse:
+    async def get_current_user_guild_member(self, guild_id: int) -> DiscordResponse:
         """Get the current user's guild member.
 
         Parameters
@@ -115,13 +115,13 @@ class UserPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A guild member object.
         """
         path = f"/users/@me/guilds/{guild_id}/member"
         return await self._client._request("GET", path)
 
-    async def leave_guild(self, guild_id: int) -> ClientResponse:
+    async def leave_guild(self, guild_id: int) -> DiscordResponse:
         """Leave a guild.
 
         Parameters
@@ -131,13 +131,13 @@ class UserPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/users/@me/guilds/{guild_id}"
         return await self._client._request("DELETE", path)
 
-    async def create_DM(self, recipient_id: int) -> ClientResponse:
+    async def create_DM(self, recipient_id: int) -> DiscordResponse:
         """Open a DM.
 
         Parameters
@@ -147,7 +147,7 @@ class UserPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A DM channel object.
         """
         payload = {
@@ -159,7 +159,7 @@ class UserPaths:
 
     async def create_group_DM(
         self, access_tokens: List[str], nicks: Optional[dict[int, str]] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Open a group DM.
 
         Parameters
@@ -171,7 +171,7 @@ class UserPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A DM channel object.
         """
         payload = {
@@ -181,12 +181,12 @@ class UserPaths:
 
         return await self._client._request("POST", path, json=payload)
 
-    async def get_connections(self) -> ClientResponse:
+    async def get_connections(self) -> DiscordResponse:
         """Get the current user's connections.
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of connection objects.
         """
         path = "/users/@me/connections"
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any, List, Optional
 
-from aiohttp import ClientResponse
+from discord_limits.response import DiscordResponse
 
 from discord_limits.errors import *
 
@@ -21,7 +21,7 @@ class WebhookPaths:
 
     async def create_webhook(
         self, channel_id: int, name: str, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Create a webhook.
 
         Parameters
@@ -35,7 +35,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A webhook object.
         """
         path = f"/channels/{channel_id}/webhooks"
@@ -47,7 +47,7 @@ class WebhookPaths:
             "POST", path, json=payload, headers={"X-Audit-Log-Reason": reason}
         )
 
-    async def get_channel_webhooks(self, channel_id: int) -> ClientResponse:
+    async def get_channel_webhooks(self, channel_id: int) -> DiscordResponse:
         """Get a list of webhooks for a channel.
 
         Parameters
@@ -57,13 +57,13 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of webhook objects.
         """
         path = f"/channels/{channel_id}/webhooks"
         return await self._client._request("GET", path)
 
-    async def get_guild_webhooks(self, guild_id: int) -> ClientResponse:
+    async def get_guild_webhooks(self, guild_id: int) -> DiscordResponse:
         """Get a list of webhooks for a guild.
 
         Parameters
@@ -73,13 +73,13 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A list of webhook objects.
         """
         path = f"/guilds/{guild_id}/webhooks"
         return await self._client._request("GET", path)
 
-    async def get_webhook(self, webhook_id: int) -> ClientResponse:
+    async def get_webhook(self, webhook_id: int) -> DiscordResponse:
         """Get a webhook.
 
         Parameters
@@ -89,7 +89,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A webhook object.
         """
         path = f"/webhooks/{webhook_id}"
@@ -97,7 +97,7 @@ class WebhookPaths:
 
     async def get_webhook_with_token(
         self, webhook_id: int, webhook_token: str
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a webhook with a token.
 
         Parameters
@@ -109,7 +109,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A webhook object.
         """
         path = f"/webhooks/{webhook_id}/{webhook_token}"
@@ -121,7 +121,7 @@ class WebhookPaths:
         name: Optional[str] = None,
         channel_id: Optional[int] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a webhook.
 
         Parameters
@@ -137,7 +137,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A webhook object.
         """
         path = f"/webhooks/{webhook_id}"
@@ -157,7 +157,7 @@ class WebhookPaths:
         webhook_token: str,
         name: Optional[str] = None,
         reason: Optional[str] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a webhook with a token.
 
         Parameters
@@ -173,7 +173,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A webhook object.
         """
         path = f"/webhooks/{webhook_id}/{webhook_token}"
@@ -192,7 +192,7 @@ class WebhookPaths:
 
     async def delete_webhook(
         self, webhook_id: int, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a webhook.
 
         Parameters
@@ -204,7 +204,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/webhooks/{webhook_id}"
@@ -214,7 +214,7 @@ class WebhookPaths:
 
     async def delete_webhook_with_token(
         self, webhook_id: int, webhook_token: str, reason: Optional[str] = None
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a webhook with a token.
 
         Parameters
@@ -228,7 +228,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/webhooks/{webhook_id}/{webhook_token}"
@@ -249,7 +249,7 @@ class WebhookPaths:
         embeds: Optional[List[dict]] = None,
         allowed_mentions: Any = None,
         components: Optional[List[Any]] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Execute a webhook.
 
         Parameters
@@ -279,7 +279,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
 
         Raises
@@ -324,7 +324,7 @@ class WebhookPaths:
         webhook_token: str,
         message_id: int,
         thread_id: Optional[int] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Get a message from a webhook.
 
         Parameters
@@ -340,7 +340,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object.
         """
         path = f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
@@ -356,7 +356,7 @@ class WebhookPaths:
         embeds: Optional[List[dict]] = None,
         allowed_mentions: Any = None,
         components: Optional[List[Any]] = None,
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Edit a message from a webhook.
 
         Parameters
@@ -380,7 +380,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             A message object.
         """
         path = f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
@@ -395,7 +395,7 @@ class WebhookPaths:
 
     async def delete_webhook_message(
         self, webhook_id: int, webhook_token: str, message_id: int
-    ) -> ClientResponse:
+    ) -> DiscordResponse:
         """Delete a message from a webhook.
 
         Parameters
@@ -409,7 +409,7 @@ class WebhookPaths:
 
         Returns
         -------
-        ClientResponse
+        DiscordResponse
             The response from Discord.
         """
         path = f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
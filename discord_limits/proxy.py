@@ -0,0 +1,332 @@
+"""A local HTTP proxy which rate limits every request sent through it.
+
+Run it with ``python -m discord_limits.proxy`` and send Discord REST requests to
+it instead of ``https://discord.com``, e.g. ``http://127.0.0.1:8080/api/v10/users/@me``.
+Any number of processes (written in any language) can share the proxy. Rate
+limits are tracked per Authorization header, and every request is forwarded
+over a single pooled connection to Discord. Invalid requests are counted for
+the whole proxy (Cloudflare bans by IP address), and requests which would risk a
+ban are answered with a 503 without being forwarded. So are the requests with a
+token which was answered with repeated 401s, until it is checked again (see
+:class:`~discord_limits.rate_limits.InvalidRequestBudget`).
+
+Requests are sent highest priority first when they have to wait, the priority is
+read from the ``X-Discord-Limits-Priority`` header (an integer, 0 by default).
+A request with an ``X-Discord-Limits-Deadline`` header (in seconds) which can't
+be sent within that time is answered with a 504 without being forwarded. Neither
+header is forwarded.
+
+Request and response bodies are streamed. All headers except hop-by-hop ones
+are passed on, so headers such as X-Audit-Log-Reason are kept. Responses,
+including 429s, are returned to the caller unchanged.
+"""
+
+import argparse
+import re
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Optional
+
+from aiohttp import ClientSession, TCPConnector, web
+
+from .errors import CircuitOpen, DeadlineExceeded
+from .rate_limits import (
+    ClientRateLimits,
+    InvalidRequestBudget,
+    NamespacedBackend,
+    RateLimitBackend,
+    check_deadline,
+    get_route,
+    is_global_exempt,
+)
+
+DEFAULT_PORT = 8080
+
+# The header setting the priority of a request, see discord_limits.priority().
+PRIORITY_HEADER = "X-Discord-Limits-Priority"
+# The header setting how long (in seconds) a request may wait, see discord_limits.deadline().
+DEADLINE_HEADER = "X-Discord-Limits-Deadline"
+
+# Headers which only apply to a single connection, and are not forwarded.
+HOP_BY_HOP_HEADERS = frozenset(
+    (
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "host",
+        PRIORITY_HEADER.lower(),
+        DEADLINE_HEADER.lower(),
+    )
+)
+
+_API_PATH = re.compile(r"^/api(?:/v\d+)?(/.*)$")
+
+# How many of the least recently used tokens are checked for eviction when a token is added
+_EVICTION_CHECKS = 4
+
+
+class RateLimitProxy:
+    """A rate limiting proxy for the Discord REST API.
+
+    Parameters
+    ----------
+    upstream : str, optional
+        Where requests are forwarded to, by default "https://discord.com"
+    global_rate_limit : int, optional
+        The number of requests per second allowed by the global rate limit of each token, by default 50
+    rate_limit_backend : RateLimitBackend, optional
+        Where to store rate limit state shared with other proxies, by default None.
+        The state of every token is kept apart in it with a :class:`~discord_limits.rate_limits.NamespacedBackend`.
+    connection_limit : int, optional
+        The maximum number of simultaneous upstream connections (0 for no limit), by default 100
+    keepalive_timeout : float, optional
+        How long (in seconds) an idle upstream connection is kept open for reuse, by default 30
+    dns_cache_ttl : int, optional
+        How long (in seconds) resolved DNS entries are cached for, by default 300
+    invalid_request_budget : InvalidRequestBudget, optional
+        Tracks invalid requests to avoid a Cloudflare ban, by default a new InvalidRequestBudget
+    max_tokens : int, optional
+        The number of tokens above which the rate limits of idle tokens are dropped even if
+        they were used recently, by default 1000
+    token_idle_timeout : float, optional
+        How long (in seconds) the rate limits of an idle token are kept after it was last used, by default 300
+
+    Attributes
+    ----------
+    rate_limits : OrderedDict[str, ClientRateLimits]
+        The rate limits of every token in use, keyed by Authorization header, least recently used first.
+    invalid_requests : InvalidRequestBudget
+        The invalid request budget shared by every token.
+    """
+
+    def __init__(
+        self,
+        upstream: str = "https://discord.com",
+        global_rate_limit: int = 50,
+        rate_limit_backend: Optional[RateLimitBackend] = None,
+        connection_limit: int = 100,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
+        invalid_request_budget: Optional[InvalidRequestBudget] = None,
+        max_tokens: Optional[int] = 1000,
+        token_idle_timeout: float = 300,
+    ):
+        self.upstream = upstream.rstrip("/")
+        self.global_rate_limit = global_rate_limit
+        self.rate_limit_backend = rate_limit_backend
+        self.max_tokens = max_tokens
+        self.token_idle_timeout = token_idle_timeout
+        self.rate_limits: "OrderedDict[str, ClientRateLimits]" = OrderedDict()
+        self.invalid_requests = (
+            invalid_request_budget
+            if invalid_request_budget is not None
+            else InvalidRequestBudget()
+        )
+
+        self._connection_limit = connection_limit
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[ClientSession] = None
+
+    def _rate_limits_for(self, authorization: str) -> ClientRateLimits:
+        now = time.monotonic()
+        rate_limits = self.rate_limits.get(authorization)
+        if rate_limits is None:
+            backend = self.rate_limit_backend
+            if backend is not None:
+                # Every token has its own buckets and global rate limit in the
+                # shared backend, and the token itself isn't sent to it.
+                namespace = blake2b(authorization.encode(), digest_size=16).hexdigest()
+                backend = NamespacedBackend(backend, namespace)
+            rate_limits = ClientRateLimits(self.global_rate_limit, backend)
+            self._evict_tokens(now)
+            self.rate_limits[authorization] = rate_limits
+        else:
+            self.rate_limits.move_to_end(authorization)
+        rate_limits.last_used = now
+        return rate_limits
+
+    def _evict_tokens(self, now: float):
+        # Tokens are kept in least recently used order, so only the oldest few
+        # need to be checked each time a token is added.
+        for _ in range(_EVICTION_CHECKS):
+            if not self.rate_limits:
+                return
+            authorization, rate_limits = next(iter(self.rate_limits.items()))
+            if (
+                self.max_tokens is None or len(self.rate_limits) < self.max_tokens
+            ) and now - rate_limits.last_used < self.token_idle_timeout:
+                return
+            if rate_limits.is_idle(now):
+                del self.rate_limits[authorization]
+            else:
+                self.rate_limits.move_to_end(authorization)  # Still in use
+
+    async def _start(self, app: web.Application):
+        connector = TCPConnector(
+            limit=self._connection_limit,
+            keepalive_timeout=self._keepalive_timeout,
+            ttl_dns_cache=self._dns_cache_ttl,
+        )
+        # Bodies are passed on exactly as they are received, compressed or not.
+        self._session = ClientSession(connector=connector, auto_decompress=False)
+
+    async def _stop(self, app: web.Application):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        match = _API_PATH.match(request.path)
+        if match is None:
+            raise web.HTTPNotFound(text="Only /api paths are proxied.")
+
+        method = request.method
+        rate_limits = self._rate_limits_for(request.headers.get("Authorization", ""))
+        route, major = get_route(method, match.group(1))
+        try:
+            priority = int(request.headers.get(PRIORITY_HEADER, 0))
+            timeout = request.headers.get(DEADLINE_HEADER)
+            deadline = time.monotonic() + float(timeout) if timeout else None
+        except ValueError:
+            raise web.HTTPBadRequest(
+                text=f"{PRIORITY_HEADER} must be an integer and {DEADLINE_HEADER} a number."
+            )
+
+        try:
+            return await self._forward(
+                request, rate_limits, route, major, priority, deadline
+            )
+        except CircuitOpen as e:
+            raise web.HTTPServiceUnavailable(text=str(e))
+        except DeadlineExceeded as e:
+            raise web.HTTPGatewayTimeout(text=str(e))
+
+    async def _forward(
+        self,
+        request: web.Request,
+        rate_limits: ClientRateLimits,
+        route: str,
+        major: str,
+        priority: int,
+        deadline: Optional[float],
+    ) -> web.StreamResponse:
+        authorization = request.headers.get("Authorization")
+        await self.invalid_requests.acquire(
+            is_global_exempt(route), deadline, authorization
+        )
+        method = request.method
+        headers = {
+            k: v
+            for k, v in request.headers.items()
+            if k.lower() not in HOP_BY_HOP_HEADERS
+        }
+        data = request.content.iter_any() if request.body_exists else None
+
+        bucket_handler = await rate_limits.get_bucket_or_probe(route, major, deadline)
+        if bucket_handler is not None:
+            await bucket_handler.acquire(priority, deadline)
+        try:
+            await rate_limits.acquire_global(route, priority, deadline)
+            check_deadline(deadline)
+            sent_at = time.monotonic()
+            upstream = await self._session.request(  # type: ignore
+                method,
+                self.upstream + request.path_qs,
+                headers=headers,
+                data=data,
+                allow_redirects=False,
+            )
+            self.invalid_requests.record(
+                upstream.status,
+                upstream.headers.get("X-RateLimit-Scope"),
+                authorization,
+            )
+            bh = rate_limits.update_from_headers(
+                upstream.headers, route, major, bucket_handler, upstream.status
+            )
+            if upstream.status == 429:
+                rate_limits.rate_limited(upstream.headers, None, bh)
+            elif bucket_handler is not None:
+                bucket_handler.observe(time.monotonic() - sent_at)
+        finally:
+            # Released once the headers are in, a slow caller reading the body
+            # mustn't hold up the bucket.
+            if bucket_handler is not None:
+                bucket_handler.release()
+            else:
+                rate_limits.end_probe(route)
+
+        async with upstream:
+            response = web.StreamResponse(
+                status=upstream.status,
+                reason=upstream.reason,
+                headers={
+                    k: v
+                    for k, v in upstream.headers.items()
+                    if k.lower() not in HOP_BY_HOP_HEADERS
+                },
+            )
+            await response.prepare(request)
+            async for chunk in upstream.content.iter_any():
+                await response.write(chunk)
+            await response.write_eof()
+            return response
+
+    def make_app(self) -> web.Application:
+        """Create the aiohttp application serving the proxy.
+
+        Returns
+        -------
+        web.Application
+            The application, which can be run with ``aiohttp.web.run_app``.
+        """
+        app = web.Application(client_max_size=0)
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        app.on_startup.append(self._start)
+        app.on_cleanup.append(self._stop)
+        return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m discord_limits.proxy",
+        description="A rate limiting proxy for the Discord REST API.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="the host to listen on")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="the port to listen on"
+    )
+    parser.add_argument(
+        "--upstream",
+        default="https://discord.com",
+        help="where requests are forwarded to",
+    )
+    parser.add_argument(
+        "--global-rate-limit",
+        type=int,
+        default=50,
+        help="the global rate limit (requests per second) of each token",
+    )
+    parser.add_argument(
+        "--coordinator",
+        metavar="HOST:PORT",
+        help="share rate limits with other proxies through a coordinator service",
+    )
+    args = parser.parse_args()
+
+    backend = None
+    if args.coordinator is not None:
+        from .coordinator import NetworkBackend
+
+        host, _, port = args.coordinator.rpartition(":")
+        backend = NetworkBackend(host, int(port))
+
+    proxy = RateLimitProxy(args.upstream, args.global_rate_limit, backend)
+    web.run_app(proxy.make_app(), host=args.host, port=args.port)
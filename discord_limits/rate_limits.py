@@ -1,53 +1,1665 @@
 import asyncio
-import datetime
+import json
+import os
 import stat
-from typing import Dict, Optional
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from heapq import heappop, heappush
+from itertools import count
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 from aiohttp import ClientResponse
-from aiolimiter import AsyncLimiter
 from .errors import *
 
+# The top level resources whose ID (and token) are major parameters, with the
+# names used for them in route templates.
+MAJOR_PARAMETERS = {
+    "channels": ("{channel_id}",),
+    "guilds": ("{guild_id}",),
+    "webhooks": ("{webhook_id}", "{webhook_token}"),
+    "interactions": ("{interaction_id}", "{interaction_token}"),
+}
+
+# Non numeric path parameters, keyed by the segment that comes before them.
+NAMED_PARAMETERS = {
+    "reactions": "{emoji}",
+    "templates": "{code}",
+    "invites": "{code}",
+}
+
+
+def get_route(
+    method: str, path: str, metadata: Optional[str] = None
+) -> Tuple[str, str]:
+    """Split a request path into its route template and major parameters.
+
+    Discord shares rate limits between requests to the same route with the same
+    major parameters (channel_id, guild_id, webhook_id + webhook_token), so only
+    these are kept, every other parameter is replaced with a placeholder.
+
+    Parameters
+    ----------
+    method : str
+        The HTTP method of the request.
+    path : str
+        The path of the request, e.g. ``/channels/123/messages/456``.
+    metadata : str, optional
+        Extra information for routes which are split into several buckets, by default None
+
+    Returns
+    -------
+    Tuple[str, str]
+        The route template (e.g. ``GET /channels/{channel_id}/messages/{id}``) and
+        the major parameters (e.g. ``123``).
+    """
+    segments = path.split("/")
+    major = []
+
+    if len(segments) > 2 and segments[2].isdigit():
+        names = MAJOR_PARAMETERS.get(segments[1], ())
+        for i, name in enumerate(names, start=2):
+            if i < len(segments):
+                major.append(segments[i])
+                segments[i] = name
+
+    for i in range(2 + len(major), len(segments)):
+        segment = segments[i]
+        if segment.isdigit():
+            segments[i] = "{id}"
+        elif segments[i - 1] in NAMED_PARAMETERS:
+            segments[i] = NAMED_PARAMETERS[segments[i - 1]]
+
+    route = f"{method} {'/'.join(segments)}"
+    if metadata is not None:
+        route = f"{route}:{metadata}"
+    return route, ":".join(major)
+
+
+@lru_cache(maxsize=1024)
+def is_global_exempt(route: str) -> bool:
+    """Whether requests to the route are exempt from the global rate limit.
+
+    Interaction responses and webhook requests authenticated with a token do not
+    count towards the bot's global rate limit.
+
+    Parameters
+    ----------
+    route : str
+        The route template, as returned by :func:`get_route`.
+
+    Returns
+    -------
+    bool
+        True if the route is exempt from the global rate limit.
+    """
+    path = route.split(" ", 1)[1]
+    return path.startswith(("/interactions/", "/webhooks/{webhook_id}/{webhook_token}"))
+
+
+class RateLimitBackend:
+    """Where rate limit state is stored when it is shared with other clients.
+
+    By default every :class:`ClientRateLimits` keeps its state in memory. A
+    backend lets several clients using the same token (for example in different
+    processes) share their buckets and global rate limit.
+
+    Queries are coroutines, while notifications about responses are plain methods
+    so they can be called as soon as a response arrives.
+    """
+
+    async def reserve(self, key: str, limit: Optional[int] = None) -> float:
+        """Try to reserve a request in a bucket.
+
+        Parameters
+        ----------
+        key : str
+            The key of the bucket, see :attr:`BucketHandler.key`.
+        limit : int, optional
+            The bucket's limit if the client knows it (from another bucket with the
+            same hash, or a warm start), by default None. It is used as the limit of a
+            bucket the backend hasn't seen a response for yet.
+
+        Returns
+        -------
+        float
+            0 if the request was reserved, otherwise how long (in seconds) to wait
+            before trying again. If neither the backend nor the client knows the
+            limit, only one request (across every client) is let through until its
+            response sets it, or it is released without one, or :data:`PROBE_TIMEOUT`
+            seconds have passed.
+        """
+        raise NotImplementedError
+
+    def release(self, key: str) -> None:
+        """Mark a request reserved with :meth:`reserve` as answered.
+
+        Parameters
+        ----------
+        key : str
+            The key of the bucket, see :attr:`BucketHandler.key`.
+        """
+        raise NotImplementedError
+
+    def update(self, key: str, limit: int, remaining: int, reset_after: float) -> None:
+        """Update a bucket from the rate limit headers of a response.
+
+        Parameters
+        ----------
+        key : str
+            The key of the bucket, see :attr:`BucketHandler.key`.
+        limit : int
+            The value of the X-RateLimit-Limit header.
+        remaining : int
+            The value of the X-RateLimit-Remaining header.
+        reset_after : float
+            The value of the X-RateLimit-Reset-After header.
+        """
+        raise NotImplementedError
+
+    def lock(self, key: str, retry_after: float) -> None:
+        """Stop sending requests to a bucket after a 429.
+
+        Parameters
+        ----------
+        key : str
+            The key of the bucket, see :attr:`BucketHandler.key`.
+        retry_after : float
+            How long (in seconds) to stop for.
+        """
+        raise NotImplementedError
+
+    async def acquire_global(self, rate: int, key: str = "") -> float:
+        """Try to take a request from the global rate limit.
+
+        Parameters
+        ----------
+        rate : int
+            The number of requests per second allowed by the global rate limit.
+        key : str, optional
+            Which global rate limit, when the backend is shared by several tokens
+            (see :class:`NamespacedBackend`), by default ""
+
+        Returns
+        -------
+        float
+            0 if the request may be sent, otherwise how long (in seconds) to wait
+            before trying again.
+        """
+        raise NotImplementedError
+
+    def pause_global(self, retry_after: float, key: str = "") -> None:
+        """Stop sending requests which count towards the global rate limit.
+
+        Parameters
+        ----------
+        retry_after : float
+            How long (in seconds) to pause for.
+        key : str, optional
+            Which global rate limit, see :meth:`acquire_global`, by default ""
+        """
+        raise NotImplementedError
+
+
+class NamespacedBackend(RateLimitBackend):
+    """Keeps the rate limits of one token apart in a backend shared by several tokens.
+
+    Discord's buckets and global rate limit are per token, but the keys given to
+    a backend only identify a bucket. Wrapping the shared backend once per token
+    prefixes every key with the token's namespace.
+
+    Parameters
+    ----------
+    backend : RateLimitBackend
+        The shared backend.
+    namespace : str
+        Identifies the token, such as a hash of it (the token itself may be sent to
+        another service by the backend).
+
+    Example
+    -------
+    .. code:: py
+
+        backend = NetworkBackend("10.0.0.2")
+        client = DiscordClient(token, rate_limit_backend=NamespacedBackend(backend, "bot-a"))
+    """
+
+    def __init__(self, backend: RateLimitBackend, namespace: str):
+        self.backend = backend
+        self.namespace = namespace
+
+    def _global_key(self, key: str) -> str:
+        return f"{self.namespace}/{key}" if key else self.namespace
+
+    async def reserve(self, key: str, limit: Optional[int] = None) -> float:
+        return await self.backend.reserve(f"{self.namespace}/{key}", limit)
+
+    def release(self, key: str) -> None:
+        self.backend.release(f"{self.namespace}/{key}")
+
+    def update(self, key: str, limit: int, remaining: int, reset_after: float) -> None:
+        self.backend.update(f"{self.namespace}/{key}", limit, remaining, reset_after)
+
+    def lock(self, key: str, retry_after: float) -> None:
+        self.backend.lock(f"{self.namespace}/{key}", retry_after)
+
+    async def acquire_global(self, rate: int, key: str = "") -> float:
+        return await self.backend.acquire_global(rate, self._global_key(key))
+
+    def pause_global(self, retry_after: float, key: str = "") -> None:
+        self.backend.pause_global(retry_after, self._global_key(key))
+
+
+# How far (in seconds) past the previous reset a response from another node must
+# reset to be counted as part of a new window.
+STALE_RESPONSE_MARGIN = 0.1
+# How long (in seconds) a backend waits for the response to the only request sent
+# to a bucket with an unknown limit, before letting another request learn it.
+PROBE_TIMEOUT = 5
+# The remaining requests of a bucket whose limit is being learned by a request.
+_PROBING = -1
+
+
+class MemoryBackend(RateLimitBackend):
+    """A rate limit backend which keeps its state in memory.
+
+    It is used by the coordinator service (see :mod:`discord_limits.coordinator`)
+    to hold the state shared by every node connected to it. Buckets and global
+    rate limits which have reset and have not been used for a while are dropped
+    as new ones are created, a dropped one is recreated full.
+
+    Parameters
+    ----------
+    idle_timeout : float, optional
+        How long (in seconds) an idle bucket or global rate limit is kept after it
+        was last used, by default 300
+    """
+
+    def __init__(self, idle_timeout: float = 300):
+        self.idle_timeout = idle_timeout
+        # {key: [limit, remaining, reset_at, reset_at of the previous window, last_used]}
+        self.buckets: "OrderedDict[str, list]" = OrderedDict()
+        # {key: [tokens, refilled_at, paused_until, last_used]}
+        self.global_limits: "OrderedDict[str, list]" = OrderedDict()
+
+    def _get(self, entries: "OrderedDict[str, list]", key: str, new: list) -> list:
+        # Both kinds of entries are kept in least recently used order, with when
+        # they reset (or None) at index 2 and when they were last used last.
+        now = new[-1]
+        entry = entries.get(key)
+        if entry is None:
+            for _ in range(_EVICTION_CHECKS):
+                if not entries:
+                    break
+                oldest_key, oldest = next(iter(entries.items()))
+                if now - oldest[-1] < self.idle_timeout:
+                    break
+                if oldest[2] is None or now >= oldest[2]:
+                    del entries[oldest_key]
+                else:
+                    entries.move_to_end(oldest_key)  # Still waiting for a reset
+            entry = entries[key] = new
+        else:
+            entries.move_to_end(key)
+            entry[-1] = now
+        return entry
+
+    async def reserve(self, key: str, limit: Optional[int] = None) -> float:
+        now = time.monotonic()
+        bucket = self._get(self.buckets, key, [None, None, None, None, now])
+
+        if bucket[2] is not None and now >= bucket[2]:
+            if bucket[1] == _PROBING:
+                bucket[1], bucket[2] = None, None  # The probe was never answered
+            else:
+                bucket[1], bucket[2], bucket[3] = bucket[0], None, bucket[2]
+        if bucket[0] is None and limit is not None:
+            # Assume a bucket we haven't had a response for yet is full, apart
+            # from the request probing it.
+            bucket[0] = limit
+            if bucket[1] == _PROBING:
+                bucket[1], bucket[2] = limit - 1, None
+            elif bucket[1] is None:
+                bucket[1] = limit
+        if bucket[1] is None:
+            # Unknown limit, only one request is sent until its response sets it.
+            bucket[1], bucket[2] = _PROBING, now + PROBE_TIMEOUT
+            return 0
+        if bucket[1] > 0:
+            bucket[1] -= 1
+            return 0
+        if bucket[1] == _PROBING or bucket[2] is None:
+            return 0.05
+        return bucket[2] - now
+
+    def release(self, key: str) -> None:
+        bucket = self.buckets.get(key)
+        if bucket is not None and bucket[1] == _PROBING:
+            # The probe was answered without rate limit headers, the next request probes.
+            bucket[1], bucket[2] = None, None
+
+    def update(self, key: str, limit: int, remaining: int, reset_after: float) -> None:
+        now = time.monotonic()
+        reset_at = now + reset_after
+        new = [limit, remaining, reset_at, None, now]
+        bucket = self._get(self.buckets, key, new)
+        if bucket is new:
+            return
+
+        if bucket[2] is None:
+            # Responses can arrive late from other nodes, ignore those from the
+            # window which has already been refilled.
+            if bucket[3] is not None and reset_at < bucket[3] + STALE_RESPONSE_MARGIN:
+                return
+        if (bucket[2] is None or now < bucket[2]) and bucket[1] not in (None, _PROBING):
+            # Requests reserved by other clients are not yet counted by Discord.
+            remaining = min(remaining, bucket[1])
+        bucket[0], bucket[1], bucket[2] = limit, remaining, reset_at
+
+    def lock(self, key: str, retry_after: float) -> None:
+        now = time.monotonic()
+        bucket = self._get(self.buckets, key, [None, 0, None, None, now])
+        reset_at = now + retry_after
+        if bucket[1] == _PROBING:
+            bucket[2] = None  # Not a reset, but how long the probe may take
+        bucket[1] = 0
+        bucket[2] = reset_at if bucket[2] is None else max(bucket[2], reset_at)
+
+    async def acquire_global(self, rate: int, key: str = "") -> float:
+        now = time.monotonic()
+        global_limit = self._get(self.global_limits, key, [0.0, 0.0, 0.0, now])
+        if now < global_limit[2]:
+            return global_limit[2] - now
+
+        elapsed = now - global_limit[1]
+        global_limit[0] = min(float(rate), global_limit[0] + elapsed * rate)
+        global_limit[1] = now
+        if global_limit[0] >= 1:
+            global_limit[0] -= 1
+            return 0
+        return (1 - global_limit[0]) / rate
+
+    def pause_global(self, retry_after: float, key: str = "") -> None:
+        now = time.monotonic()
+        global_limit = self._get(self.global_limits, key, [0.0, 0.0, 0.0, now])
+        global_limit[2] = max(global_limit[2], now + retry_after)
+
+
+# The priority of the requests made in the current context, see priority().
+request_priority: ContextVar[int] = ContextVar("request_priority", default=0)
+
+# Waiting requests with this priority are sent before those with the default priority.
+HIGH_PRIORITY = 10
+# Waiting requests with this priority are sent after those with the default priority.
+LOW_PRIORITY = -10
+
+# Breaks ties between waiters with the same priority, so they are served in FIFO order.
+_waiter_order = count()
+
+
+@contextmanager
+def priority(level: int) -> Iterator[None]:
+    """Set the priority of every request made inside the block.
+
+    When requests have to wait, for their bucket or for the global rate limit,
+    those with a higher priority are sent first. The default priority is 0.
+
+    Parameters
+    ----------
+    level : int
+        The priority, such as :data:`HIGH_PRIORITY` or :data:`LOW_PRIORITY`.
+
+    Example
+    -------
+    .. code:: py
+
+        with priority(LOW_PRIORITY):
+            for member_id in member_ids:
+                await client.guild.add_role(guild_id, member_id, role_id)
+    """
+    token = request_priority.set(level)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+# When the requests made in the current context must be sent by (time.monotonic), see deadline().
+request_deadline: ContextVar[Optional[float]] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """Drop the requests made inside the block which can't be sent within ``timeout`` seconds.
+
+    A request which would have to wait past its deadline (for its bucket, the
+    global rate limit or a retry) raises
+    :class:`~discord_limits.errors.DeadlineExceeded` instead of being sent late.
+    Nested deadlines keep the earliest one.
+
+    Parameters
+    ----------
+    timeout : float
+        How long (in seconds) from now the requests must be sent by.
+
+    Example
+    -------
+    .. code:: py
+
+        # Interaction tokens expire 15 minutes after the interaction was received.
+        with deadline(15 * 60 - (time.time() - received_at)):
+            await client.interactions.create_followup_message(application_id, token, ...)
+    """
+    when = time.monotonic() + timeout
+    current = request_deadline.get()
+    token = request_deadline.set(when if current is None else min(current, when))
+    try:
+        yield
+    finally:
+        request_deadline.reset(token)
+
+
+def check_deadline(deadline: Optional[float], wait: float = 0):
+    """Raise DeadlineExceeded if a request waiting ``wait`` more seconds would miss its deadline.
+
+    Parameters
+    ----------
+    deadline : Optional[float]
+        When (time.monotonic) the request must be sent by, or None if it has no deadline.
+    wait : float, optional
+        How long (in seconds) the request still has to wait, by default 0
+
+    Raises
+    ------
+    DeadlineExceeded
+        The request would be sent after its deadline.
+    """
+    if deadline is not None and time.monotonic() + wait >= deadline:
+        raise DeadlineExceeded("The request could not be sent before its deadline.")
+
+
+async def _wait_until(awaitable: Any, deadline: Optional[float]) -> Any:
+    if deadline is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, deadline - time.monotonic())
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(
+            "The request could not be sent before its deadline."
+        ) from None
+
+
+class PriorityLimiter:
+    """A token bucket which lets waiting requests through highest priority first.
+
+    Parameters
+    ----------
+    rate : float
+        The number of requests allowed per period, which is also the largest burst.
+    period : float, optional
+        The length (in seconds) of the period, by default 1
+    """
+
+    def __init__(self, rate: float, period: float = 1):
+        self.max_rate = rate
+        self.period = period
+        self._rate_per_sec = rate / period
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []  # A heap
+        self._wake_handle: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_rate,
+            self._tokens + (now - self._last_refill) * self._rate_per_sec,
+        )
+        self._last_refill = now
+
+    async def acquire(self, priority: int = 0, deadline: Optional[float] = None):
+        """Wait until a request may be sent.
+
+        Parameters
+        ----------
+        priority : int, optional
+            Waiting requests with a higher priority are sent first, by default 0
+        deadline : float, optional
+            When (time.monotonic) the request must be sent by, by default None
+
+        Raises
+        ------
+        DeadlineExceeded
+            The request couldn't be let through before its deadline.
+        """
+        if not self._waiters:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heappush(self._waiters, (-priority, next(_waiter_order), waiter))
+        self._schedule_wake()
+        try:
+            await _wait_until(waiter, deadline)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The request was woken up as it was cancelled, pass its token on.
+                self._tokens += 1
+                self._wake()
+            raise
+
+    def _wake(self):
+        self._wake_handle = None
+        self._refill()
+        while self._waiters:
+            if self._waiters[0][2].done():
+                heappop(self._waiters)  # The waiter has been cancelled
+            elif self._tokens >= 1:
+                self._tokens -= 1
+                heappop(self._waiters)[2].set_result(None)
+            else:
+                break
+        self._schedule_wake()
+
+    def _schedule_wake(self):
+        if not self._waiters or self._wake_handle is not None:
+            return
+        delay = max((1 - self._tokens) / self._rate_per_sec, 0)
+        self._wake_handle = asyncio.get_running_loop().call_later(delay, self._wake)
+
+
+class ConcurrencyController:
+    """Adapts how many requests to a bucket are in flight at the same time (AIMD).
+
+    The limit starts at ``initial`` and doubles every round trip (slow start)
+    until the first back off. After that it grows by one per round trip while
+    latency is stable, and is multiplied by ``decrease`` on a 429 or when a
+    response takes more than ``latency_spike`` times the average latency. It
+    backs off at most once per round trip, as the requests in flight at the time
+    of a spike all report it.
+
+    Parameters
+    ----------
+    initial : int, optional
+        The limit of a new bucket, by default 1
+    minimum : int, optional
+        The lowest the limit goes, by default 1
+    maximum : int, optional
+        The highest the limit goes, by default 64
+    decrease : float, optional
+        What the limit is multiplied by when backing off, by default 0.5
+    latency_spike : float, optional
+        How many times the average latency a response must take to back off, by default 3
+    smoothing : float, optional
+        The weight of the latest response in the average latency, by default 0.1
+    """
+
+    __slots__ = (
+        "limit",
+        "minimum",
+        "maximum",
+        "decrease",
+        "latency_spike",
+        "smoothing",
+        "latency",
+        "slow_start",
+        "increases",
+        "decreases",
+        "_last_decrease",
+    )
+
+    def __init__(
+        self,
+        initial: int = 1,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease: float = 0.5,
+        latency_spike: float = 3,
+        smoothing: float = 0.1,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_spike = latency_spike
+        self.smoothing = smoothing
+        self.latency: Optional[float] = None  # Average latency (in seconds)
+        self.slow_start = True
+        self.increases = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+
+    @property
+    def concurrency(self) -> int:
+        """How many requests may be in flight at the same time."""
+        return int(self.limit)
+
+    def on_response(self, latency: float):
+        """Record how long (in seconds) a successful request took."""
+        if self.latency is None:
+            self.latency = latency
+        spike = latency > self.latency * self.latency_spike
+        # Spikes are averaged in too, so a lasting rise in latency becomes the new normal.
+        self.latency += self.smoothing * (latency - self.latency)
+        if spike:
+            self.back_off()
+        elif self.limit < self.maximum:
+            # Every response adds 1 in slow start, or 1 / limit (1 per round trip) after.
+            self.limit = min(
+                self.maximum, self.limit + (1 if self.slow_start else 1 / self.limit)
+            )
+            self.increases += 1
+
+    def back_off(self):
+        """Reduce the limit after a 429 or a latency spike."""
+        now = time.monotonic()
+        if self.latency is not None and now - self._last_decrease < self.latency:
+            return  # Already backed off for this round trip
+        self._last_decrease = now
+        self.slow_start = False
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        self.decreases += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the state of the controller.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The current concurrency, the average latency, whether it is in slow
+            start, and the number of increases and decreases.
+        """
+        return {
+            "concurrency": self.concurrency,
+            "latency": self.latency,
+            "slow_start": self.slow_start,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
 
 class BucketHandler:
+    """Schedules the requests made to a single rate limit bucket.
+
+    A request reserves one of the bucket's remaining requests before it is sent,
+    so concurrent requests can never send more than the bucket allows. Requests
+    that cannot be sent yet wait until the bucket resets, and are then sent
+    highest priority first (in FIFO order within a priority).
+    While the bucket's limit is unknown only one request is sent at a time.
+
+    When a :class:`ConcurrencyController` is given, the number of requests in
+    flight is also limited by it, see :meth:`observe`.
+
+    When a :class:`RateLimitBackend` is used, reservations are made through the
+    backend instead, and waiting requests take turns (in FIFO order) asking it for one.
+    The limit known locally is passed to the backend for buckets it hasn't seen yet,
+    and while neither knows it only one request is sent at a time.
+    """
+
     limit: Optional[int] = None  # The rate limit
-    remaining: Optional[int] = None  # Remaining requests
-    reset: Optional[datetime.datetime] = None  # When the rate limit resets
+    remaining: Optional[int] = None  # Remaining requests, minus those reserved
+    reset_at: Optional[float] = None  # When the rate limit resets (time.monotonic)
     retry_after: Optional[float] = None  # How long to wait before retrying the request
     bucket_hash: str = ""  # The bucket hash from Discord
-    lock: asyncio.Event = (
-        asyncio.Event()
-    )  # Used to lock the bucket if a rate limit is hit
+    major: str = ""  # The major parameters this bucket is for
+    in_flight: int = 0  # Requests that have been sent but not answered yet
+    last_used: float = 0  # When the bucket was last looked up (time.monotonic)
+
+    def __init__(
+        self,
+        bucket_hash: str = "",
+        major: str = "",
+        backend: Optional[RateLimitBackend] = None,
+        controller: Optional[ConcurrencyController] = None,
+    ):
+        self.bucket_hash = bucket_hash
+        self.major = major
+        self.backend = backend
+        self.controller = controller
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []  # A heap
+        self._wake_handle: Optional[asyncio.TimerHandle] = None
+        self._backend_lock = asyncio.Lock()
+        self._answered: Optional[asyncio.Future] = None  # Set by release()
+
+    @property
+    def key(self) -> str:
+        """The key of this bucket in :attr:`ClientRateLimits.buckets`."""
+        return f"{self.bucket_hash}:{self.major}"
+
+    def is_idle(self, now: float) -> bool:
+        """Whether the bucket is in the same state as a new one, and can be dropped.
+
+        Parameters
+        ----------
+        now : float
+            The current time.monotonic().
+
+        Returns
+        -------
+        bool
+            True if nothing is waiting for or using the bucket, and it has reset.
+        """
+        return (
+            not self.in_flight
+            and not self._waiters
+            and not self._backend_lock.locked()
+            and (self.reset_at is None or now >= self.reset_at)
+        )
+
+    def trigger_lock(self):
+        """Stop sending requests to the bucket for :attr:`retry_after` seconds."""
+        if self.backend is not None:
+            self.backend.lock(self.key, self.retry_after)  # type: ignore
+        self.remaining = 0
+        self.reset_at = time.monotonic() + self.retry_after  # type: ignore
+        if self.controller is not None:
+            self.controller.back_off()
+        self._schedule_wake()
+
+    def observe(self, latency: float):
+        """Record how long (in seconds) a request to the bucket took to be answered.
+
+        Parameters
+        ----------
+        latency : float
+            The time between sending the request and receiving the response.
+        """
+        if self.controller is not None:
+            self.controller.on_response(latency)
+
+    def update(self, limit: int, remaining: int, reset_after: float):
+        """Update the bucket from the rate limit headers of a response.
+
+        Parameters
+        ----------
+        limit : int
+            The value of the X-RateLimit-Limit header.
+        remaining : int
+            The value of the X-RateLimit-Remaining header.
+        reset_after : float
+            The value of the X-RateLimit-Reset-After header.
+        """
+        if self.backend is not None:
+            self.backend.update(self.key, limit, remaining, reset_after)
+        now = time.monotonic()
+        self.limit = limit
+        # Requests that have been reserved locally are not yet counted by Discord.
+        if (
+            self.remaining is None
+            or self.remaining > remaining
+            or (self.reset_at is not None and now >= self.reset_at)
+        ):
+            self.remaining = remaining
+        self.reset_at = now + reset_after
+        self._wake()
 
-    def __init__(self):
-        self.lock.set()
+    def _reserve(self) -> bool:
+        if self.reset_at is not None and time.monotonic() >= self.reset_at:
+            self.reset_at = None
+            if self.limit is not None:
+                self.remaining = self.limit - self.in_flight
 
-    async def trigger_lock(self):
-        self.lock.clear()
-        await asyncio.sleep(self.retry_after)  # type: ignore
-        self.lock.set()
+        if self.limit is None:
+            # Only send one request until Discord tells us the limit.
+            if self.in_flight:
+                return False
+        elif (
+            self.controller is not None
+            and self.in_flight >= self.controller.concurrency
+        ):
+            return False
+        elif self.remaining is not None:
+            if self.remaining > 0:
+                self.remaining -= 1
+            elif self.reset_at is not None or self.in_flight:
+                # Without a reset (the responses had no rate limit headers) the
+                # bucket never refills, so send one request at a time instead.
+                return False
+
+        self.in_flight += 1
+        return True
+
+    def _wake(self):
+        self._wake_handle = None
+        while self._waiters:
+            if self._waiters[0][2].done():
+                heappop(self._waiters)  # The waiter has been cancelled
+            elif self._reserve():
+                heappop(self._waiters)[2].set_result(None)
+            else:
+                break
+        self._schedule_wake()
+
+    def _schedule_wake(self):
+        if not self._waiters or self.reset_at is None:
+            return
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+        delay = max(self.reset_at - time.monotonic(), 0)
+        self._wake_handle = asyncio.get_running_loop().call_later(delay, self._wake)
+
+    async def acquire(self, priority: int = 0, deadline: Optional[float] = None):
+        """Wait until a request may be sent to the bucket.
+
+        Every call must be followed by a call to :meth:`release` once the request
+        has been answered. Using the bucket as an async context manager does both,
+        with the priority and deadline of the current context (see :func:`priority`
+        and :func:`deadline`).
+
+        Parameters
+        ----------
+        priority : int, optional
+            Waiting requests with a higher priority are sent first, by default 0
+        deadline : float, optional
+            When (time.monotonic) the request must be sent by, by default None
+
+        Raises
+        ------
+        DeadlineExceeded
+            The bucket won't reset before the request's deadline.
+        """
+        if self.backend is not None:
+            await _wait_until(self._backend_lock.acquire(), deadline)
+            try:
+                while self.limit is None and self.in_flight:
+                    # Only send one request until Discord tells us the limit.
+                    self._answered = asyncio.get_running_loop().create_future()
+                    await _wait_until(self._answered, deadline)
+                # The backend may be a network round trip away, which is bounded too.
+                while (
+                    to_wait := await _wait_until(
+                        self.backend.reserve(self.key, self.limit), deadline
+                    )
+                ) > 0:
+                    check_deadline(deadline, to_wait)
+                    await asyncio.sleep(to_wait)
+            finally:
+                self._backend_lock.release()
+            self.in_flight += 1
+            return
+
+        if not self._waiters and self._reserve():
+            return
+        if self.reset_at is not None and self.remaining == 0:
+            # Drop the request now instead of waiting for a reset that comes too late.
+            check_deadline(deadline, self.reset_at - time.monotonic())
+
+        waiter = asyncio.get_running_loop().create_future()
+        heappush(self._waiters, (-priority, next(_waiter_order), waiter))
+        self._schedule_wake()
+        try:
+            await _wait_until(waiter, deadline)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The request was woken up as it was cancelled, pass its place on.
+                self.in_flight -= 1
+                if self.remaining is not None:
+                    self.remaining += 1
+                self._wake()
+            raise
+
+    def release(self):
+        """Free the place taken by :meth:`acquire` once the request has been answered."""
+        self.in_flight -= 1
+        if self.backend is not None:
+            self.backend.release(self.key)
+            if self._answered is not None and not self._answered.done():
+                self._answered.set_result(None)
+        self._wake()
 
     async def __aenter__(self):
-        await self.lock.wait()
-        if self.remaining is not None and self.remaining == 0:
-            now = datetime.datetime.now(datetime.timezone.utc)
-            to_wait = (self.reset - now).total_seconds() + 1  # type: ignore
-            await asyncio.sleep(to_wait)
+        await self.acquire(request_priority.get(), request_deadline.get())
         return self
 
     async def __aexit__(self, *args):
-        pass
+        self.release()
+
+
+class InvalidRequestBudget:
+    """Tracks invalid requests to avoid a Cloudflare ban.
+
+    Discord bans an IP address for a while once it has sent 10,000 invalid
+    requests (401, 403 and 429 responses, except 429s with a shared scope) in 10
+    minutes. The number of invalid responses is counted over a sliding window,
+    and as it approaches the limit non-critical requests are first delayed, then
+    refused with :class:`~discord_limits.errors.CircuitOpen`.
+
+    After repeated 401 responses every request with the same token (Authorization
+    header) is refused, as it is no longer valid. Requests with other tokens are
+    unaffected. Once ``unauthorized_cooldown`` seconds have passed a single
+    request with the token is let through to check it again: the token is allowed
+    again if it isn't answered with a 401, otherwise it is refused for another
+    ``unauthorized_cooldown`` seconds.
+
+    The budget is per IP address, so clients in the same process should share an
+    instance.
+
+    Parameters
+    ----------
+    limit : int, optional
+        The number of invalid requests which gets the IP address banned, by default 10000
+    window : float, optional
+        The length (in seconds) of the window invalid requests are counted over, by default 600
+    delay_threshold : float, optional
+        The fraction of the limit from which non-critical requests are delayed, by default 0.5
+    shed_threshold : float, optional
+        The fraction of the limit from which non-critical requests are refused, by default 0.8
+    unauthorized_limit : int, optional
+        How many 401 responses in a row stop the requests with a token, by default 10
+    unauthorized_cooldown : float, optional
+        How long (in seconds) the requests with a token are stopped for before it is checked again, by default 60
+    max_tokens : int, optional
+        The maximum number of tokens whose 401 responses are tracked, the least
+        recently answered with a 401 are forgotten first, by default 1024
+    """
+
+    def __init__(
+        self,
+        limit: int = 10000,
+        window: float = 600,
+        delay_threshold: float = 0.5,
+        shed_threshold: float = 0.8,
+        unauthorized_limit: int = 10,
+        unauthorized_cooldown: float = 60,
+        max_tokens: int = 1024,
+    ):
+        self.limit = limit
+        self.window = window
+        self.delay_threshold = delay_threshold
+        self.shed_threshold = shed_threshold
+        self.unauthorized_limit = unauthorized_limit
+        self.unauthorized_cooldown = unauthorized_cooldown
+        self.max_tokens = max_tokens
+
+        # {Authorization: [401 responses in a row, when it may be checked again (time.monotonic)]}
+        self._unauthorized: "OrderedDict[Optional[str], list]" = OrderedDict()
+        self.totals: Dict[int, int] = {401: 0, 403: 0, 429: 0}  # {status: count}
+        self.delayed = 0  # Requests which have been delayed
+        self.shed = 0  # Requests which have been refused
+        self._seconds: Deque[list] = deque()  # [[second, invalid requests]]
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """The number of invalid requests in the current window."""
+        expired = time.monotonic() - self.window
+        while self._seconds and self._seconds[0][0] <= expired:
+            self._count -= self._seconds.popleft()[1]
+        return self._count
+
+    @property
+    def state(self) -> str:
+        """'shedding' or 'delaying' if non-critical requests are refused or
+        delayed, otherwise 'closed'."""
+        count = self.count
+        if count >= self.limit * self.shed_threshold:
+            return "shedding"
+        elif count >= self.limit * self.delay_threshold:
+            return "delaying"
+        return "closed"
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get the current state of the budget.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The number of invalid requests in the window, the limit, the state,
+            the total of each invalid status, the number of tokens refused after
+            repeated 401 responses, and the number of delayed and refused requests.
+        """
+        return {
+            "count": self.count,
+            "limit": self.limit,
+            "window": self.window,
+            "state": self.state,
+            "totals": dict(self.totals),
+            "open_circuits": sum(
+                streak >= self.unauthorized_limit
+                for streak, _ in self._unauthorized.values()
+            ),
+            "delayed": self.delayed,
+            "shed": self.shed,
+        }
+
+    def is_open(self, authorization: Optional[str]) -> bool:
+        """Whether the requests with a token are refused after repeated 401 responses.
+
+        Parameters
+        ----------
+        authorization : Optional[str]
+            The Authorization header of the requests.
+
+        Returns
+        -------
+        bool
+            True if the token's last ``unauthorized_limit`` responses were 401s.
+        """
+        entry = self._unauthorized.get(authorization)
+        return entry is not None and entry[0] >= self.unauthorized_limit
+
+    def forget(self, authorization: Optional[str]):
+        """Forget the 401 responses to a token, allowing its requests again.
+
+        Parameters
+        ----------
+        authorization : Optional[str]
+            The Authorization header of the requests.
+        """
+        self._unauthorized.pop(authorization, None)
+
+    def record(
+        self,
+        status: int,
+        scope: Optional[str] = None,
+        authorization: Optional[str] = None,
+    ):
+        """Record the status of a response.
+
+        Parameters
+        ----------
+        status : int
+            The status code of the response.
+        scope : str, optional
+            The X-RateLimit-Scope header of the response, by default None
+        authorization : str, optional
+            The Authorization header of the request, by default None
+        """
+        if status == 401:
+            entry = self._unauthorized.get(authorization)
+            if entry is None:
+                entry = self._unauthorized[authorization] = [0, 0.0]
+                if len(self._unauthorized) > self.max_tokens:
+                    self._unauthorized.popitem(last=False)
+            else:
+                self._unauthorized.move_to_end(authorization)
+            entry[0] += 1
+            if entry[0] >= self.unauthorized_limit:
+                entry[1] = time.monotonic() + self.unauthorized_cooldown
+        elif self._unauthorized:
+            # Any other response means the token is valid.
+            self._unauthorized.pop(authorization, None)
+
+        if status not in self.totals or (status == 429 and scope == "shared"):
+            return
+
+        self.totals[status] += 1
+        second = int(time.monotonic())
+        if self._seconds and self._seconds[-1][0] == second:
+            self._seconds[-1][1] += 1
+        else:
+            self._seconds.append([second, 1])
+        self._count += 1
+
+    def _until_below(self, threshold: float) -> float:
+        # How long until enough invalid requests leave the window.
+        count = self.count
+        for second, invalid in self._seconds:
+            count -= invalid
+            if count < threshold:
+                return max(second + self.window - time.monotonic(), 0.01)
+        return 0.01
+
+    async def acquire(
+        self,
+        critical: bool = False,
+        deadline: Optional[float] = None,
+        authorization: Optional[str] = None,
+    ):
+        """Wait until a request may be sent.
+
+        Parameters
+        ----------
+        critical : bool, optional
+            Whether the request is critical (such as an interaction response), and
+            is only refused if its token is refused, by default False
+        deadline : float, optional
+            When (time.monotonic) the request must be sent by, by default None
+        authorization : str, optional
+            The Authorization header of the request, by default None
+
+        Raises
+        ------
+        CircuitOpen
+            Too many invalid requests have been sent to send this request.
+        DeadlineExceeded
+            The request would be delayed past its deadline.
+        """
+        entry = self._unauthorized.get(authorization) if self._unauthorized else None
+        if entry is not None and entry[0] >= self.unauthorized_limit:
+            now = time.monotonic()
+            if now < entry[1]:
+                self.shed += 1
+                raise CircuitOpen(
+                    f"{entry[0]} unauthorized responses in a row, the token is checked "
+                    f"again in {entry[1] - now:.1f} seconds."
+                )
+            # Let this request check the token, and refuse the others until the
+            # next check in case it isn't answered.
+            entry[1] = now + self.unauthorized_cooldown
+        if critical:
+            return
+
+        if self.count >= self.limit * self.shed_threshold:
+            self.shed += 1
+            raise CircuitOpen(
+                f"{self._count} invalid requests in the last {self.window} seconds."
+            )
+
+        threshold = self.limit * self.delay_threshold
+        if self.count >= threshold:
+            self.delayed += 1
+            while self.count >= threshold:
+                to_wait = self._until_below(threshold)
+                check_deadline(deadline, to_wait)
+                await asyncio.sleep(to_wait)
+
+
+# How many of the oldest buckets are checked for eviction when a bucket is created
+_EVICTION_CHECKS = 4
+
+# The format of the files written by ClientRateLimits.save
+SNAPSHOT_VERSION = 1
 
 
 class ClientRateLimits:
-    buckets: Dict[str, BucketHandler] = dict()  # {bucket_hash: BucketHandler}
-    bucket_relations: Dict[str, str] = dict()  # {path: bucket_hash}
+    """The rate limit state of a single token.
+
+    Every :class:`DiscordClient` owns its own instance, so several tokens can be
+    used in the same process without sharing buckets.
 
-    def __init__(self):
-        self.global_limiter = AsyncLimiter(50, 1)  # 50 requests per second
+    A bucket is kept for every major parameter (channel, guild, webhook) used, so
+    buckets which have reset and have not been used for a while are dropped as
+    new ones are created. A dropped bucket is recreated full, which is the state
+    it was in anyway.
+
+    Parameters
+    ----------
+    global_rate_limit : int, optional
+        The number of requests per second allowed by the global rate limit, by default 50
+    backend : RateLimitBackend, optional
+        Where to store rate limit state shared with other clients, by default None
+    max_buckets : int, optional
+        The number of buckets above which idle buckets are dropped even if they were
+        used recently, by default None (no limit)
+    bucket_idle_timeout : float, optional
+        How long (in seconds) an idle bucket is kept after it was last used, by default 300
+    adaptive_concurrency : bool, optional
+        Whether the number of requests in flight to each bucket is adapted to its latency
+        and 429s by a :class:`ConcurrencyController` (not when a backend is used), by default True
+    """
+
+    buckets: "OrderedDict[str, BucketHandler]"  # {bucket_hash:major: BucketHandler}
+    bucket_relations: Dict[str, str]  # {route: bucket_hash}
+    bucket_limits: Dict[str, int]  # {bucket_hash: limit}
+    global_lock: asyncio.Event  # Cleared while the global rate limit has been hit
+    last_used: float = 0  # When the owner last used these rate limits (time.monotonic)
+
+    def __init__(
+        self,
+        global_rate_limit: int = 50,
+        backend: Optional[RateLimitBackend] = None,
+        max_buckets: Optional[int] = None,
+        bucket_idle_timeout: float = 300,
+        adaptive_concurrency: bool = True,
+    ):
+        self.backend = backend
+        self.adaptive_concurrency = adaptive_concurrency
+        self.global_rate_limit = global_rate_limit
+        self.max_buckets = max_buckets
+        self.bucket_idle_timeout = bucket_idle_timeout
+        self.buckets = OrderedDict()
+        self.bucket_relations = dict()
+        self.bucket_limits = dict()
+        self._hash_routes: Dict[str, Set[str]] = {}  # {bucket_hash: {route}}
+        self._hash_majors: Dict[str, Set[str]] = {}  # {bucket_hash: {major}}
+        self._probes: Dict[str, asyncio.Event] = {}  # {route: set once probed}
+        self._unbucketed: Set[str] = set()  # Routes answered without a bucket
+        self.global_limiter = PriorityLimiter(global_rate_limit)  # Requests per second
+        self.global_lock = asyncio.Event()
+        self.global_lock.set()
+        self._global_reset_at: float = 0
+        self._global_unlock_handle: Optional[asyncio.TimerHandle] = None
+
+    async def acquire_global(
+        self, route: str, priority: int = 0, deadline: Optional[float] = None
+    ):
+        """Wait until a request to the route may be sent under the global rate limit.
+
+        Parameters
+        ----------
+        route : str
+            The route template, as returned by :func:`get_route`.
+        priority : int, optional
+            Waiting requests with a higher priority are sent first, by default 0
+        deadline : float, optional
+            When (time.monotonic) the request must be sent by, by default None
+
+        Raises
+        ------
+        DeadlineExceeded
+            The request can't be sent under the global rate limit before its deadline.
+        """
+        if is_global_exempt(route):
+            return
+        if self.backend is not None:
+            rate = self.global_rate_limit
+            while (
+                to_wait := await _wait_until(
+                    self.backend.acquire_global(rate), deadline
+                )
+            ) > 0:
+                check_deadline(deadline, to_wait)
+                await asyncio.sleep(to_wait)
+            return
+        if not self.global_lock.is_set():
+            check_deadline(deadline, self._global_reset_at - time.monotonic())
+            await _wait_until(self.global_lock.wait(), deadline)
+        await self.global_limiter.acquire(priority, deadline)
+
+    def trigger_global_lock(self, retry_after: float):
+        """Stop sending requests which count towards the global rate limit.
+
+        Parameters
+        ----------
+        retry_after : float
+            How long (in seconds) to pause for.
+        """
+        if self.backend is not None:
+            self.backend.pause_global(retry_after)
+            return
+
+        reset_at = time.monotonic() + retry_after
+        if reset_at <= self._global_reset_at:
+            return
+
+        self._global_reset_at = reset_at
+        self.global_lock.clear()
+        if self._global_unlock_handle is not None:
+            self._global_unlock_handle.cancel()
+        self._global_unlock_handle = asyncio.get_running_loop().call_later(
+            retry_after, self.global_lock.set
+        )
+
+    def concurrency_limits(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state of the concurrency controller of every bucket.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            The :meth:`ConcurrencyController.stats` and number of requests in flight
+            of every bucket, keyed by bucket key ("bucket_hash:major").
+        """
+        return {
+            key: {
+                **bucket_handler.controller.stats(),
+                "in_flight": bucket_handler.in_flight,
+            }
+            for key, bucket_handler in self.buckets.items()
+            if bucket_handler.controller is not None
+        }
+
+    def is_idle(self, now: float) -> bool:
+        """Whether the rate limits are in the same state as new ones, apart from the learned buckets.
+
+        Parameters
+        ----------
+        now : float
+            The current time.monotonic().
+
+        Returns
+        -------
+        bool
+            True if nothing is waiting for or using a bucket or the global rate
+            limit, and the global rate limit hasn't been hit.
+        """
+        return (
+            not self._probes
+            and not self.global_limiter._waiters
+            and self.global_lock.is_set()
+            and all(
+                bucket_handler.is_idle(now) for bucket_handler in self.buckets.values()
+            )
+        )
+
+    def get_bucket(self, route: str, major: str) -> Optional[BucketHandler]:
+        """Get the bucket for a route, creating it if the route's bucket hash is known.
+
+        Parameters
+        ----------
+        route : str
+            The route template, as returned by :func:`get_route`.
+        major : str
+            The major parameters, as returned by :func:`get_route`.
+
+        Returns
+        -------
+        Optional[BucketHandler]
+            The bucket handler, or None if the route has not been seen before.
+        """
+        bucket_hash = self.bucket_relations.get(route)
+        if bucket_hash is None:
+            return None
+
+        key = f"{bucket_hash}:{major}"
+        now = time.monotonic()
+        bucket_handler = self.buckets.get(key)
+        if bucket_handler is None:
+            bucket_handler = BucketHandler(
+                bucket_hash,
+                major,
+                self.backend,
+                (
+                    ConcurrencyController()
+                    if self.adaptive_concurrency and self.backend is None
+                    else None
+                ),
+            )
+            # Assume a bucket we haven't used yet is full.
+            bucket_handler.limit = self.bucket_limits.get(bucket_hash)
+            bucket_handler.remaining = bucket_handler.limit
+            self._evict_buckets(now)
+            self.buckets[key] = bucket_handler
+            self._hash_majors.setdefault(bucket_hash, set()).add(major)
+        else:
+            self.buckets.move_to_end(key)
+        bucket_handler.last_used = now
+        return bucket_handler
+
+    def _drop_bucket(self, key: str):
+        bucket_handler = self.buckets.pop(key)
+        majors = self._hash_majors.get(bucket_handler.bucket_hash)
+        if majors is not None:
+            majors.discard(bucket_handler.major)
+            if not majors:
+                del self._hash_majors[bucket_handler.bucket_hash]
+
+    def _evict_buckets(self, now: float):
+        # Buckets are kept in least recently used order, so only the oldest few
+        # need to be checked each time a bucket is created.
+        for _ in range(_EVICTION_CHECKS):
+            if not self.buckets:
+                return
+            key, bucket_handler = next(iter(self.buckets.items()))
+            if (
+                self.max_buckets is None or len(self.buckets) < self.max_buckets
+            ) and now - bucket_handler.last_used < self.bucket_idle_timeout:
+                return
+            if bucket_handler.is_idle(now):
+                self._drop_bucket(key)
+            else:
+                self.buckets.move_to_end(key)  # Still in use
+
+    def evict_idle_buckets(self) -> int:
+        """Drop every idle bucket which hasn't been used for :attr:`bucket_idle_timeout` seconds.
+
+        Buckets are also dropped a few at a time as new ones are created, this
+        frees them all at once.
+
+        Returns
+        -------
+        int
+            The number of buckets dropped.
+        """
+        now = time.monotonic()
+        expired = [
+            key
+            for key, bucket_handler in self.buckets.items()
+            if bucket_handler.is_idle(now)
+            and now - bucket_handler.last_used >= self.bucket_idle_timeout
+        ]
+        for key in expired:
+            self._drop_bucket(key)
+        return len(expired)
+
+    def _relate(self, route: str, bucket_hash: str):
+        old_hash = self.bucket_relations.get(route)
+        if old_hash is not None:
+            self._hash_routes[old_hash].discard(route)
+        self._unbucketed.discard(route)
+        self.bucket_relations[route] = bucket_hash
+        self._hash_routes.setdefault(bucket_hash, set()).add(route)
+
+    async def get_bucket_or_probe(
+        self, route: str, major: str, deadline: Optional[float] = None
+    ) -> Optional[BucketHandler]:
+        """Get the bucket for a route, waiting for it to be learned if needed.
+
+        Only one request is let through to a route whose bucket is unknown. The
+        others wait until it has been answered and then use the learned bucket.
+        If None is returned the caller is that request, and must call
+        :meth:`end_probe` once it has been answered. Routes which were answered
+        without a bucket (such as /gateway) aren't probed, every request to them
+        gets None.
+
+        Parameters
+        ----------
+        route : str
+            The route template, as returned by :func:`get_route`.
+        major : str
+            The major parameters, as returned by :func:`get_route`.
+        deadline : float, optional
+            When (time.monotonic) the request must be sent by, by default None
+
+        Returns
+        -------
+        Optional[BucketHandler]
+            The bucket handler, or None if the request should probe the route.
+
+        Raises
+        ------
+        DeadlineExceeded
+            The route's bucket wasn't learned before the request's deadline.
+        """
+        while True:
+            bucket_handler = self.get_bucket(route, major)
+            if bucket_handler is not None:
+                return bucket_handler
+            if route in self._unbucketed:
+                return None
+
+            probe = self._probes.get(route)
+            if probe is None:
+                self._probes[route] = asyncio.Event()
+                return None
+            await _wait_until(probe.wait(), deadline)
+
+    def end_probe(self, route: str):
+        """Let the requests waiting for a route's bucket to be learned through.
+
+        If the bucket is still unknown the next waiting request probes the route.
+
+        Parameters
+        ----------
+        route : str
+            The route template, as returned by :func:`get_route`.
+        """
+        probe = self._probes.pop(route, None)
+        if probe is not None:
+            probe.set()
+
+    def update_from_headers(
+        self,
+        headers: Mapping[str, str],
+        route: str,
+        major: str,
+        bh: Optional[BucketHandler],
+        status: Optional[int] = None,
+    ) -> Optional[BucketHandler]:
+        """Update the rate limits from the headers of a response.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            The headers of the response.
+        route : str
+            The route template, as returned by :func:`get_route`.
+        major : str
+            The major parameters, as returned by :func:`get_route`.
+        bh : Optional[BucketHandler]
+            The bucket the request was sent in, or None if the route's bucket was unknown.
+        status : int, optional
+            The status of the response, by default None. Only a successful response
+            without a bucket marks the route as not rate limited per bucket, as error
+            pages (such as a 502 or a Cloudflare error) have no rate limit headers either.
+
+        Returns
+        -------
+        Optional[BucketHandler]
+            The bucket of the route, or None if the route is not rate limited per bucket.
+        """
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash is None:
+            # Some routes (such as /gateway) are not rate limited per bucket, so
+            # stop probing them. They are probed again if a bucket is returned.
+            if bh is None and status is not None and 300 > status >= 200:
+                self._unbucketed.add(route)
+            return bh
+
+        if bh is None:
+            self._relate(route, bucket_hash)
+            bh = self.get_bucket(route, major)
+        elif bh.bucket_hash != bucket_hash:
+            old_hash = bh.bucket_hash
+            bh.bucket_hash = bucket_hash
+            self.update_bucket_relations(old_hash, bucket_hash)
+
+        # X-RateLimit-Reset is not used, as it depends on our clock matching Discord's.
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            limit = int(headers["X-RateLimit-Limit"])
+            self.bucket_limits[bucket_hash] = limit
+            bh.update(  # type: ignore
+                limit, int(remaining), float(headers["X-RateLimit-Reset-After"])
+            )
+        return bh
+
+    def rate_limited(
+        self, headers: Mapping[str, str], data: Any, bh: Optional[BucketHandler]
+    ) -> Tuple[float, str]:
+        """Stop sending requests after a 429 response.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            The headers of the response.
+        data : Any
+            The decoded body of the response, or None if it hasn't been read.
+        bh : Optional[BucketHandler]
+            The bucket of the route, as returned by :meth:`update_from_headers`.
+
+        Returns
+        -------
+        Tuple[float, str]
+            How long (in seconds) to wait before retrying, and the scope of the
+            rate limit ('user', 'global' or 'shared').
+        """
+        data = data if isinstance(data, dict) else {}
+
+        retry_after = data.get("retry_after")
+        if retry_after is None:
+            retry_after = headers.get(
+                "Retry-After", headers.get("X-RateLimit-Reset-After", 1)
+            )
+        retry_after = float(retry_after)
+
+        if headers.get("X-RateLimit-Global") == "true" or data.get("global"):
+            scope = "global"
+            self.trigger_global_lock(retry_after)
+        else:
+            scope = headers.get("X-RateLimit-Scope", "user")
+            # A shared limit is hit by other users too, so leave our bucket alone,
+            # but send fewer requests to it at the same time.
+            if scope != "shared" and bh is not None:
+                bh.retry_after = retry_after
+                bh.trigger_lock()
+            elif bh is not None and bh.controller is not None:
+                bh.controller.back_off()
+
+        return retry_after, scope
 
     def update_bucket_relations(self, old_hash: str, new_hash: str):
-        for path, bucket_hash in self.bucket_relations.items():
-            if bucket_hash == old_hash:
-                self.bucket_relations[path] = new_hash
+        routes = self._hash_routes.pop(old_hash, set())
+        for route in routes:
+            self.bucket_relations[route] = new_hash
+        self._hash_routes.setdefault(new_hash, set()).update(routes)
+
+        majors = self._hash_majors.pop(old_hash, set())
+        for major in majors:
+            bucket_handler = self.buckets.pop(f"{old_hash}:{major}", None)
+            if bucket_handler is not None:
+                bucket_handler.bucket_hash = new_hash
+                self.buckets[bucket_handler.key] = bucket_handler
+        self._hash_majors.setdefault(new_hash, set()).update(majors)
+
+        if old_hash in self.bucket_limits:
+            self.bucket_limits.setdefault(new_hash, self.bucket_limits.pop(old_hash))
+
+    def save(self, path: str) -> None:
+        """Save the learned bucket of every route, and the limit of every bucket.
+
+        Reset times are not saved, as they will be out of date when the file is
+        loaded. The file is replaced atomically.
+
+        Parameters
+        ----------
+        path : str
+            The file to save to.
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "bucket_relations": self.bucket_relations,
+            "bucket_limits": self.bucket_limits,
+        }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    def load(self, path: str) -> bool:
+        """Load the buckets saved with :meth:`save`.
+
+        Buckets which have already been learned are kept.
+
+        Parameters
+        ----------
+        path : str
+            The file to load from.
+
+        Returns
+        -------
+        bool
+            Whether the file could be loaded.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != SNAPSHOT_VERSION
+        ):
+            return False
+        relations = snapshot.get("bucket_relations")
+        limits = snapshot.get("bucket_limits")
+        if (
+            not isinstance(relations, dict)
+            or not isinstance(limits, dict)
+            or not all(isinstance(h, str) for h in relations.values())
+            or not all(type(limit) is int for limit in limits.values())
+        ):
+            return False  # Valid JSON, but not written by save()
 
-        self.buckets[new_hash] = self.buckets.pop(old_hash)
+        for route, bucket_hash in relations.items():
+            if route not in self.bucket_relations:
+                self._relate(route, bucket_hash)
+        for bucket_hash, limit in limits.items():
+            self.bucket_limits.setdefault(bucket_hash, limit)
+        return True
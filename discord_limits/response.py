@@ -0,0 +1,84 @@
+from json import loads
+from typing import Any, Optional
+
+from multidict import CIMultiDictProxy
+
+
+class DiscordResponse:
+    """The decoded result of a request to Discord.
+
+    The body is read and decoded once while the connection is still open, so
+    the response can be used after the underlying connection has been returned
+    to the pool.
+
+    Parameters
+    ----------
+    status : int
+        The HTTP status code of the response.
+    headers : CIMultiDictProxy[str]
+        The headers of the response.
+    body : bytes
+        The raw body of the response.
+
+    Attributes
+    ----------
+    status : int
+        The HTTP status code of the response.
+    headers : CIMultiDictProxy[str]
+        The headers of the response.
+    body : bytes
+        The raw body of the response.
+    data : Any
+        The decoded JSON body, or None if the response has no JSON body.
+    """
+
+    __slots__ = ("status", "headers", "body", "data")
+
+    def __init__(self, status: int, headers: "CIMultiDictProxy[str]", body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.data: Any = None
+        if body and "application/json" in headers.get("Content-Type", ""):
+            self.data = loads(body)
+
+    def __repr__(self) -> str:
+        return f"<DiscordResponse status={self.status} bucket={self.bucket!r}>"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is a 2xx status code."""
+        return 300 > self.status >= 200
+
+    @property
+    def bucket(self) -> Optional[str]:
+        """The rate limit bucket hash returned by Discord."""
+        return self.headers.get("X-RateLimit-Bucket")
+
+    @property
+    def limit(self) -> Optional[int]:
+        """The number of requests that can be made in the bucket."""
+        limit = self.headers.get("X-RateLimit-Limit")
+        return int(limit) if limit is not None else None
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """The number of requests remaining in the bucket."""
+        remaining = self.headers.get("X-RateLimit-Remaining")
+        return int(remaining) if remaining is not None else None
+
+    @property
+    def reset_after(self) -> Optional[float]:
+        """How long (in seconds) until the bucket resets."""
+        reset_after = self.headers.get("X-RateLimit-Reset-After")
+        return float(reset_after) if reset_after is not None else None
+
+    def json(self) -> Any:
+        """Return the decoded JSON body.
+
+        Returns
+        -------
+        Any
+            The decoded JSON body, or None if the response has no JSON body.
+        """
+        return self.data
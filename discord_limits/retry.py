@@ -0,0 +1,179 @@
+import asyncio
+import random
+from typing import Dict, Optional
+
+from aiohttp import ClientConnectorError, ClientError
+
+from .errors import *
+
+# Methods which have the same effect however many times they are sent.
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+
+class RetryBudget:
+    """Limits retries to a fraction of all requests.
+
+    Every request deposits ``ratio`` tokens (up to ``capacity``) and every retry
+    withdraws one, so during an outage retries add at most ``ratio`` extra load
+    once the initial ``capacity`` tokens have been spent.
+
+    Parameters
+    ----------
+    ratio : float, optional
+        The number of retries allowed per request, by default 0.1
+    capacity : float, optional
+        The maximum number of retries which can be saved up, by default 10
+
+    Attributes
+    ----------
+    retries : int
+        The number of retries allowed.
+    exhausted : int
+        The number of retries refused as the budget was empty.
+    """
+
+    def __init__(self, ratio: float = 0.1, capacity: float = 10):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self):
+        """Record a new request."""
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget.
+
+        Returns
+        -------
+        bool
+            Whether there was a retry left.
+        """
+        if self.tokens < 1:
+            self.exhausted += 1
+            return False
+        self.tokens -= 1
+        self.retries += 1
+        return True
+
+
+class RetryPolicy:
+    """When and how requests which fail with a 5xx or network error are retried.
+
+    429 responses are always retried (up to ``max_attempts``) as their wait is
+    handled by the rate limits. Other failures are retried with capped
+    exponential backoff and full jitter, as long as the request is idempotent
+    and the retry budget isn't exhausted.
+
+    Parameters
+    ----------
+    max_attempts : int, optional
+        The maximum number of attempts to make a request, by default 3
+    backoff_base : float, optional
+        The maximum wait (in seconds) before the first retry, doubled for every following retry, by default 0.5
+    backoff_cap : float, optional
+        The maximum wait (in seconds) before any retry, by default 30
+    retry_statuses : frozenset, optional
+        The 5xx statuses which are retried, by default 500, 502, 503 and 504
+    retry_network_errors : bool, optional
+        Whether to retry connection errors and timeouts, by default True
+    retry_non_idempotent : bool, optional
+        Whether to retry POST and PATCH requests which may have reached Discord, by default False
+    budget : RetryBudget, optional
+        The retry budget shared by every route, by default a new RetryBudget
+    overrides : Dict[str, RetryPolicy], optional
+        Policies for specific routes, keyed by route template
+        (e.g. ``"POST /channels/{channel_id}/messages"``), by default None
+
+    Example
+    -------
+    .. code:: py
+
+        policy = RetryPolicy(
+            max_attempts=5,
+            overrides={
+                "PUT /channels/{channel_id}/messages/{id}/reactions/{emoji}/@me": RetryPolicy(max_attempts=2),
+            },
+        )
+        client = DiscordClient(token, retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30,
+        retry_statuses: frozenset = frozenset((500, 502, 503, 504)),
+        retry_network_errors: bool = True,
+        retry_non_idempotent: bool = False,
+        budget: Optional[RetryBudget] = None,
+        overrides: Optional[Dict[str, "RetryPolicy"]] = None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = retry_statuses
+        self.retry_network_errors = retry_network_errors
+        self.retry_non_idempotent = retry_non_idempotent
+        self.budget = budget if budget is not None else RetryBudget()
+        self.overrides = overrides or {}
+
+    def for_route(self, route: str) -> "RetryPolicy":
+        """Get the policy used for a route.
+
+        Parameters
+        ----------
+        route : str
+            The route template, as returned by :func:`~discord_limits.rate_limits.get_route`.
+
+        Returns
+        -------
+        RetryPolicy
+            The override for the route, or this policy.
+        """
+        return self.overrides.get(route, self)
+
+    def backoff(self, attempt: int) -> float:
+        """Get how long to wait before retrying.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of attempts made so far.
+
+        Returns
+        -------
+        float
+            A random wait (in seconds) between 0 and the capped exponential backoff.
+        """
+        return random.uniform(
+            0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        )
+
+    def is_retryable(self, method: str, error: Exception) -> bool:
+        """Whether a failed request can be retried.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request.
+        error : Exception
+            The error the request failed with.
+
+        Returns
+        -------
+        bool
+            Whether the error is retryable for this method.
+        """
+        if isinstance(error, ClientConnectorError):
+            # The connection failed, so the request never reached Discord.
+            return self.retry_network_errors
+        if not (self.retry_non_idempotent or method in IDEMPOTENT_METHODS):
+            return False
+        if isinstance(error, ServerError):
+            return error.status in self.retry_statuses
+        return self.retry_network_errors and isinstance(
+            error, (ClientError, asyncio.TimeoutError)
+        )
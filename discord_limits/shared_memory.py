@@ -0,0 +1,282 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from hashlib import blake2b
+from typing import Dict, Iterator, Optional
+
+from .rate_limits import PROBE_TIMEOUT, STALE_RESPONSE_MARGIN, RateLimitBackend
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# When the host booted (time.time() - time.monotonic()), every other time is a time.monotonic()
+_CLOCK = struct.Struct("<d")
+# global tokens, time of the last global refill, global pause end
+_HEADER = struct.Struct("<ddd")
+_HEADER_OFFSET = _CLOCK.size
+_SLOTS_OFFSET = _HEADER_OFFSET + _HEADER.size
+# key hash, limit (0 if unknown), remaining (_PROBING while the limit is being
+# learned), reset time (0 once refilled), previous reset time
+_SLOT = struct.Struct("<Qiidd")
+# The remaining requests of a bucket whose limit is being learned by a request
+_PROBING = -1
+# The global rate limits of other keys take a slot each: their key hash, then a _HEADER
+_GLOBAL_SLOT_OFFSET = 8
+# How many slots are probed for a key before the stalest one is reused
+_MAX_PROBES = 32
+# How far (in seconds) the boot time of a file can be from ours before it is
+# treated as written before a reboot, when its times are no longer valid.
+_BOOT_TOLERANCE = 60
+
+
+class SharedMemoryBackend(RateLimitBackend):
+    """A rate limit backend shared by every process on the same host.
+
+    The state of every bucket and of the global rate limit is kept in a memory
+    mapped file, so processes using the same token (and the same ``name``)
+    coordinate without a network hop. Each update holds an OS file lock for a
+    few microseconds. Times are stored as time.monotonic(), which is the same
+    for every process on the host, so changes to the system clock don't affect
+    the rate limits. The state is cleared if the file was written before a reboot.
+
+    Routes are learned by each process, so the first request a process sends to
+    a route it hasn't learned yet isn't counted by the others. Give every process
+    the same ``rate_limit_cache`` so they start with the routes already learned.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared state, every process using the same token should use the same name.
+    slots : int, optional
+        The maximum number of buckets that can be tracked at the same time, by default 4096
+    path : str, optional
+        The file to map, by default a file in /dev/shm (or the temp directory if it doesn't exist)
+    poll_interval : float, optional
+        How long (in seconds) to wait before asking again for a bucket with an unknown reset, by default 0.05
+
+    Example
+    -------
+    .. code:: py
+
+        backend = SharedMemoryBackend("my_bot")
+        client = DiscordClient(token, rate_limit_backend=backend)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slots: int = 4096,
+        path: Optional[str] = None,
+        poll_interval: float = 0.05,
+    ):
+        if path is None:
+            directory = (
+                "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+            )
+            path = os.path.join(directory, f"discord_limits_{name}")
+
+        self.path = path
+        self.slots = slots
+        self.poll_interval = poll_interval
+        self._size = _SLOTS_OFFSET + slots * _SLOT.size
+        self._key_hashes: Dict[str, int] = {}
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked():
+            if os.fstat(self._fd).st_size < self._size:
+                os.ftruncate(self._fd, self._size)  # New files are zero filled
+            self._mm = mmap.mmap(self._fd, self._size)
+            booted_at = time.time() - time.monotonic()
+            (file_booted_at,) = _CLOCK.unpack_from(self._mm, 0)
+            if abs(file_booted_at - booted_at) > _BOOT_TOLERANCE:
+                # A new file, or one whose monotonic times are from another boot.
+                self._mm[:] = bytes(self._size)
+                _CLOCK.pack_into(self._mm, 0, booted_at)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if sys.platform == "win32":
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _key_hash(self, key: str) -> int:
+        key_hash = self._key_hashes.get(key)
+        if key_hash is None:
+            digest = blake2b(key.encode(), digest_size=8).digest()
+            key_hash = int.from_bytes(digest, "little") or 1  # 0 marks an empty slot
+            self._key_hashes[key] = key_hash
+        return key_hash
+
+    def _find(self, key: str) -> int:
+        """Return the offset of the key's slot, claiming one if needed. Must be locked."""
+        key_hash = self._key_hash(key)
+        start = key_hash % self.slots
+        stalest_offset = -1
+        stalest_reset = float("inf")
+
+        for i in range(min(_MAX_PROBES, self.slots)):
+            offset = _SLOTS_OFFSET + ((start + i) % self.slots) * _SLOT.size
+            slot_hash, _, _, reset_at, _ = _SLOT.unpack_from(self._mm, offset)
+            if slot_hash == key_hash:
+                return offset
+            elif slot_hash == 0:
+                stalest_offset = offset
+                break
+            elif reset_at < stalest_reset:
+                stalest_offset, stalest_reset = offset, reset_at
+
+        _SLOT.pack_into(self._mm, stalest_offset, key_hash, 0, 0, 0.0, 0.0)
+        return stalest_offset
+
+    async def reserve(self, key: str, limit: Optional[int] = None) -> float:
+        with self._locked():
+            offset = self._find(key)
+            key_hash, known_limit, remaining, reset_at, previous_reset = (
+                _SLOT.unpack_from(self._mm, offset)
+            )
+            now = time.monotonic()
+
+            if reset_at and now >= reset_at:
+                if remaining == _PROBING:
+                    remaining, reset_at = 0, 0.0  # The probe was never answered
+                else:
+                    remaining, reset_at, previous_reset = known_limit, 0.0, reset_at
+            if known_limit == 0 and limit:
+                # Assume a bucket we haven't had a response for yet is full, apart
+                # from the request probing it.
+                if remaining == _PROBING:
+                    remaining, reset_at = limit - 1, 0.0
+                elif not reset_at:
+                    remaining = limit
+                known_limit = limit
+
+            wait = 0.0
+            if known_limit == 0 and remaining != _PROBING and not reset_at:
+                # Unknown limit, only one request is sent until its response sets it.
+                remaining, reset_at = _PROBING, now + PROBE_TIMEOUT
+            elif remaining > 0:
+                remaining -= 1
+            elif remaining == _PROBING or not reset_at:
+                wait = self.poll_interval
+            else:
+                wait = reset_at - now
+            _SLOT.pack_into(
+                self._mm,
+                offset,
+                key_hash,
+                known_limit,
+                remaining,
+                reset_at,
+                previous_reset,
+            )
+        return wait
+
+    def release(self, key: str) -> None:
+        with self._locked():
+            offset = self._find(key)
+            key_hash, limit, remaining, _, previous_reset = _SLOT.unpack_from(
+                self._mm, offset
+            )
+            if remaining == _PROBING:
+                # The probe was answered without rate limit headers, the next request probes.
+                _SLOT.pack_into(
+                    self._mm, offset, key_hash, limit, 0, 0.0, previous_reset
+                )
+
+    def update(self, key: str, limit: int, remaining: int, reset_after: float) -> None:
+        with self._locked():
+            offset = self._find(key)
+            key_hash, old_limit, old_remaining, reset_at, previous_reset = (
+                _SLOT.unpack_from(self._mm, offset)
+            )
+            now = time.monotonic()
+            new_reset_at = now + reset_after
+
+            if old_limit != 0 and reset_at == 0:
+                # Responses can arrive late from other processes, ignore those
+                # from the window which has already been refilled.
+                if new_reset_at < previous_reset + STALE_RESPONSE_MARGIN:
+                    return
+            if old_limit != 0 and (reset_at == 0 or now < reset_at):
+                # Requests reserved by other processes are not yet counted by Discord.
+                remaining = min(remaining, old_remaining)
+            _SLOT.pack_into(
+                self._mm,
+                offset,
+                key_hash,
+                limit,
+                remaining,
+                new_reset_at,
+                previous_reset,
+            )
+
+    def lock(self, key: str, retry_after: float) -> None:
+        with self._locked():
+            offset = self._find(key)
+            key_hash, limit, remaining, reset_at, previous_reset = _SLOT.unpack_from(
+                self._mm, offset
+            )
+            if remaining == _PROBING:
+                reset_at = 0.0  # Not a reset, but how long the probe may take
+            reset_at = max(reset_at, time.monotonic() + retry_after)
+            _SLOT.pack_into(
+                self._mm, offset, key_hash, limit, 0, reset_at, previous_reset
+            )
+
+    def _global_offset(self, key: str) -> int:
+        """Return the offset of a global rate limit's _HEADER. Must be locked."""
+        if not key:
+            return _HEADER_OFFSET
+        return self._find(f"global/{key}") + _GLOBAL_SLOT_OFFSET
+
+    async def acquire_global(self, rate: int, key: str = "") -> float:
+        with self._locked():
+            offset = self._global_offset(key)
+            tokens, last_refill, paused_until = _HEADER.unpack_from(self._mm, offset)
+            now = time.monotonic()
+            if now < paused_until:
+                return paused_until - now
+
+            tokens = min(float(rate), tokens + (now - last_refill) * rate)
+            if tokens >= 1:
+                _HEADER.pack_into(self._mm, offset, tokens - 1, now, paused_until)
+                return 0
+            _HEADER.pack_into(self._mm, offset, tokens, now, paused_until)
+
+        return (1 - tokens) / rate
+
+    def pause_global(self, retry_after: float, key: str = "") -> None:
+        with self._locked():
+            offset = self._global_offset(key)
+            tokens, last_refill, paused_until = _HEADER.unpack_from(self._mm, offset)
+            paused_until = max(paused_until, time.monotonic() + retry_after)
+            _HEADER.pack_into(self._mm, offset, tokens, last_refill, paused_until)
+
+    def close(self) -> None:
+        """Unmap the shared state. The file is left for the other processes."""
+        self._mm.close()
+        os.close(self._fd)
+
+    def unlink(self) -> None:
+        """Delete the file holding the shared state."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
@@ -13,6 +13,7 @@ setup(
     author="ninjafella",
     license="MIT",
     install_requires=["aiolimiter==1.1.0", "aiohttp==3.9.5"],
+    extras_require={"numpy": ["numpy"]},
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/ninjafella/discord-API-limits",